@@ -85,6 +85,28 @@ function deserialize_fontbakery_dashboard_FamilyRequest(buffer_arg) {
   return messages_pb.FamilyRequest.deserializeBinary(new Uint8Array(buffer_arg));
 }
 
+function serialize_fontbakery_dashboard_FileChunk(arg) {
+  if (!(arg instanceof shared_pb.FileChunk)) {
+    throw new Error('Expected argument of type fontbakery.dashboard.FileChunk');
+  }
+  return Buffer.from(arg.serializeBinary());
+}
+
+function deserialize_fontbakery_dashboard_FileChunk(buffer_arg) {
+  return shared_pb.FileChunk.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
+function serialize_fontbakery_dashboard_FilesMeta(arg) {
+  if (!(arg instanceof shared_pb.FilesMeta)) {
+    throw new Error('Expected argument of type fontbakery.dashboard.FilesMeta');
+  }
+  return Buffer.from(arg.serializeBinary());
+}
+
+function deserialize_fontbakery_dashboard_FilesMeta(buffer_arg) {
+  return shared_pb.FilesMeta.deserializeBinary(new Uint8Array(buffer_arg));
+}
+
 function serialize_fontbakery_dashboard_GitHubReport(arg) {
   if (!(arg instanceof messages_pb.GitHubReport)) {
     throw new Error('Expected argument of type fontbakery.dashboard.GitHubReport');
@@ -365,6 +387,58 @@ get: {
     responseSerialize: serialize_fontbakery_dashboard_StorageStatus,
     responseDeserialize: deserialize_fontbakery_dashboard_StorageStatus,
   },
+  // For a stored Files message: answers only the names and sizes
+// of the files, without their data.
+getFilesMeta: {
+    path: '/fontbakery.dashboard.Storage/GetFilesMeta',
+    requestStream: false,
+    responseStream: false,
+    requestType: messages_pb.StorageKey,
+    responseType: shared_pb.FilesMeta,
+    requestSerialize: serialize_fontbakery_dashboard_StorageKey,
+    requestDeserialize: deserialize_fontbakery_dashboard_StorageKey,
+    responseSerialize: serialize_fontbakery_dashboard_FilesMeta,
+    responseDeserialize: deserialize_fontbakery_dashboard_FilesMeta,
+  },
+  // Like Get for a stored Files message, but the files are streamed
+// in chunks. There's no limit for the size of Files this way.
+getFilesStream: {
+    path: '/fontbakery.dashboard.Storage/GetFilesStream',
+    requestStream: false,
+    responseStream: true,
+    requestType: messages_pb.StorageKey,
+    responseType: shared_pb.FileChunk,
+    requestSerialize: serialize_fontbakery_dashboard_StorageKey,
+    requestDeserialize: deserialize_fontbakery_dashboard_StorageKey,
+    responseSerialize: serialize_fontbakery_dashboard_FileChunk,
+    responseDeserialize: deserialize_fontbakery_dashboard_FileChunk,
+  },
+  // Like Put for one Files message, streamed in chunks.
+putFilesStream: {
+    path: '/fontbakery.dashboard.Storage/PutFilesStream',
+    requestStream: true,
+    responseStream: false,
+    requestType: shared_pb.FileChunk,
+    responseType: messages_pb.StorageKey,
+    requestSerialize: serialize_fontbakery_dashboard_FileChunk,
+    requestDeserialize: deserialize_fontbakery_dashboard_FileChunk,
+    responseSerialize: serialize_fontbakery_dashboard_StorageKey,
+    responseDeserialize: deserialize_fontbakery_dashboard_StorageKey,
+  },
+  // Like Put, but without sending the data again: if data with
+// StorageKey.hash is stored, the answer has a new key for it,
+// otherwise its key is empty and the client must Put the data.
+putExisting: {
+    path: '/fontbakery.dashboard.Storage/PutExisting',
+    requestStream: false,
+    responseStream: false,
+    requestType: messages_pb.StorageKey,
+    responseType: messages_pb.StorageKey,
+    requestSerialize: serialize_fontbakery_dashboard_StorageKey,
+    requestDeserialize: deserialize_fontbakery_dashboard_StorageKey,
+    responseSerialize: serialize_fontbakery_dashboard_StorageKey,
+    responseDeserialize: deserialize_fontbakery_dashboard_StorageKey,
+  },
 };
 
 exports.StorageClient = grpc.makeGenericClientConstructor(StorageService);
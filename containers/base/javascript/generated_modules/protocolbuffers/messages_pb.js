@@ -27,6 +27,7 @@ goog.exportSymbol('proto.fontbakery.dashboard.AuthorizedRoles', null, global);
 goog.exportSymbol('proto.fontbakery.dashboard.AuthorizedRolesRequest', null, global);
 goog.exportSymbol('proto.fontbakery.dashboard.CollectionFamilyJob', null, global);
 goog.exportSymbol('proto.fontbakery.dashboard.CompletedWorker', null, global);
+goog.exportSymbol('proto.fontbakery.dashboard.CompletedWorker.FinishedFamilyReportedCase', null, global);
 goog.exportSymbol('proto.fontbakery.dashboard.DispatcherInitProcess', null, global);
 goog.exportSymbol('proto.fontbakery.dashboard.FamilyData', null, global);
 goog.exportSymbol('proto.fontbakery.dashboard.FamilyData.Result', null, global);
@@ -791,7 +792,7 @@ if (goog.DEBUG && !COMPILED) {
  * @constructor
  */
 proto.fontbakery.dashboard.CompletedWorker = function(opt_data) {
-  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+  jspb.Message.initialize(this, opt_data, 0, -1, null, proto.fontbakery.dashboard.CompletedWorker.oneofGroups_);
 };
 goog.inherits(proto.fontbakery.dashboard.CompletedWorker, jspb.Message);
 if (goog.DEBUG && !COMPILED) {
@@ -8340,7 +8341,8 @@ proto.fontbakery.dashboard.WorkerJobDescription.prototype.toObject = function(op
 proto.fontbakery.dashboard.WorkerJobDescription.toObject = function(includeInstance, msg) {
   var f, obj = {
     workerName: jspb.Message.getFieldWithDefault(msg, 1, ""),
-    job: (f = msg.getJob()) && google_protobuf_any_pb.Any.toObject(includeInstance, f)
+    job: (f = msg.getJob()) && google_protobuf_any_pb.Any.toObject(includeInstance, f),
+    retries: jspb.Message.getFieldWithDefault(msg, 3, 0)
   };
 
   if (includeInstance) {
@@ -8386,6 +8388,10 @@ proto.fontbakery.dashboard.WorkerJobDescription.deserializeBinaryFromReader = fu
       reader.readMessage(value,google_protobuf_any_pb.Any.deserializeBinaryFromReader);
       msg.setJob(value);
       break;
+    case 3:
+      var value = /** @type {number} */ (reader.readInt32());
+      msg.setRetries(value);
+      break;
     default:
       reader.skipField();
       break;
@@ -8430,6 +8436,13 @@ proto.fontbakery.dashboard.WorkerJobDescription.serializeBinaryToWriter = functi
       google_protobuf_any_pb.Any.serializeBinaryToWriter
     );
   }
+  f = message.getRetries();
+  if (f !== 0) {
+    writer.writeInt32(
+      3,
+      f
+    );
+  }
 };
 
 
@@ -8488,6 +8501,49 @@ proto.fontbakery.dashboard.WorkerJobDescription.prototype.hasJob = function() {
 };
 
 
+/**
+ * optional int32 retries = 3;
+ * @return {number}
+ */
+proto.fontbakery.dashboard.WorkerJobDescription.prototype.getRetries = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 3, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.fontbakery.dashboard.WorkerJobDescription} returns this
+ */
+proto.fontbakery.dashboard.WorkerJobDescription.prototype.setRetries = function(value) {
+  return jspb.Message.setProto3IntField(this, 3, value);
+};
+
+
+
+/**
+ * Oneof group definitions for this message. Each group defines the field
+ * numbers belonging to that group. When of these fields' value is set, all
+ * other fields in the group are cleared. During deserialization, if multiple
+ * fields are encountered for a group, only the last value seen will be kept.
+ * @private {!Array<!Array<number>>}
+ * @const
+ */
+proto.fontbakery.dashboard.CompletedWorker.oneofGroups_ = [[3]];
+
+/**
+ * @enum {number}
+ */
+proto.fontbakery.dashboard.CompletedWorker.FinishedFamilyReportedCase = {
+  FINISHED_FAMILY_REPORTED_NOT_SET: 0,
+  FINISHED_FAMILY: 3
+};
+
+/**
+ * @return {proto.fontbakery.dashboard.CompletedWorker.FinishedFamilyReportedCase}
+ */
+proto.fontbakery.dashboard.CompletedWorker.prototype.getFinishedFamilyReportedCase = function() {
+  return /** @type {proto.fontbakery.dashboard.CompletedWorker.FinishedFamilyReportedCase} */(jspb.Message.computeOneofCase(this, proto.fontbakery.dashboard.CompletedWorker.oneofGroups_[0]));
+};
 
 
 
@@ -8521,7 +8577,8 @@ proto.fontbakery.dashboard.CompletedWorker.prototype.toObject = function(opt_inc
 proto.fontbakery.dashboard.CompletedWorker.toObject = function(includeInstance, msg) {
   var f, obj = {
     workerName: jspb.Message.getFieldWithDefault(msg, 1, ""),
-    completedMessage: (f = msg.getCompletedMessage()) && google_protobuf_any_pb.Any.toObject(includeInstance, f)
+    completedMessage: (f = msg.getCompletedMessage()) && google_protobuf_any_pb.Any.toObject(includeInstance, f),
+    finishedFamily: jspb.Message.getBooleanFieldWithDefault(msg, 3, false)
   };
 
   if (includeInstance) {
@@ -8567,6 +8624,10 @@ proto.fontbakery.dashboard.CompletedWorker.deserializeBinaryFromReader = functio
       reader.readMessage(value,google_protobuf_any_pb.Any.deserializeBinaryFromReader);
       msg.setCompletedMessage(value);
       break;
+    case 3:
+      var value = /** @type {boolean} */ (reader.readBool());
+      msg.setFinishedFamily(value);
+      break;
     default:
       reader.skipField();
       break;
@@ -8611,6 +8672,13 @@ proto.fontbakery.dashboard.CompletedWorker.serializeBinaryToWriter = function(me
       google_protobuf_any_pb.Any.serializeBinaryToWriter
     );
   }
+  f = /** @type {boolean} */ (jspb.Message.getField(message, 3));
+  if (f != null) {
+    writer.writeBool(
+      3,
+      f
+    );
+  }
 };
 
 
@@ -8669,6 +8737,42 @@ proto.fontbakery.dashboard.CompletedWorker.prototype.hasCompletedMessage = funct
 };
 
 
+/**
+ * optional bool finished_family = 3;
+ * @return {boolean}
+ */
+proto.fontbakery.dashboard.CompletedWorker.prototype.getFinishedFamily = function() {
+  return /** @type {boolean} */ (jspb.Message.getBooleanFieldWithDefault(this, 3, false));
+};
+
+
+/**
+ * @param {boolean} value
+ * @return {!proto.fontbakery.dashboard.CompletedWorker} returns this
+ */
+proto.fontbakery.dashboard.CompletedWorker.prototype.setFinishedFamily = function(value) {
+  return jspb.Message.setOneofField(this, 3, proto.fontbakery.dashboard.CompletedWorker.oneofGroups_[0], value);
+};
+
+
+/**
+ * Clears the field making it undefined.
+ * @return {!proto.fontbakery.dashboard.CompletedWorker} returns this
+ */
+proto.fontbakery.dashboard.CompletedWorker.prototype.clearFinishedFamily = function() {
+  return jspb.Message.setOneofField(this, 3, proto.fontbakery.dashboard.CompletedWorker.oneofGroups_[0], undefined);
+};
+
+
+/**
+ * Returns whether this field is set.
+ * @return {boolean}
+ */
+proto.fontbakery.dashboard.CompletedWorker.prototype.hasFinishedFamily = function() {
+  return jspb.Message.getField(this, 3) != null;
+};
+
+
 
 
 
@@ -13,7 +13,10 @@ var goog = jspb;
 var global = Function('return this')();
 
 goog.exportSymbol('proto.fontbakery.dashboard.File', null, global);
+goog.exportSymbol('proto.fontbakery.dashboard.FileChunk', null, global);
+goog.exportSymbol('proto.fontbakery.dashboard.FileMeta', null, global);
 goog.exportSymbol('proto.fontbakery.dashboard.Files', null, global);
+goog.exportSymbol('proto.fontbakery.dashboard.FilesMeta', null, global);
 /**
  * Generated by JsPbCodeGenerator.
  * @param {Array=} opt_data Optional initial data array, typically from a
@@ -56,6 +59,69 @@ if (goog.DEBUG && !COMPILED) {
    */
   proto.fontbakery.dashboard.Files.displayName = 'proto.fontbakery.dashboard.Files';
 }
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.fontbakery.dashboard.FileMeta = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.fontbakery.dashboard.FileMeta, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.fontbakery.dashboard.FileMeta.displayName = 'proto.fontbakery.dashboard.FileMeta';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.fontbakery.dashboard.FilesMeta = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, proto.fontbakery.dashboard.FilesMeta.repeatedFields_, null);
+};
+goog.inherits(proto.fontbakery.dashboard.FilesMeta, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.fontbakery.dashboard.FilesMeta.displayName = 'proto.fontbakery.dashboard.FilesMeta';
+}
+/**
+ * Generated by JsPbCodeGenerator.
+ * @param {Array=} opt_data Optional initial data array, typically from a
+ * server response, or constructed directly in Javascript. The array is used
+ * in place and becomes part of the constructed object. It is not cloned.
+ * If no data is provided, the constructed object will be empty, but still
+ * valid.
+ * @extends {jspb.Message}
+ * @constructor
+ */
+proto.fontbakery.dashboard.FileChunk = function(opt_data) {
+  jspb.Message.initialize(this, opt_data, 0, -1, null, null);
+};
+goog.inherits(proto.fontbakery.dashboard.FileChunk, jspb.Message);
+if (goog.DEBUG && !COMPILED) {
+  /**
+   * @public
+   * @override
+   */
+  proto.fontbakery.dashboard.FileChunk.displayName = 'proto.fontbakery.dashboard.FileChunk';
+}
 
 
 
@@ -400,4 +466,508 @@ proto.fontbakery.dashboard.Files.prototype.clearFilesList = function() {
 };
 
 
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.fontbakery.dashboard.FileMeta.prototype.toObject = function(opt_includeInstance) {
+  return proto.fontbakery.dashboard.FileMeta.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.fontbakery.dashboard.FileMeta} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.fontbakery.dashboard.FileMeta.toObject = function(includeInstance, msg) {
+  var f, obj = {
+    name: jspb.Message.getFieldWithDefault(msg, 1, ""),
+    size: jspb.Message.getFieldWithDefault(msg, 2, 0)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.fontbakery.dashboard.FileMeta}
+ */
+proto.fontbakery.dashboard.FileMeta.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.fontbakery.dashboard.FileMeta;
+  return proto.fontbakery.dashboard.FileMeta.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.fontbakery.dashboard.FileMeta} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.fontbakery.dashboard.FileMeta}
+ */
+proto.fontbakery.dashboard.FileMeta.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setName(value);
+      break;
+    case 2:
+      var value = /** @type {number} */ (reader.readUint64());
+      msg.setSize(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.fontbakery.dashboard.FileMeta.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.fontbakery.dashboard.FileMeta.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.fontbakery.dashboard.FileMeta} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.fontbakery.dashboard.FileMeta.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getName();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
+  f = message.getSize();
+  if (f !== 0) {
+    writer.writeUint64(
+      2,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional string name = 1;
+ * @return {string}
+ */
+proto.fontbakery.dashboard.FileMeta.prototype.getName = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.fontbakery.dashboard.FileMeta} returns this
+ */
+proto.fontbakery.dashboard.FileMeta.prototype.setName = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+/**
+ * optional uint64 size = 2;
+ * @return {number}
+ */
+proto.fontbakery.dashboard.FileMeta.prototype.getSize = function() {
+  return /** @type {number} */ (jspb.Message.getFieldWithDefault(this, 2, 0));
+};
+
+
+/**
+ * @param {number} value
+ * @return {!proto.fontbakery.dashboard.FileMeta} returns this
+ */
+proto.fontbakery.dashboard.FileMeta.prototype.setSize = function(value) {
+  return jspb.Message.setProto3IntField(this, 2, value);
+};
+
+
+
+/**
+ * List of repeated fields within this message type.
+ * @private {!Array<number>}
+ * @const
+ */
+proto.fontbakery.dashboard.FilesMeta.repeatedFields_ = [1];
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.fontbakery.dashboard.FilesMeta.prototype.toObject = function(opt_includeInstance) {
+  return proto.fontbakery.dashboard.FilesMeta.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.fontbakery.dashboard.FilesMeta} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.fontbakery.dashboard.FilesMeta.toObject = function(includeInstance, msg) {
+  var f, obj = {
+    filesList: jspb.Message.toObjectList(msg.getFilesList(),
+    proto.fontbakery.dashboard.FileMeta.toObject, includeInstance)
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.fontbakery.dashboard.FilesMeta}
+ */
+proto.fontbakery.dashboard.FilesMeta.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.fontbakery.dashboard.FilesMeta;
+  return proto.fontbakery.dashboard.FilesMeta.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.fontbakery.dashboard.FilesMeta} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.fontbakery.dashboard.FilesMeta}
+ */
+proto.fontbakery.dashboard.FilesMeta.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = new proto.fontbakery.dashboard.FileMeta;
+      reader.readMessage(value,proto.fontbakery.dashboard.FileMeta.deserializeBinaryFromReader);
+      msg.addFiles(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.fontbakery.dashboard.FilesMeta.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.fontbakery.dashboard.FilesMeta.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.fontbakery.dashboard.FilesMeta} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.fontbakery.dashboard.FilesMeta.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getFilesList();
+  if (f.length > 0) {
+    writer.writeRepeatedMessage(
+      1,
+      f,
+      proto.fontbakery.dashboard.FileMeta.serializeBinaryToWriter
+    );
+  }
+};
+
+
+/**
+ * repeated FileMeta files = 1;
+ * @return {!Array<!proto.fontbakery.dashboard.FileMeta>}
+ */
+proto.fontbakery.dashboard.FilesMeta.prototype.getFilesList = function() {
+  return /** @type{!Array<!proto.fontbakery.dashboard.FileMeta>} */ (
+    jspb.Message.getRepeatedWrapperField(this, proto.fontbakery.dashboard.FileMeta, 1));
+};
+
+
+/**
+ * @param {!Array<!proto.fontbakery.dashboard.FileMeta>} value
+ * @return {!proto.fontbakery.dashboard.FilesMeta} returns this
+*/
+proto.fontbakery.dashboard.FilesMeta.prototype.setFilesList = function(value) {
+  return jspb.Message.setRepeatedWrapperField(this, 1, value);
+};
+
+
+/**
+ * @param {!proto.fontbakery.dashboard.FileMeta=} opt_value
+ * @param {number=} opt_index
+ * @return {!proto.fontbakery.dashboard.FileMeta}
+ */
+proto.fontbakery.dashboard.FilesMeta.prototype.addFiles = function(opt_value, opt_index) {
+  return jspb.Message.addToRepeatedWrapperField(this, 1, opt_value, proto.fontbakery.dashboard.FileMeta, opt_index);
+};
+
+
+/**
+ * Clears the list making it empty but non-null.
+ * @return {!proto.fontbakery.dashboard.FilesMeta} returns this
+ */
+proto.fontbakery.dashboard.FilesMeta.prototype.clearFilesList = function() {
+  return this.setFilesList([]);
+};
+
+
+
+
+
+if (jspb.Message.GENERATE_TO_OBJECT) {
+/**
+ * Creates an object representation of this proto.
+ * Field names that are reserved in JavaScript and will be renamed to pb_name.
+ * Optional fields that are not set will be set to undefined.
+ * To access a reserved field use, foo.pb_<name>, eg, foo.pb_default.
+ * For the list of reserved names please see:
+ *     net/proto2/compiler/js/internal/generator.cc#kKeyword.
+ * @param {boolean=} opt_includeInstance Deprecated. whether to include the
+ *     JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @return {!Object}
+ */
+proto.fontbakery.dashboard.FileChunk.prototype.toObject = function(opt_includeInstance) {
+  return proto.fontbakery.dashboard.FileChunk.toObject(opt_includeInstance, this);
+};
+
+
+/**
+ * Static version of the {@see toObject} method.
+ * @param {boolean|undefined} includeInstance Deprecated. Whether to include
+ *     the JSPB instance for transitional soy proto support:
+ *     http://goto/soy-param-migration
+ * @param {!proto.fontbakery.dashboard.FileChunk} msg The msg instance to transform.
+ * @return {!Object}
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.fontbakery.dashboard.FileChunk.toObject = function(includeInstance, msg) {
+  var f, obj = {
+    name: jspb.Message.getFieldWithDefault(msg, 1, ""),
+    data: msg.getData_asB64()
+  };
+
+  if (includeInstance) {
+    obj.$jspbMessageInstance = msg;
+  }
+  return obj;
+};
+}
+
+
+/**
+ * Deserializes binary data (in protobuf wire format).
+ * @param {jspb.ByteSource} bytes The bytes to deserialize.
+ * @return {!proto.fontbakery.dashboard.FileChunk}
+ */
+proto.fontbakery.dashboard.FileChunk.deserializeBinary = function(bytes) {
+  var reader = new jspb.BinaryReader(bytes);
+  var msg = new proto.fontbakery.dashboard.FileChunk;
+  return proto.fontbakery.dashboard.FileChunk.deserializeBinaryFromReader(msg, reader);
+};
+
+
+/**
+ * Deserializes binary data (in protobuf wire format) from the
+ * given reader into the given message object.
+ * @param {!proto.fontbakery.dashboard.FileChunk} msg The message object to deserialize into.
+ * @param {!jspb.BinaryReader} reader The BinaryReader to use.
+ * @return {!proto.fontbakery.dashboard.FileChunk}
+ */
+proto.fontbakery.dashboard.FileChunk.deserializeBinaryFromReader = function(msg, reader) {
+  while (reader.nextField()) {
+    if (reader.isEndGroup()) {
+      break;
+    }
+    var field = reader.getFieldNumber();
+    switch (field) {
+    case 1:
+      var value = /** @type {string} */ (reader.readString());
+      msg.setName(value);
+      break;
+    case 2:
+      var value = /** @type {!Uint8Array} */ (reader.readBytes());
+      msg.setData(value);
+      break;
+    default:
+      reader.skipField();
+      break;
+    }
+  }
+  return msg;
+};
+
+
+/**
+ * Serializes the message to binary data (in protobuf wire format).
+ * @return {!Uint8Array}
+ */
+proto.fontbakery.dashboard.FileChunk.prototype.serializeBinary = function() {
+  var writer = new jspb.BinaryWriter();
+  proto.fontbakery.dashboard.FileChunk.serializeBinaryToWriter(this, writer);
+  return writer.getResultBuffer();
+};
+
+
+/**
+ * Serializes the given message to binary data (in protobuf wire
+ * format), writing to the given BinaryWriter.
+ * @param {!proto.fontbakery.dashboard.FileChunk} message
+ * @param {!jspb.BinaryWriter} writer
+ * @suppress {unusedLocalVariables} f is only used for nested messages
+ */
+proto.fontbakery.dashboard.FileChunk.serializeBinaryToWriter = function(message, writer) {
+  var f = undefined;
+  f = message.getName();
+  if (f.length > 0) {
+    writer.writeString(
+      1,
+      f
+    );
+  }
+  f = message.getData_asU8();
+  if (f.length > 0) {
+    writer.writeBytes(
+      2,
+      f
+    );
+  }
+};
+
+
+/**
+ * optional string name = 1;
+ * @return {string}
+ */
+proto.fontbakery.dashboard.FileChunk.prototype.getName = function() {
+  return /** @type {string} */ (jspb.Message.getFieldWithDefault(this, 1, ""));
+};
+
+
+/**
+ * @param {string} value
+ * @return {!proto.fontbakery.dashboard.FileChunk} returns this
+ */
+proto.fontbakery.dashboard.FileChunk.prototype.setName = function(value) {
+  return jspb.Message.setProto3StringField(this, 1, value);
+};
+
+
+/**
+ * optional bytes data = 2;
+ * @return {!(string|Uint8Array)}
+ */
+proto.fontbakery.dashboard.FileChunk.prototype.getData = function() {
+  return /** @type {!(string|Uint8Array)} */ (jspb.Message.getFieldWithDefault(this, 2, ""));
+};
+
+
+/**
+ * optional bytes data = 2;
+ * This is a type-conversion wrapper around `getData()`
+ * @return {string}
+ */
+proto.fontbakery.dashboard.FileChunk.prototype.getData_asB64 = function() {
+  return /** @type {string} */ (jspb.Message.bytesAsB64(
+      this.getData()));
+};
+
+
+/**
+ * optional bytes data = 2;
+ * Note that Uint8Array is not supported on all browsers.
+ * @see http://caniuse.com/Uint8Array
+ * This is a type-conversion wrapper around `getData()`
+ * @return {!Uint8Array}
+ */
+proto.fontbakery.dashboard.FileChunk.prototype.getData_asU8 = function() {
+  return /** @type {!Uint8Array} */ (jspb.Message.bytesAsU8(
+      this.getData()));
+};
+
+
+/**
+ * @param {!(string|Uint8Array)} value
+ * @return {!proto.fontbakery.dashboard.FileChunk} returns this
+ */
+proto.fontbakery.dashboard.FileChunk.prototype.setData = function(value) {
+  return jspb.Message.setProto3BytesField(this, 2, value);
+};
+
+
 goog.object.extend(exports, proto.fontbakery.dashboard);
@@ -56,8 +56,11 @@ _p.callInit = function(initMessage) {
  *
  * If it's not finished, finishedMessage should be null.
  * If it's finished, but there's not really a finishedMessage use pb Empty
+ *
+ * completedWorker is the CompletedWorker message that contained
+ * completedMessage.
  */
-_p.registerCompleted = function(completedMessage) {
+_p.registerCompleted = function(completedMessage, completedWorker) {
     // jshint unused:vars
     throw new Error('registerCompleted is not implemented');
 };
@@ -65,6 +68,15 @@ _p.registerCompleted = function(completedMessage) {
 return WorkerDefinition;
 })();
 
+/**
+ * Each worker type has its own queue, so that e.g. long running
+ * diffbrowsers jobs don't hold back the fontbakery_checker jobs.
+ * Same as `worker_queue_name` in worker-launcher.py.
+ */
+function workerQueueName(workerName) {
+    return 'fontbakery-worker-' + workerName;
+}
+
 /**
  * The job of this service is to init and clean up jobs done by
  * the workers.
@@ -190,8 +202,10 @@ _p._callInitWorker = function(workerName, initMessage) {
  * If it's not finished, finishedMessage should be null.
  * If it's finished, but there's not really a finishedMessage use pb Empty
  */
-_p._registerCompletedWorker = function(workerName, completedMessage) {
-    return this._callWorkerAPI(workerName, 'registerCompleted', completedMessage);
+_p._registerCompletedWorker = function(workerName, completedMessage
+                                                    , completedWorker) {
+    return this._callWorkerAPI(workerName, 'registerCompleted'
+                                    , completedMessage, completedWorker);
 };
 
 _p._keepProcessCommand = function(workerName, id, processCommand) {
@@ -310,7 +324,8 @@ _p._consumeQueue = function(message) {
         return;
     }
     // _consumeQueueFontBakery
-    return this._registerCompletedWorker(workerName, completedMessage)
+    return this._registerCompletedWorker(workerName, completedMessage
+                                                    , completedWorker)
     .then(([id, finishedMessage])=>{
         if(finishedMessage)
             // The worker is done.
@@ -373,7 +388,6 @@ _p._createFamilyDoc = function(environment_version, test_data_hash) {
         });
 };
 
-// jobs: needed for _checkFamilyDoc
 // finished: needed for all is-finished checking
 // rest for finished message reporting
 const _PLUCK_FAMILY_TEST_DOC = ['id', 'jobs', 'created', 'started'
@@ -484,18 +498,25 @@ _p._getOrCreateDoc = function(test_data_hash) {
         ;
 };
 
-_p._queryFamilyTestDoc = function(docid) {
+/**
+ * The doc if it is finished, otherwise null. Only a finished doc
+ * is plucked, its `jobs` and `results` can be big.
+ */
+_p._queryFinishedFamilyTestDoc = function(docid) {
+    var r = this._io.r;
     // we know docid
     return this._io.query('family')
         .get(docid)
-        .pluck(..._PLUCK_FAMILY_TEST_DOC)
+        .do(doc=>r.branch(doc('finished').default(null)
+                        , doc.pluck(..._PLUCK_FAMILY_TEST_DOC)
+                        , null))
         .run()
         ;
 };
 
 _p._queueFontBakeryFamilyJob = function(cacheKey, docid) {
     this._log.debug('dispatchFamilyJob:', docid);
-    var distributorQueueName = 'fontbakery-worker'
+    var distributorQueueName = workerQueueName('fontbakery')
       , job = new FamilyJob()
       , jobDescription = new WorkerJobDescription()
       , anyJob, buffer
@@ -553,67 +574,38 @@ _p.callInit = function(cacheKey) {
     });
 };
 
-function _familyDocNeedsFinish(doc) {
-    if(doc.finished)
-        // could have exceptions or finished successfully in here
-        return false;
-    // check if all sub-jobs are finished
-    // assert('jobs' in doc);
-    // if(!('jobs' in doc))
-    // This should never happen, because:
-    // either doc.finished is true and distributor (see doc.exception)
-    // failed or distributor was successful and that includes creating
-    // the jobs property of the doc.
-    for(let id in doc.jobs)
-        if(!doc.jobs[id].finished)
-            // still waiting for another job to be marked as finished
-            return false;
-    // All jobs have finished, does not imply without exception though!
-    return true;
-}
-
 /**
- * Finish the family job if it is feasible.
- * Return the doc, finished or not finished.
+ * -> [id, finishedMessage | null]
+ *
+ * The family doc is finished by the python Checker of the last job, in
+ * the same atomic update that marks the job as finished, see
+ * `DBOperations.finish_job`. The Distributor finishes it if it fails.
+ * Only that worker sets `finished_family` to true in its CompletedWorker
+ * message, so the result is forwarded and the files are purged once.
+ *
+ * Workers that predate `finished_family` don't set it. For these the
+ * result is forwarded whenever the doc is finished, like before.
  */
-_p._checkFamilyDoc = function(docId) {
-    return this._queryFamilyTestDoc(docId)
-    .then(doc=>{
-        var needsFinish = _familyDocNeedsFinish(doc)
-          , promise = null
-          ;
-        if(needsFinish) {
-            let finished = new Date();
-            promise = this._io.query('family')
-                              .get(docId)
-                              .update({finished: finished})
-                              .run();
-            doc.finished = finished;
-        }
-        return Promise.resolve(promise).then(()=>doc);
-    });
-};
-
-// -> [id, finishedMessage | null]
-_p.registerCompleted = function(job) {
-    var docId = job.getDocid();
+_p.registerCompleted = function(job, completedWorker) {
+    var docId = job.getDocid()
+      , reported = completedWorker.hasFinishedFamily()
+      ;
     this._log.debug('fontbakery: cleaning up job for docid', docId);
-    return this._checkFamilyDoc(docId)
+    if(reported && !completedWorker.getFinishedFamily())
+        // Other jobs of the family are pending or another job
+        // finished the family already.
+        return [docId, null];
+    return this._queryFinishedFamilyTestDoc(docId)
     .then(doc=>{
-        var isFinished = !!doc.finished
-          , purgePromise = null
-          , finishedMessage = null
-          ;
-        if(isFinished) {
-            // will force other open sub-jobs into failing
-            // but at this point, this is our best option.
-            // We don't know if another cleanup message will
-            // come again for this cacheKey!
-            purgePromise = this._cache.purge(job.getCacheKey());
-            finishedMessage = _finishedMessageFromDoc(doc);
-        }
-        return Promise.resolve(purgePromise)
-            .then(()=>[docId, finishedMessage]);
+        if(!doc && !reported)
+            return [docId, null];
+        if(!doc)
+            throw new Error('Family doc ' + docId + ' is not finished '
+                          + 'but the worker reported it as finished.');
+        // will force other open sub-jobs into failing
+        // but at this point, this is our best option.
+        return this._cache.purge(job.getCacheKey())
+            .then(()=>[docId, _finishedMessageFromDoc(doc)]);
     });
 };
 
@@ -652,7 +644,7 @@ Object.defineProperties(_p, {
 
 _p._queueJob = function(cacheKey, id) {
     this._log.debug('dispatch worker:', this._workerName, 'job:', id);
-    var distributorQueueName = 'fontbakery-worker'
+    var distributorQueueName = workerQueueName(this._workerName)
         // FIXME: reusing FamilyJob for it has id and cacheKey...
         // could be a dedicated message type maybe.
       , job = new FamilyJob()
@@ -9,6 +9,7 @@ const crypto = require('crypto')
   , { AsyncQueue } = require('./AsyncQueue')
   , { StorageService: GRPCStorageService} = require('protocolbuffers/messages_grpc_pb')
   , { StorageStatus, StorageKey } = require('protocolbuffers/messages_pb')
+  , { File, Files, FileMeta, FilesMeta, FileChunk } = require('protocolbuffers/shared_pb')
   , { Any } = require('google-protobuf/google/protobuf/any_pb.js')
   , grpc = require('grpc')
   ;
@@ -164,6 +165,15 @@ _p.delete = function(){
     throw new Error('"delete" is not implemented');
 };
 
+/**
+ * Like set, but only if there's already data for key, in that case
+ * it returns a new instanceKey for key, otherwise null.
+ */
+_p.addInstance = function(){
+    //jshint unused:vars
+    throw new Error('"addInstance" is not implemented');
+};
+
 _p._dataItemIsTimedOut = function(dataItem) {
     var timeOutDate = new Date();
     timeOutDate.setMinutes(timeOutDate.getMinutes() - this._dataItemTimeOutMinutes);
@@ -459,6 +469,13 @@ _p._set = function(key, data) {
     // METADATA_FILENAME needs save ...
 };
 
+// returns an instanceKey for key or null if there's no data for key
+_p._addInstance = function(key) {
+    return this._has(key)
+    .then(has=>has ? this._dataItems.get(key).createInstanceKey() : null);
+    // METADATA_FILENAME needs save ...
+};
+
 _p._delete = function(key, instanceKey, force) {
     return this._has(key)
     .then(has=>{
@@ -491,6 +508,7 @@ _p.has = _decorateCallToKey(_p._has);
 _p.get = _decorateCallToKey(_p._get);
 _p.set = _decorateCallToKey(_p._set);
 _p.delete = _decorateCallToKey(_p._delete);
+_p.addInstance = _decorateCallToKey(_p._addInstance);
 
 return FileSystemStore;
 })();
@@ -550,6 +568,12 @@ _p.set = function(key, data) {
     return dataItem.createInstanceKey();
 };
 
+// returns an instanceKey for key or null if there's no data for key
+_p.addInstance = function(key) {
+    var dataItem = this._dataItems.get(key);
+    return dataItem ? dataItem.createInstanceKey() : null;
+};
+
 _p.delete = function(key, instanceKey, force) {
     if(!this.has(key, force ? null : instanceKey))
         return dataItem.instances;
@@ -577,10 +601,18 @@ function StorageService(logging, port, storageImplementation) {
     this._log = logging;
     this._data = storageImplementation;
     this._keyLength = 64; // when using sha256 and hash.digest('hex')
+    // max bytes of file data in one FileChunk message
+    this._chunkSize = 1024 * 1024;
 
     this._server = new grpc.Server({
         'grpc.max_send_message_length': 80 * 1024 * 1024
       , 'grpc.max_receive_message_length': 80 * 1024 * 1024
+        // Allow the keepalive pings of the python workers, see
+        // ChannelFactory in worker/grpcchannels.py, otherwise the
+        // server closes connections with "too_many_pings".
+      , 'grpc.keepalive_permit_without_calls': 1
+      , 'grpc.http2.min_ping_interval_without_data_ms': 30000
+      , 'grpc.http2.max_pings_without_data': 0
     });
 
     this._server.addService(GRPCStorageService, this);
@@ -686,13 +718,25 @@ _p.put = function(call) {
     }.bind(this));
 };
 
-_p.get = function(call, callback) {
+/**
+ * `transform` is applied to the stored google.protobuf.Any message
+ * before it is sent to the client, it may throw.
+ */
+_p._get = function(call, callback, transform) {
     var fullKey = call.request.getKey() // call.request is a StorageKey
       , [key, instanceKey] = fullKey.split(':')
       , getResult
       , onGet = (message)=>{
             this._log.debug('[GET] key', key, 'is a',  message.getTypeUrl());
-            callback(null, message);
+            var answer;
+            try {
+                answer = transform ? transform(message) : message;
+            }
+            catch(error) {
+                onError(error);
+                return;
+            }
+            callback(null, answer);
         }
       , onError = (error)=>{
             // This is either a problem with the client implementation
@@ -739,6 +783,223 @@ _p.get = function(call, callback) {
         onGet(getResult);
 };
 
+_p.get = function(call, callback) {
+    this._get(call, callback);
+};
+
+_p._unpackFiles = function(any) {
+    var files = any.unpack(Files.deserializeBinary, 'fontbakery.dashboard.Files')
+      , error
+      ;
+    if(!files) {
+        error = new Error('Stored message is not a '
+                + 'fontbakery.dashboard.Files but: ' + any.getTypeName());
+        error.name = 'INVALID_ARGUMENT';
+        error.code = grpc.status.INVALID_ARGUMENT;
+        throw error;
+    }
+    return files;
+};
+
+/**
+ * Answers only the names and sizes of the files of a stored Files
+ * message, e.g. to list the files of a job without transferring
+ * all of the font data.
+ */
+_p.getFilesMeta = function(call, callback) {
+    this._get(call, callback, any=>{
+        var files = this._unpackFiles(any)
+          , filesMeta = new FilesMeta()
+          ;
+        for(let file of files.getFilesList()) {
+            let fileMeta = new FileMeta();
+            fileMeta.setName(file.getName());
+            fileMeta.setSize(file.getData_asU8().length);
+            filesMeta.addFiles(fileMeta);
+        }
+        return filesMeta;
+    });
+};
+
+/**
+ * Like get, for a stored Files message, but the files are sent in
+ * FileChunk messages of at most this._chunkSize bytes of data, hence
+ * the size of the Files message is not limited by the max message
+ * length and the client doesn't need to hold all of it in memory.
+ */
+_p.getFilesStream = function(call) {
+    var chunkSize = this._chunkSize
+      , cancelled = false
+      ;
+    function* chunks(files) {
+        for(let file of files.getFilesList()) {
+            let data = file.getData_asU8()
+              , offset = 0
+              ;
+            do {
+                let chunk = new FileChunk();
+                if(offset === 0)
+                    chunk.setName(file.getName());
+                chunk.setData(data.subarray(offset, offset + chunkSize));
+                yield chunk;
+                offset += chunkSize;
+            } while(offset < data.length);
+        }
+    }
+    call.on('cancelled', ()=>{ cancelled = true; });
+
+    var onFiles = (error, files)=>{
+        if(error) {
+            call.emit('error', error);
+            return;
+        }
+        var iterator = chunks(files)
+          , writeChunks = ()=>{
+                // Stop when the buffer of the call is full, continue
+                // when the client consumed it, otherwise a slow client
+                // makes us buffer all the files.
+                while(!cancelled) {
+                    let {value: chunk, done} = iterator.next();
+                    if(done) {
+                        call.end();
+                        return;
+                    }
+                    if(!call.write(chunk)) {
+                        call.once('drain', writeChunks);
+                        return;
+                    }
+                }
+            }
+          ;
+        writeChunks();
+    };
+    this._get(call, onFiles, any=>this._unpackFiles(any));
+};
+
+/**
+ * Counterpart of getFilesStream. Assembles the FileChunk messages to
+ * a Files message and stores it like put does, i.e. the answered
+ * StorageKey can be used with get as well.
+ */
+_p.putFilesStream = function(call, callback) {
+    var files = new Files()
+      , file = null
+      , chunks = []
+      , failed = false
+      , finishFile = ()=>{
+            if(!file)
+                return;
+            file.setData(new Uint8Array(Buffer.concat(chunks)));
+            files.addFiles(file);
+            file = null;
+            chunks = [];
+        }
+      , onError = (error)=>{
+            if(failed)
+                return;
+            failed = true;
+            this._log.error('[PUT FILES STREAM]', error);
+            if(!('code' in error) && error.name in grpc.status)
+                error.code = grpc.status[error.name];
+            callback(error, null);
+        }
+      , onPut = (hash, instanceKey)=>{
+            var storageKey = new StorageKey();
+            storageKey.setKey([hash, instanceKey].join(':'));
+            storageKey.setHash(hash);
+            this._log.debug('[PUT FILES STREAM] key:', storageKey.getKey());
+            callback(null, storageKey);
+        }
+      ;
+
+    call.on('data', chunk=>{
+        if(failed)
+            return;
+        if(chunk.getName()) {
+            finishFile();
+            file = new File();
+            file.setName(chunk.getName());
+        }
+        else if(!file) {
+            let error = new Error('The first FileChunk must have a name.');
+            error.name = 'INVALID_ARGUMENT';
+            onError(error);
+            return;
+        }
+        chunks.push(chunk.getData_asU8());
+    });
+
+    call.on('end', ()=>{
+        if(failed)
+            return;
+        finishFile();
+        var pbAnyMessage = new Any()
+          , hash, putResult
+          ;
+        pbAnyMessage.pack(files.serializeBinary(), 'fontbakery.dashboard.Files');
+        hash = this._hash(pbAnyMessage.serializeBinary());
+        try {
+            // does I/O
+            // -> an intanceKey or a promise
+            putResult = this._data.set(hash, pbAnyMessage);
+        }
+        catch(error) {
+            onError(error);
+            return;
+        }
+        if(this._data.isAsync)
+            putResult.then(instanceKey=>onPut(hash, instanceKey), onError);
+        else
+            onPut(hash, putResult);
+    });
+};
+
+/**
+ * The client sends the hash of the data it would put. If that data
+ * is stored, answer a new key for it, just like put would, otherwise
+ * answer an empty key and the client must put the data.
+ */
+_p.putExisting = function(call, callback) {
+    var hash = call.request.getHash() // call.request is a StorageKey
+      , clientId = call.request.getClientid()
+      , storageKey = new StorageKey()
+      , result
+      , onResult = (instanceKey)=>{
+            if(instanceKey !== null) {
+                storageKey.setKey([hash, instanceKey].join(':'));
+                storageKey.setHash(hash);
+            }
+            if(clientId)
+                storageKey.setClientid(clientId);
+            this._log.debug('[PUT EXISTING] hash:', hash
+                                        , 'key:', storageKey.getKey());
+            callback(null, storageKey);
+        }
+      , onError = (error)=>{
+            this._log.error('[PUT EXISTING]', error);
+            callback(error, null);
+        }
+      ;
+    let [valid, ] = this._checkKey(hash);
+    if(!valid) {
+        // i.e. NOT_FOUND
+        onResult(null);
+        return;
+    }
+    try {
+        // -> an instanceKey, null or a promise
+        result = this._data.addInstance(hash);
+    }
+    catch(error) {
+        onError(error);
+        return;
+    }
+    if(this._data.isAsync)
+        result.then(onResult, onError);
+    else
+        onResult(result);
+};
+
 _p.purge = function(call, callback) {
     var fullKey = call.request.getKey() // call.request is a StorageKey
       , [key, instanceKey] = fullKey.split(':')
@@ -101,6 +101,12 @@ function getSetup() {
               , collection: 'collectiontests'
               , statusreport: 'statusreports'
               , dispatcherprocesses: 'dispatcherprocesses'
+                // runtimes of the Font Bakery checks, written by the
+                // python workers, used to distribute the checks
+              , checkstats: 'checkstats'
+                // results of the Font Bakery checks by the hash of the
+                // checked files, reused by the python workers
+              , checkresults: 'checkresults'
             }
         }
       , rethinkProviderName = process.env.RETHINKDB_PROXY_SERVICE_HOST
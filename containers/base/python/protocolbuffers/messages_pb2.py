@@ -23,7 +23,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='fontbakery.dashboard',
   syntax='proto3',
   serialized_options=None,
-  serialized_pb=b'\n\x0emessages.proto\x12\x14\x66ontbakery.dashboard\x1a\x19google/protobuf/any.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1bgoogle/protobuf/empty.proto\x1a\x0cshared.proto\"m\n\tFamilyJob\x12\r\n\x05\x64ocid\x18\x01 \x01(\t\x12\x33\n\tcache_key\x18\x02 \x01(\x0b\x32 .fontbakery.dashboard.StorageKey\x12\r\n\x05jobid\x18\x03 \x01(\t\x12\r\n\x05order\x18\x04 \x03(\t\"F\n\x0bStorageItem\x12%\n\x07payload\x18\x01 \x01(\x0b\x32\x14.google.protobuf.Any\x12\x10\n\x08\x63lientid\x18\x02 \x01(\t\"H\n\nStorageKey\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x0c\n\x04hash\x18\x02 \x01(\t\x12\x10\n\x08\x63lientid\x18\x03 \x01(\t\x12\r\n\x05\x66orce\x18\x04 \x01(\x08\"/\n\rStorageStatus\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x11\n\tinstances\x18\x02 \x01(\x05\"%\n\x10ManifestSourceId\x12\x11\n\tsource_id\x18\x01 \x01(\t\"\'\n\x0f\x46\x61milyNamesList\x12\x14\n\x0c\x66\x61mily_names\x18\x01 \x03(\t\"v\n\rFamilyRequest\x12\x11\n\tsource_id\x18\x01 \x01(\t\x12\x13\n\x0b\x66\x61mily_name\x18\x02 \x01(\t\x12=\n\x0fprocess_command\x18\x03 \x01(\x0b\x32$.fontbakery.dashboard.ProcessCommand\"^\n\rSourceDetails\x12\x16\n\x0cjson_payload\x18\x01 \x01(\tH\x00\x12*\n\npb_payload\x18\x02 \x01(\x0b\x32\x14.google.protobuf.AnyH\x00\x42\t\n\x07payload\"\xb1\x01\n\x13\x43ollectionFamilyJob\x12\x14\n\x0c\x63ollectionid\x18\x01 \x01(\t\x12\x13\n\x0b\x66\x61mily_name\x18\x02 \x01(\t\x12\x33\n\tcache_key\x18\x03 \x01(\x0b\x32 .fontbakery.dashboard.StorageKey\x12(\n\x04\x64\x61te\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08metadata\x18\x05 \x01(\t\"\x97\x02\n\nFamilyData\x12\x37\n\x06status\x18\x01 \x01(\x0e\x32\'.fontbakery.dashboard.FamilyData.Result\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x12\n\nerror_code\x18\x03 \x01(\x05\x12\x14\n\x0c\x63ollectionid\x18\x04 \x01(\t\x12\x13\n\x0b\x66\x61mily_name\x18\x05 \x01(\t\x12*\n\x05\x66iles\x18\x06 \x01(\x0b\x32\x1b.fontbakery.dashboard.Files\x12(\n\x04\x64\x61te\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08metadata\x18\x08 \x01(\t\"\x1a\n\x06Result\x12\x08\n\x04\x46\x41IL\x10\x00\x12\x06\n\x02OK\x10\x01\"\xda\x01\n\x06Report\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0f\n\x07type_id\x18\x02 \x01(\t\x12\x0e\n\x06method\x18\x03 \x01(\t\x12+\n\x07started\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x66inished\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0c\n\x04\x64\x61ta\x18\x06 \x01(\t\x12\n\n\x02id\x18\x07 \x01(\t\x12,\n\x08reported\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x96\x04\n\x0cReportsQuery\x12@\n\x07\x66ilters\x18\x01 \x03(\x0b\x32/.fontbakery.dashboard.ReportsQuery.FiltersEntry\x12\x41\n\npagination\x18\x04 \x01(\x0b\x32-.fontbakery.dashboard.ReportsQuery.Pagination\x12\x14\n\x0cinclude_data\x18\x05 \x01(\x08\x1a\xa6\x01\n\x06\x46ilter\x12<\n\x04type\x18\x01 \x01(\x0e\x32..fontbakery.dashboard.ReportsQuery.Filter.Type\x12\x0e\n\x06values\x18\x02 \x03(\t\x12\x31\n\rmin_max_dates\x18\x03 \x03(\x0b\x32\x1a.google.protobuf.Timestamp\"\x1b\n\x04Type\x12\t\n\x05VALUE\x10\x00\x12\x08\n\x04\x44\x41TE\x10\x01\x1aY\n\x0c\x46iltersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x38\n\x05value\x18\x02 \x01(\x0b\x32).fontbakery.dashboard.ReportsQuery.Filter:\x02\x38\x01\x1ag\n\nPagination\x12\x31\n\ritem_reported\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0f\n\x07item_id\x18\x02 \x01(\t\x12\x15\n\rprevious_page\x18\x03 \x01(\x08\"\x18\n\tReportIds\x12\x0b\n\x03ids\x18\x01 \x03(\t\"\x86\x01\n\x14ProcessCommandResult\x12\x41\n\x06result\x18\x01 \x01(\x0e\x32\x31.fontbakery.dashboard.ProcessCommandResult.Result\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1a\n\x06Result\x12\x08\n\x04\x46\x41IL\x10\x00\x12\x06\n\x02OK\x10\x01\"@\n\x15\x44ispatcherInitProcess\x12\x11\n\trequester\x18\x01 \x01(\t\x12\x14\n\x0cjson_payload\x18\x02 \x01(\t\"\"\n\x0cProcessQuery\x12\x12\n\nprocess_id\x18\x01 \x01(\t\"P\n\x0cProcessState\x12\x12\n\nprocess_id\x18\x01 \x01(\t\x12\x14\n\x0cprocess_data\x18\x02 \x01(\t\x12\x16\n\x0euser_interface\x18\x03 \x01(\t\"!\n\x10ProcessListQuery\x12\r\n\x05query\x18\x01 \x01(\t\"%\n\x0fProcessListItem\x12\x12\n\nprocess_id\x18\x01 \x01(\t\"G\n\x0bProcessList\x12\x38\n\tprocesses\x18\x06 \x03(\x0b\x32%.fontbakery.dashboard.ProcessListItem\"\xdf\x01\n\x0eProcessCommand\x12\x0e\n\x06ticket\x18\x01 \x01(\t\x12\x13\n\x0btarget_path\x18\x02 \x01(\t\x12\x15\n\rcallback_name\x18\x03 \x01(\t\x12\x11\n\trequester\x18\x04 \x01(\t\x12\x1b\n\x13response_queue_name\x18\x05 \x01(\t\x12\x16\n\x0cjson_payload\x18\x06 \x01(\tH\x00\x12*\n\npb_payload\x18\x07 \x01(\x0b\x32\x14.google.protobuf.AnyH\x00\x12\x12\n\nsession_id\x18\x08 \x01(\tB\t\n\x07payload\"\xa3\x02\n\nAuthStatus\x12;\n\x06status\x18\x01 \x01(\x0e\x32+.fontbakery.dashboard.AuthStatus.StatusCode\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\x15\n\rauthorize_url\x18\x03 \x01(\t\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x11\n\tuser_name\x18\x05 \x01(\t\x12\x12\n\navatar_url\x18\x06 \x01(\t\"u\n\nStatusCode\x12\t\n\x05\x45RROR\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0b\n\x07INITIAL\x10\x02\x12\r\n\tNOT_READY\x10\x03\x12\x0e\n\nNO_SESSION\x10\x04\x12\x19\n\x15WRONG_AUTHORIZE_STATE\x10\x05\x12\r\n\tTIMED_OUT\x10\x06\"T\n\x10\x41uthorizeRequest\x12\x13\n\x0bo_auth_code\x18\x01 \x01(\t\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\x17\n\x0f\x61uthorize_state\x18\x03 \x01(\t\"\x1f\n\tSessionId\x12\x12\n\nsession_id\x18\x01 \x01(\t\"]\n\x16\x41uthorizedRolesRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x1c\n\x14repo_name_with_owner\x18\x02 \x01(\t\x12\x11\n\tinitiator\x18\x03 \x01(\t\"3\n\x0f\x41uthorizedRoles\x12\r\n\x05roles\x18\x01 \x03(\t\x12\x11\n\tuser_name\x18\x02 \x01(\t\"R\n\nOAuthToken\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12\x14\n\x0c\x61\x63\x63\x65ss_token\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\r\n\x05scope\x18\x04 \x01(\t\"\xf0\x01\n\x0bPullRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x13\n\x0bstorage_key\x18\x02 \x01(\t\x12\x12\n\np_r_target\x18\x03 \x01(\t\x12\x18\n\x10target_directory\x18\x04 \x01(\t\x12\x19\n\x11p_r_message_title\x18\x05 \x01(\t\x12\x18\n\x10p_r_message_body\x18\x06 \x01(\t\x12\x16\n\x0e\x63ommit_message\x18\x07 \x01(\t\x12=\n\x0fprocess_command\x18\x08 \x01(\x0b\x32$.fontbakery.dashboard.ProcessCommand\"\x95\x01\n\x05Issue\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\nrepo_owner\x18\x02 \x01(\t\x12\x11\n\trepo_name\x18\x03 \x01(\t\x12\r\n\x05title\x18\x04 \x01(\t\x12\x0c\n\x04\x62ody\x18\x05 \x01(\t\x12\x11\n\tmilestone\x18\x06 \x01(\x05\x12\x0e\n\x06labels\x18\x07 \x03(\t\x12\x11\n\tassignees\x18\x08 \x03(\t\"\xb8\x01\n\x0cGitHubReport\x12\x39\n\x06status\x18\x01 \x01(\x0e\x32).fontbakery.dashboard.GitHubReport.Result\x12\r\n\x03url\x18\x02 \x01(\tH\x00\x12\x0f\n\x05\x65rror\x18\x03 \x01(\tH\x00\x12\x14\n\x0cissue_number\x18\x04 \x01(\x05\x12\x12\n\nbranch_url\x18\x05 \x01(\t\"\x1a\n\x06Result\x12\x08\n\x04\x46\x41IL\x10\x00\x12\x06\n\x02OK\x10\x01\x42\x07\n\x05value\"\x8a\x01\n\x11WorkerDescription\x12\x13\n\x0bworker_name\x18\x01 \x01(\t\x12!\n\x03job\x18\x02 \x01(\x0b\x32\x14.google.protobuf.Any\x12=\n\x0fprocess_command\x18\x03 \x01(\x0b\x32$.fontbakery.dashboard.ProcessCommand\"N\n\x14WorkerJobDescription\x12\x13\n\x0bworker_name\x18\x01 \x01(\t\x12!\n\x03job\x18\x02 \x01(\x0b\x32\x14.google.protobuf.Any\"W\n\x0f\x43ompletedWorker\x12\x13\n\x0bworker_name\x18\x01 \x01(\t\x12/\n\x11\x63ompleted_message\x18\x02 \x01(\x0b\x32\x14.google.protobuf.Any\"\xdb\x01\n\x12\x46ontBakeryFinished\x12\r\n\x05\x64ocid\x18\x01 \x01(\t\x12\x18\n\x10\x66inished_orderly\x18\x02 \x01(\x08\x12\x14\n\x0cresults_json\x18\x03 \x01(\t\x12+\n\x07\x63reated\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12+\n\x07started\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x66inished\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xfa\x02\n\x1aGenericStorageWorkerResult\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12+\n\x07\x63reated\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12+\n\x07started\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x66inished\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\texception\x18\x05 \x01(\t\x12\x18\n\x10preparation_logs\x18\x06 \x03(\t\x12H\n\x07results\x18\x07 \x03(\x0b\x32\x37.fontbakery.dashboard.GenericStorageWorkerResult.Result\x1aM\n\x06Result\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x35\n\x0bstorage_key\x18\x02 \x01(\x0b\x32 .fontbakery.dashboard.StorageKey2\xee\x01\n\x07Storage\x12P\n\x03Put\x12!.fontbakery.dashboard.StorageItem\x1a .fontbakery.dashboard.StorageKey\"\x00(\x01\x30\x01\x12?\n\x03Get\x12 .fontbakery.dashboard.StorageKey\x1a\x14.google.protobuf.Any\"\x00\x12P\n\x05Purge\x12 .fontbakery.dashboard.StorageKey\x1a#.fontbakery.dashboard.StorageStatus\"\x00\x32\xaa\x03\n\x08Manifest\x12H\n\x04Poke\x12&.fontbakery.dashboard.ManifestSourceId\x1a\x16.google.protobuf.Empty\"\x00\x12N\n\x03Get\x12#.fontbakery.dashboard.FamilyRequest\x1a .fontbakery.dashboard.FamilyData\"\x00\x12K\n\nGetDelayed\x12#.fontbakery.dashboard.FamilyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12W\n\x04List\x12&.fontbakery.dashboard.ManifestSourceId\x1a%.fontbakery.dashboard.FamilyNamesList\"\x00\x12^\n\x10GetSourceDetails\x12#.fontbakery.dashboard.FamilyRequest\x1a#.fontbakery.dashboard.SourceDetails\"\x00\x32\xe2\x01\n\x07Reports\x12>\n\x04\x46ile\x12\x1c.fontbakery.dashboard.Report\x1a\x16.google.protobuf.Empty\"\x00\x12M\n\x05Query\x12\".fontbakery.dashboard.ReportsQuery\x1a\x1c.fontbakery.dashboard.Report\"\x00\x30\x01\x12H\n\x03Get\x12\x1f.fontbakery.dashboard.ReportIds\x1a\x1c.fontbakery.dashboard.Report\"\x00\x30\x01\x32\xcc\x03\n\x0eProcessManager\x12^\n\x10SubscribeProcess\x12\".fontbakery.dashboard.ProcessQuery\x1a\".fontbakery.dashboard.ProcessState\"\x00\x30\x01\x12V\n\nGetProcess\x12\".fontbakery.dashboard.ProcessQuery\x1a\".fontbakery.dashboard.ProcessState\"\x00\x12]\n\x07\x45xecute\x12$.fontbakery.dashboard.ProcessCommand\x1a*.fontbakery.dashboard.ProcessCommandResult\"\x00\x12Q\n\x0bInitProcess\x12\x14.google.protobuf.Any\x1a*.fontbakery.dashboard.ProcessCommandResult\"\x00\x12P\n\x10GetInitProcessUi\x12\x16.google.protobuf.Empty\x1a\".fontbakery.dashboard.ProcessState\"\x00\x32\x81\x01\n\x18\x44ispatcherProcessManager\x12\x65\n\x14SubscribeProcessList\x12&.fontbakery.dashboard.ProcessListQuery\x1a!.fontbakery.dashboard.ProcessList\"\x00\x30\x01\x32\x84\x04\n\x0b\x41uthService\x12I\n\x0bInitSession\x12\x16.google.protobuf.Empty\x1a .fontbakery.dashboard.AuthStatus\"\x00\x12\x43\n\x06Logout\x12\x1f.fontbakery.dashboard.SessionId\x1a\x16.google.protobuf.Empty\"\x00\x12W\n\tAuthorize\x12&.fontbakery.dashboard.AuthorizeRequest\x1a .fontbakery.dashboard.AuthStatus\"\x00\x12S\n\x0c\x43heckSession\x12\x1f.fontbakery.dashboard.SessionId\x1a .fontbakery.dashboard.AuthStatus\"\x00\x12\x61\n\x08GetRoles\x12,.fontbakery.dashboard.AuthorizedRolesRequest\x1a%.fontbakery.dashboard.AuthorizedRoles\"\x00\x12T\n\rGetOAuthToken\x12\x1f.fontbakery.dashboard.SessionId\x1a .fontbakery.dashboard.OAuthToken\"\x00\x32\xb6\x01\n\x10GitHubOperations\x12R\n\x13\x44ispatchPullRequest\x12!.fontbakery.dashboard.PullRequest\x1a\x16.google.protobuf.Empty\"\x00\x12N\n\tFileIssue\x12\x1b.fontbakery.dashboard.Issue\x1a\".fontbakery.dashboard.GitHubReport\"\x00\x32V\n\x0bInitWorkers\x12G\n\x04Init\x12\'.fontbakery.dashboard.WorkerDescription\x1a\x14.google.protobuf.Any\"\x00P\x03\x62\x06proto3'
+  serialized_pb=b'\n\x0emessages.proto\x12\x14\x66ontbakery.dashboard\x1a\x19google/protobuf/any.proto\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1bgoogle/protobuf/empty.proto\x1a\x0cshared.proto\"m\n\tFamilyJob\x12\r\n\x05\x64ocid\x18\x01 \x01(\t\x12\x33\n\tcache_key\x18\x02 \x01(\x0b\x32 .fontbakery.dashboard.StorageKey\x12\r\n\x05jobid\x18\x03 \x01(\t\x12\r\n\x05order\x18\x04 \x03(\t\"F\n\x0bStorageItem\x12%\n\x07payload\x18\x01 \x01(\x0b\x32\x14.google.protobuf.Any\x12\x10\n\x08\x63lientid\x18\x02 \x01(\t\"H\n\nStorageKey\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x0c\n\x04hash\x18\x02 \x01(\t\x12\x10\n\x08\x63lientid\x18\x03 \x01(\t\x12\r\n\x05\x66orce\x18\x04 \x01(\x08\"/\n\rStorageStatus\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x11\n\tinstances\x18\x02 \x01(\x05\"%\n\x10ManifestSourceId\x12\x11\n\tsource_id\x18\x01 \x01(\t\"\'\n\x0f\x46\x61milyNamesList\x12\x14\n\x0c\x66\x61mily_names\x18\x01 \x03(\t\"v\n\rFamilyRequest\x12\x11\n\tsource_id\x18\x01 \x01(\t\x12\x13\n\x0b\x66\x61mily_name\x18\x02 \x01(\t\x12=\n\x0fprocess_command\x18\x03 \x01(\x0b\x32$.fontbakery.dashboard.ProcessCommand\"^\n\rSourceDetails\x12\x16\n\x0cjson_payload\x18\x01 \x01(\tH\x00\x12*\n\npb_payload\x18\x02 \x01(\x0b\x32\x14.google.protobuf.AnyH\x00\x42\t\n\x07payload\"\xb1\x01\n\x13\x43ollectionFamilyJob\x12\x14\n\x0c\x63ollectionid\x18\x01 \x01(\t\x12\x13\n\x0b\x66\x61mily_name\x18\x02 \x01(\t\x12\x33\n\tcache_key\x18\x03 \x01(\x0b\x32 .fontbakery.dashboard.StorageKey\x12(\n\x04\x64\x61te\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08metadata\x18\x05 \x01(\t\"\x97\x02\n\nFamilyData\x12\x37\n\x06status\x18\x01 \x01(\x0e\x32\'.fontbakery.dashboard.FamilyData.Result\x12\r\n\x05\x65rror\x18\x02 \x01(\t\x12\x12\n\nerror_code\x18\x03 \x01(\x05\x12\x14\n\x0c\x63ollectionid\x18\x04 \x01(\t\x12\x13\n\x0b\x66\x61mily_name\x18\x05 \x01(\t\x12*\n\x05\x66iles\x18\x06 \x01(\x0b\x32\x1b.fontbakery.dashboard.Files\x12(\n\x04\x64\x61te\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08metadata\x18\x08 \x01(\t\"\x1a\n\x06Result\x12\x08\n\x04\x46\x41IL\x10\x00\x12\x06\n\x02OK\x10\x01\"\xda\x01\n\x06Report\x12\x0c\n\x04type\x18\x01 \x01(\t\x12\x0f\n\x07type_id\x18\x02 \x01(\t\x12\x0e\n\x06method\x18\x03 \x01(\t\x12+\n\x07started\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x66inished\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0c\n\x04\x64\x61ta\x18\x06 \x01(\t\x12\n\n\x02id\x18\x07 \x01(\t\x12,\n\x08reported\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x96\x04\n\x0cReportsQuery\x12@\n\x07\x66ilters\x18\x01 \x03(\x0b\x32/.fontbakery.dashboard.ReportsQuery.FiltersEntry\x12\x41\n\npagination\x18\x04 \x01(\x0b\x32-.fontbakery.dashboard.ReportsQuery.Pagination\x12\x14\n\x0cinclude_data\x18\x05 \x01(\x08\x1a\xa6\x01\n\x06\x46ilter\x12<\n\x04type\x18\x01 \x01(\x0e\x32..fontbakery.dashboard.ReportsQuery.Filter.Type\x12\x0e\n\x06values\x18\x02 \x03(\t\x12\x31\n\rmin_max_dates\x18\x03 \x03(\x0b\x32\x1a.google.protobuf.Timestamp\"\x1b\n\x04Type\x12\t\n\x05VALUE\x10\x00\x12\x08\n\x04\x44\x41TE\x10\x01\x1aY\n\x0c\x46iltersEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\x38\n\x05value\x18\x02 \x01(\x0b\x32).fontbakery.dashboard.ReportsQuery.Filter:\x02\x38\x01\x1ag\n\nPagination\x12\x31\n\ritem_reported\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0f\n\x07item_id\x18\x02 \x01(\t\x12\x15\n\rprevious_page\x18\x03 \x01(\x08\"\x18\n\tReportIds\x12\x0b\n\x03ids\x18\x01 \x03(\t\"\x86\x01\n\x14ProcessCommandResult\x12\x41\n\x06result\x18\x01 \x01(\x0e\x32\x31.fontbakery.dashboard.ProcessCommandResult.Result\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1a\n\x06Result\x12\x08\n\x04\x46\x41IL\x10\x00\x12\x06\n\x02OK\x10\x01\"@\n\x15\x44ispatcherInitProcess\x12\x11\n\trequester\x18\x01 \x01(\t\x12\x14\n\x0cjson_payload\x18\x02 \x01(\t\"\"\n\x0cProcessQuery\x12\x12\n\nprocess_id\x18\x01 \x01(\t\"P\n\x0cProcessState\x12\x12\n\nprocess_id\x18\x01 \x01(\t\x12\x14\n\x0cprocess_data\x18\x02 \x01(\t\x12\x16\n\x0euser_interface\x18\x03 \x01(\t\"!\n\x10ProcessListQuery\x12\r\n\x05query\x18\x01 \x01(\t\"%\n\x0fProcessListItem\x12\x12\n\nprocess_id\x18\x01 \x01(\t\"G\n\x0bProcessList\x12\x38\n\tprocesses\x18\x06 \x03(\x0b\x32%.fontbakery.dashboard.ProcessListItem\"\xdf\x01\n\x0eProcessCommand\x12\x0e\n\x06ticket\x18\x01 \x01(\t\x12\x13\n\x0btarget_path\x18\x02 \x01(\t\x12\x15\n\rcallback_name\x18\x03 \x01(\t\x12\x11\n\trequester\x18\x04 \x01(\t\x12\x1b\n\x13response_queue_name\x18\x05 \x01(\t\x12\x16\n\x0cjson_payload\x18\x06 \x01(\tH\x00\x12*\n\npb_payload\x18\x07 \x01(\x0b\x32\x14.google.protobuf.AnyH\x00\x12\x12\n\nsession_id\x18\x08 \x01(\tB\t\n\x07payload\"\xa3\x02\n\nAuthStatus\x12;\n\x06status\x18\x01 \x01(\x0e\x32+.fontbakery.dashboard.AuthStatus.StatusCode\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\x15\n\rauthorize_url\x18\x03 \x01(\t\x12\x0f\n\x07message\x18\x04 \x01(\t\x12\x11\n\tuser_name\x18\x05 \x01(\t\x12\x12\n\navatar_url\x18\x06 \x01(\t\"u\n\nStatusCode\x12\t\n\x05\x45RROR\x10\x00\x12\x06\n\x02OK\x10\x01\x12\x0b\n\x07INITIAL\x10\x02\x12\r\n\tNOT_READY\x10\x03\x12\x0e\n\nNO_SESSION\x10\x04\x12\x19\n\x15WRONG_AUTHORIZE_STATE\x10\x05\x12\r\n\tTIMED_OUT\x10\x06\"T\n\x10\x41uthorizeRequest\x12\x13\n\x0bo_auth_code\x18\x01 \x01(\t\x12\x12\n\nsession_id\x18\x02 \x01(\t\x12\x17\n\x0f\x61uthorize_state\x18\x03 \x01(\t\"\x1f\n\tSessionId\x12\x12\n\nsession_id\x18\x01 \x01(\t\"]\n\x16\x41uthorizedRolesRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x1c\n\x14repo_name_with_owner\x18\x02 \x01(\t\x12\x11\n\tinitiator\x18\x03 \x01(\t\"3\n\x0f\x41uthorizedRoles\x12\r\n\x05roles\x18\x01 \x03(\t\x12\x11\n\tuser_name\x18\x02 \x01(\t\"R\n\nOAuthToken\x12\x11\n\tuser_name\x18\x01 \x01(\t\x12\x14\n\x0c\x61\x63\x63\x65ss_token\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\r\n\x05scope\x18\x04 \x01(\t\"\xf0\x01\n\x0bPullRequest\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x13\n\x0bstorage_key\x18\x02 \x01(\t\x12\x12\n\np_r_target\x18\x03 \x01(\t\x12\x18\n\x10target_directory\x18\x04 \x01(\t\x12\x19\n\x11p_r_message_title\x18\x05 \x01(\t\x12\x18\n\x10p_r_message_body\x18\x06 \x01(\t\x12\x16\n\x0e\x63ommit_message\x18\x07 \x01(\t\x12=\n\x0fprocess_command\x18\x08 \x01(\x0b\x32$.fontbakery.dashboard.ProcessCommand\"\x95\x01\n\x05Issue\x12\x12\n\nsession_id\x18\x01 \x01(\t\x12\x12\n\nrepo_owner\x18\x02 \x01(\t\x12\x11\n\trepo_name\x18\x03 \x01(\t\x12\r\n\x05title\x18\x04 \x01(\t\x12\x0c\n\x04\x62ody\x18\x05 \x01(\t\x12\x11\n\tmilestone\x18\x06 \x01(\x05\x12\x0e\n\x06labels\x18\x07 \x03(\t\x12\x11\n\tassignees\x18\x08 \x03(\t\"\xb8\x01\n\x0cGitHubReport\x12\x39\n\x06status\x18\x01 \x01(\x0e\x32).fontbakery.dashboard.GitHubReport.Result\x12\r\n\x03url\x18\x02 \x01(\tH\x00\x12\x0f\n\x05\x65rror\x18\x03 \x01(\tH\x00\x12\x14\n\x0cissue_number\x18\x04 \x01(\x05\x12\x12\n\nbranch_url\x18\x05 \x01(\t\"\x1a\n\x06Result\x12\x08\n\x04\x46\x41IL\x10\x00\x12\x06\n\x02OK\x10\x01\x42\x07\n\x05value\"\x8a\x01\n\x11WorkerDescription\x12\x13\n\x0bworker_name\x18\x01 \x01(\t\x12!\n\x03job\x18\x02 \x01(\x0b\x32\x14.google.protobuf.Any\x12=\n\x0fprocess_command\x18\x03 \x01(\x0b\x32$.fontbakery.dashboard.ProcessCommand\"_\n\x14WorkerJobDescription\x12\x13\n\x0bworker_name\x18\x01 \x01(\t\x12!\n\x03job\x18\x02 \x01(\x0b\x32\x14.google.protobuf.Any\x12\x0f\n\x07retries\x18\x03 \x01(\x05\"\x8e\x01\n\x0f\x43ompletedWorker\x12\x13\n\x0bworker_name\x18\x01 \x01(\t\x12/\n\x11\x63ompleted_message\x18\x02 \x01(\x0b\x32\x14.google.protobuf.Any\x12\x19\n\x0f\x66inished_family\x18\x03 \x01(\x08H\x00\x42\x1a\n\x18\x66inished_family_reported\"\xdb\x01\n\x12\x46ontBakeryFinished\x12\r\n\x05\x64ocid\x18\x01 \x01(\t\x12\x18\n\x10\x66inished_orderly\x18\x02 \x01(\x08\x12\x14\n\x0cresults_json\x18\x03 \x01(\t\x12+\n\x07\x63reated\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12+\n\x07started\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x66inished\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xfa\x02\n\x1aGenericStorageWorkerResult\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12+\n\x07\x63reated\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12+\n\x07started\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x66inished\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x11\n\texception\x18\x05 \x01(\t\x12\x18\n\x10preparation_logs\x18\x06 \x03(\t\x12H\n\x07results\x18\x07 \x03(\x0b\x32\x37.fontbakery.dashboard.GenericStorageWorkerResult.Result\x1aM\n\x06Result\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x35\n\x0bstorage_key\x18\x02 \x01(\x0b\x32 .fontbakery.dashboard.StorageKey2\xca\x04\n\x07Storage\x12P\n\x03Put\x12!.fontbakery.dashboard.StorageItem\x1a .fontbakery.dashboard.StorageKey\"\x00(\x01\x30\x01\x12?\n\x03Get\x12 .fontbakery.dashboard.StorageKey\x1a\x14.google.protobuf.Any\"\x00\x12P\n\x05Purge\x12 .fontbakery.dashboard.StorageKey\x1a#.fontbakery.dashboard.StorageStatus\"\x00\x12S\n\x0cGetFilesMeta\x12 .fontbakery.dashboard.StorageKey\x1a\x1f.fontbakery.dashboard.FilesMeta\"\x00\x12W\n\x0eGetFilesStream\x12 .fontbakery.dashboard.StorageKey\x1a\x1f.fontbakery.dashboard.FileChunk\"\x00\x30\x01\x12W\n\x0ePutFilesStream\x12\x1f.fontbakery.dashboard.FileChunk\x1a .fontbakery.dashboard.StorageKey\"\x00(\x01\x12S\n\x0bPutExisting\x12 .fontbakery.dashboard.StorageKey\x1a .fontbakery.dashboard.StorageKey\"\x00\x32\xaa\x03\n\x08Manifest\x12H\n\x04Poke\x12&.fontbakery.dashboard.ManifestSourceId\x1a\x16.google.protobuf.Empty\"\x00\x12N\n\x03Get\x12#.fontbakery.dashboard.FamilyRequest\x1a .fontbakery.dashboard.FamilyData\"\x00\x12K\n\nGetDelayed\x12#.fontbakery.dashboard.FamilyRequest\x1a\x16.google.protobuf.Empty\"\x00\x12W\n\x04List\x12&.fontbakery.dashboard.ManifestSourceId\x1a%.fontbakery.dashboard.FamilyNamesList\"\x00\x12^\n\x10GetSourceDetails\x12#.fontbakery.dashboard.FamilyRequest\x1a#.fontbakery.dashboard.SourceDetails\"\x00\x32\xe2\x01\n\x07Reports\x12>\n\x04\x46ile\x12\x1c.fontbakery.dashboard.Report\x1a\x16.google.protobuf.Empty\"\x00\x12M\n\x05Query\x12\".fontbakery.dashboard.ReportsQuery\x1a\x1c.fontbakery.dashboard.Report\"\x00\x30\x01\x12H\n\x03Get\x12\x1f.fontbakery.dashboard.ReportIds\x1a\x1c.fontbakery.dashboard.Report\"\x00\x30\x01\x32\xcc\x03\n\x0eProcessManager\x12^\n\x10SubscribeProcess\x12\".fontbakery.dashboard.ProcessQuery\x1a\".fontbakery.dashboard.ProcessState\"\x00\x30\x01\x12V\n\nGetProcess\x12\".fontbakery.dashboard.ProcessQuery\x1a\".fontbakery.dashboard.ProcessState\"\x00\x12]\n\x07\x45xecute\x12$.fontbakery.dashboard.ProcessCommand\x1a*.fontbakery.dashboard.ProcessCommandResult\"\x00\x12Q\n\x0bInitProcess\x12\x14.google.protobuf.Any\x1a*.fontbakery.dashboard.ProcessCommandResult\"\x00\x12P\n\x10GetInitProcessUi\x12\x16.google.protobuf.Empty\x1a\".fontbakery.dashboard.ProcessState\"\x00\x32\x81\x01\n\x18\x44ispatcherProcessManager\x12\x65\n\x14SubscribeProcessList\x12&.fontbakery.dashboard.ProcessListQuery\x1a!.fontbakery.dashboard.ProcessList\"\x00\x30\x01\x32\x84\x04\n\x0b\x41uthService\x12I\n\x0bInitSession\x12\x16.google.protobuf.Empty\x1a .fontbakery.dashboard.AuthStatus\"\x00\x12\x43\n\x06Logout\x12\x1f.fontbakery.dashboard.SessionId\x1a\x16.google.protobuf.Empty\"\x00\x12W\n\tAuthorize\x12&.fontbakery.dashboard.AuthorizeRequest\x1a .fontbakery.dashboard.AuthStatus\"\x00\x12S\n\x0c\x43heckSession\x12\x1f.fontbakery.dashboard.SessionId\x1a .fontbakery.dashboard.AuthStatus\"\x00\x12\x61\n\x08GetRoles\x12,.fontbakery.dashboard.AuthorizedRolesRequest\x1a%.fontbakery.dashboard.AuthorizedRoles\"\x00\x12T\n\rGetOAuthToken\x12\x1f.fontbakery.dashboard.SessionId\x1a .fontbakery.dashboard.OAuthToken\"\x00\x32\xb6\x01\n\x10GitHubOperations\x12R\n\x13\x44ispatchPullRequest\x12!.fontbakery.dashboard.PullRequest\x1a\x16.google.protobuf.Empty\"\x00\x12N\n\tFileIssue\x12\x1b.fontbakery.dashboard.Issue\x1a\".fontbakery.dashboard.GitHubReport\"\x00\x32V\n\x0bInitWorkers\x12G\n\x04Init\x12\'.fontbakery.dashboard.WorkerDescription\x1a\x14.google.protobuf.Any\"\x00P\x03\x62\x06proto3'
   ,
   dependencies=[google_dot_protobuf_dot_any__pb2.DESCRIPTOR,google_dot_protobuf_dot_timestamp__pb2.DESCRIPTOR,google_dot_protobuf_dot_empty__pb2.DESCRIPTOR,shared__pb2.DESCRIPTOR,],
   public_dependencies=[shared__pb2.DESCRIPTOR,])
@@ -1807,6 +1807,13 @@ _WORKERJOBDESCRIPTION = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='retries', full_name='fontbakery.dashboard.WorkerJobDescription.retries', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -1820,7 +1827,7 @@ _WORKERJOBDESCRIPTION = _descriptor.Descriptor(
   oneofs=[
   ],
   serialized_start=4053,
-  serialized_end=4131,
+  serialized_end=4148,
 )
 
 
@@ -1845,6 +1852,13 @@ _COMPLETEDWORKER = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='finished_family', full_name='fontbakery.dashboard.CompletedWorker.finished_family', index=2,
+      number=3, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
@@ -1856,9 +1870,12 @@ _COMPLETEDWORKER = _descriptor.Descriptor(
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
+    _descriptor.OneofDescriptor(
+      name='finished_family_reported', full_name='fontbakery.dashboard.CompletedWorker.finished_family_reported',
+      index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=4133,
-  serialized_end=4220,
+  serialized_start=4151,
+  serialized_end=4293,
 )
 
 
@@ -1923,8 +1940,8 @@ _FONTBAKERYFINISHED = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4223,
-  serialized_end=4442,
+  serialized_start=4296,
+  serialized_end=4515,
 )
 
 
@@ -1961,8 +1978,8 @@ _GENERICSTORAGEWORKERRESULT_RESULT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4746,
-  serialized_end=4823,
+  serialized_start=4819,
+  serialized_end=4896,
 )
 
 _GENERICSTORAGEWORKERRESULT = _descriptor.Descriptor(
@@ -2033,8 +2050,8 @@ _GENERICSTORAGEWORKERRESULT = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=4445,
-  serialized_end=4823,
+  serialized_start=4518,
+  serialized_end=4896,
 )
 
 _FAMILYJOB.fields_by_name['cache_key'].message_type = _STORAGEKEY
@@ -2091,6 +2108,9 @@ _WORKERDESCRIPTION.fields_by_name['job'].message_type = google_dot_protobuf_dot_
 _WORKERDESCRIPTION.fields_by_name['process_command'].message_type = _PROCESSCOMMAND
 _WORKERJOBDESCRIPTION.fields_by_name['job'].message_type = google_dot_protobuf_dot_any__pb2._ANY
 _COMPLETEDWORKER.fields_by_name['completed_message'].message_type = google_dot_protobuf_dot_any__pb2._ANY
+_COMPLETEDWORKER.oneofs_by_name['finished_family_reported'].fields.append(
+  _COMPLETEDWORKER.fields_by_name['finished_family'])
+_COMPLETEDWORKER.fields_by_name['finished_family'].containing_oneof = _COMPLETEDWORKER.oneofs_by_name['finished_family_reported']
 _FONTBAKERYFINISHED.fields_by_name['created'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
 _FONTBAKERYFINISHED.fields_by_name['started'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
 _FONTBAKERYFINISHED.fields_by_name['finished'].message_type = google_dot_protobuf_dot_timestamp__pb2._TIMESTAMP
@@ -2423,8 +2443,8 @@ _STORAGE = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=0,
   serialized_options=None,
-  serialized_start=4826,
-  serialized_end=5064,
+  serialized_start=4899,
+  serialized_end=5485,
   methods=[
   _descriptor.MethodDescriptor(
     name='Put',
@@ -2453,6 +2473,42 @@ _STORAGE = _descriptor.ServiceDescriptor(
     output_type=_STORAGESTATUS,
     serialized_options=None,
   ),
+  _descriptor.MethodDescriptor(
+    name='GetFilesMeta',
+    full_name='fontbakery.dashboard.Storage.GetFilesMeta',
+    index=3,
+    containing_service=None,
+    input_type=_STORAGEKEY,
+    output_type=shared__pb2._FILESMETA,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='GetFilesStream',
+    full_name='fontbakery.dashboard.Storage.GetFilesStream',
+    index=4,
+    containing_service=None,
+    input_type=_STORAGEKEY,
+    output_type=shared__pb2._FILECHUNK,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='PutFilesStream',
+    full_name='fontbakery.dashboard.Storage.PutFilesStream',
+    index=5,
+    containing_service=None,
+    input_type=shared__pb2._FILECHUNK,
+    output_type=_STORAGEKEY,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='PutExisting',
+    full_name='fontbakery.dashboard.Storage.PutExisting',
+    index=6,
+    containing_service=None,
+    input_type=_STORAGEKEY,
+    output_type=_STORAGEKEY,
+    serialized_options=None,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_STORAGE)
 
@@ -2465,8 +2521,8 @@ _MANIFEST = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=1,
   serialized_options=None,
-  serialized_start=5067,
-  serialized_end=5493,
+  serialized_start=5488,
+  serialized_end=5914,
   methods=[
   _descriptor.MethodDescriptor(
     name='Poke',
@@ -2525,8 +2581,8 @@ _REPORTS = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=2,
   serialized_options=None,
-  serialized_start=5496,
-  serialized_end=5722,
+  serialized_start=5917,
+  serialized_end=6143,
   methods=[
   _descriptor.MethodDescriptor(
     name='File',
@@ -2567,8 +2623,8 @@ _PROCESSMANAGER = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=3,
   serialized_options=None,
-  serialized_start=5725,
-  serialized_end=6185,
+  serialized_start=6146,
+  serialized_end=6606,
   methods=[
   _descriptor.MethodDescriptor(
     name='SubscribeProcess',
@@ -2627,8 +2683,8 @@ _DISPATCHERPROCESSMANAGER = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=4,
   serialized_options=None,
-  serialized_start=6188,
-  serialized_end=6317,
+  serialized_start=6609,
+  serialized_end=6738,
   methods=[
   _descriptor.MethodDescriptor(
     name='SubscribeProcessList',
@@ -2651,8 +2707,8 @@ _AUTHSERVICE = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=5,
   serialized_options=None,
-  serialized_start=6320,
-  serialized_end=6836,
+  serialized_start=6741,
+  serialized_end=7257,
   methods=[
   _descriptor.MethodDescriptor(
     name='InitSession',
@@ -2720,8 +2776,8 @@ _GITHUBOPERATIONS = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=6,
   serialized_options=None,
-  serialized_start=6839,
-  serialized_end=7021,
+  serialized_start=7260,
+  serialized_end=7442,
   methods=[
   _descriptor.MethodDescriptor(
     name='DispatchPullRequest',
@@ -2753,8 +2809,8 @@ _INITWORKERS = _descriptor.ServiceDescriptor(
   file=DESCRIPTOR,
   index=7,
   serialized_options=None,
-  serialized_start=7023,
-  serialized_end=7109,
+  serialized_start=7444,
+  serialized_end=7530,
   methods=[
   _descriptor.MethodDescriptor(
     name='Init',
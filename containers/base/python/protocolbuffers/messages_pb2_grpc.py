@@ -4,6 +4,7 @@ import grpc
 from google.protobuf import any_pb2 as google_dot_protobuf_dot_any__pb2
 from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
 import messages_pb2 as messages__pb2
+import shared_pb2 as shared__pb2
 
 
 class StorageStub(object):
@@ -32,6 +33,26 @@ class StorageStub(object):
                 request_serializer=messages__pb2.StorageKey.SerializeToString,
                 response_deserializer=messages__pb2.StorageStatus.FromString,
                 )
+        self.GetFilesMeta = channel.unary_unary(
+                '/fontbakery.dashboard.Storage/GetFilesMeta',
+                request_serializer=messages__pb2.StorageKey.SerializeToString,
+                response_deserializer=shared__pb2.FilesMeta.FromString,
+                )
+        self.GetFilesStream = channel.unary_stream(
+                '/fontbakery.dashboard.Storage/GetFilesStream',
+                request_serializer=messages__pb2.StorageKey.SerializeToString,
+                response_deserializer=shared__pb2.FileChunk.FromString,
+                )
+        self.PutFilesStream = channel.stream_unary(
+                '/fontbakery.dashboard.Storage/PutFilesStream',
+                request_serializer=shared__pb2.FileChunk.SerializeToString,
+                response_deserializer=messages__pb2.StorageKey.FromString,
+                )
+        self.PutExisting = channel.unary_unary(
+                '/fontbakery.dashboard.Storage/PutExisting',
+                request_serializer=messages__pb2.StorageKey.SerializeToString,
+                response_deserializer=messages__pb2.StorageKey.FromString,
+                )
 
 
 class StorageServicer(object):
@@ -58,6 +79,38 @@ class StorageServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetFilesMeta(self, request, context):
+        """For a stored Files message: answers only the names and sizes
+        of the files, without their data.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetFilesStream(self, request, context):
+        """Like Get for a stored Files message, but the files are streamed
+        in chunks. There's no limit for the size of Files this way.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PutFilesStream(self, request_iterator, context):
+        """Like Put for one Files message, streamed in chunks.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PutExisting(self, request, context):
+        """Like Put, but without sending the data again: if data with
+        StorageKey.hash is stored, the answer has a new key for it,
+        otherwise its key is empty and the client must Put the data.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_StorageServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -76,6 +129,26 @@ def add_StorageServicer_to_server(servicer, server):
                     request_deserializer=messages__pb2.StorageKey.FromString,
                     response_serializer=messages__pb2.StorageStatus.SerializeToString,
             ),
+            'GetFilesMeta': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetFilesMeta,
+                    request_deserializer=messages__pb2.StorageKey.FromString,
+                    response_serializer=shared__pb2.FilesMeta.SerializeToString,
+            ),
+            'GetFilesStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetFilesStream,
+                    request_deserializer=messages__pb2.StorageKey.FromString,
+                    response_serializer=shared__pb2.FileChunk.SerializeToString,
+            ),
+            'PutFilesStream': grpc.stream_unary_rpc_method_handler(
+                    servicer.PutFilesStream,
+                    request_deserializer=shared__pb2.FileChunk.FromString,
+                    response_serializer=messages__pb2.StorageKey.SerializeToString,
+            ),
+            'PutExisting': grpc.unary_unary_rpc_method_handler(
+                    servicer.PutExisting,
+                    request_deserializer=messages__pb2.StorageKey.FromString,
+                    response_serializer=messages__pb2.StorageKey.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'fontbakery.dashboard.Storage', rpc_method_handlers)
@@ -136,6 +209,70 @@ class Storage(object):
             options, channel_credentials,
             call_credentials, compression, wait_for_ready, timeout, metadata)
 
+    @staticmethod
+    def GetFilesMeta(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/fontbakery.dashboard.Storage/GetFilesMeta',
+            messages__pb2.StorageKey.SerializeToString,
+            shared__pb2.FilesMeta.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def GetFilesStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(request, target, '/fontbakery.dashboard.Storage/GetFilesStream',
+            messages__pb2.StorageKey.SerializeToString,
+            shared__pb2.FileChunk.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def PutFilesStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(request_iterator, target, '/fontbakery.dashboard.Storage/PutFilesStream',
+            shared__pb2.FileChunk.SerializeToString,
+            messages__pb2.StorageKey.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def PutExisting(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(request, target, '/fontbakery.dashboard.Storage/PutExisting',
+            messages__pb2.StorageKey.SerializeToString,
+            messages__pb2.StorageKey.FromString,
+            options, channel_credentials,
+            call_credentials, compression, wait_for_ready, timeout, metadata)
+
 
 class ManifestStub(object):
     """The Manifest service
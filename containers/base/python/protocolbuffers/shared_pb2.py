@@ -18,7 +18,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   package='fontbakery.dashboard',
   syntax='proto3',
   serialized_options=None,
-  serialized_pb=b'\n\x0cshared.proto\x12\x14\x66ontbakery.dashboard\"\"\n\x04\x46ile\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"2\n\x05\x46iles\x12)\n\x05\x66iles\x18\x01 \x03(\x0b\x32\x1a.fontbakery.dashboard.Fileb\x06proto3'
+  serialized_pb=b'\n\x0cshared.proto\x12\x14\x66ontbakery.dashboard\"\"\n\x04\x46ile\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\"2\n\x05\x46iles\x12)\n\x05\x66iles\x18\x01 \x03(\x0b\x32\x1a.fontbakery.dashboard.File\"&\n\x08\x46ileMeta\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04size\x18\x02 \x01(\x04\":\n\tFilesMeta\x12-\n\x05\x66iles\x18\x01 \x03(\x0b\x32\x1e.fontbakery.dashboard.FileMeta\"\'\n\tFileChunk\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\x62\x06proto3'
 )
 
 
@@ -92,9 +92,120 @@ _FILES = _descriptor.Descriptor(
   serialized_end=124,
 )
 
+
+_FILEMETA = _descriptor.Descriptor(
+  name='FileMeta',
+  full_name='fontbakery.dashboard.FileMeta',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='fontbakery.dashboard.FileMeta.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='size', full_name='fontbakery.dashboard.FileMeta.size', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=126,
+  serialized_end=164,
+)
+
+
+_FILESMETA = _descriptor.Descriptor(
+  name='FilesMeta',
+  full_name='fontbakery.dashboard.FilesMeta',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='files', full_name='fontbakery.dashboard.FilesMeta.files', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=166,
+  serialized_end=224,
+)
+
+
+_FILECHUNK = _descriptor.Descriptor(
+  name='FileChunk',
+  full_name='fontbakery.dashboard.FileChunk',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='fontbakery.dashboard.FileChunk.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='data', full_name='fontbakery.dashboard.FileChunk.data', index=1,
+      number=2, type=12, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"",
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=226,
+  serialized_end=265,
+)
+
 _FILES.fields_by_name['files'].message_type = _FILE
+_FILESMETA.fields_by_name['files'].message_type = _FILEMETA
 DESCRIPTOR.message_types_by_name['File'] = _FILE
 DESCRIPTOR.message_types_by_name['Files'] = _FILES
+DESCRIPTOR.message_types_by_name['FileMeta'] = _FILEMETA
+DESCRIPTOR.message_types_by_name['FilesMeta'] = _FILESMETA
+DESCRIPTOR.message_types_by_name['FileChunk'] = _FILECHUNK
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 File = _reflection.GeneratedProtocolMessageType('File', (_message.Message,), {
@@ -111,5 +222,26 @@ Files = _reflection.GeneratedProtocolMessageType('Files', (_message.Message,), {
   })
 _sym_db.RegisterMessage(Files)
 
+FileMeta = _reflection.GeneratedProtocolMessageType('FileMeta', (_message.Message,), {
+  'DESCRIPTOR' : _FILEMETA,
+  '__module__' : 'shared_pb2'
+  # @@protoc_insertion_point(class_scope:fontbakery.dashboard.FileMeta)
+  })
+_sym_db.RegisterMessage(FileMeta)
+
+FilesMeta = _reflection.GeneratedProtocolMessageType('FilesMeta', (_message.Message,), {
+  'DESCRIPTOR' : _FILESMETA,
+  '__module__' : 'shared_pb2'
+  # @@protoc_insertion_point(class_scope:fontbakery.dashboard.FilesMeta)
+  })
+_sym_db.RegisterMessage(FilesMeta)
+
+FileChunk = _reflection.GeneratedProtocolMessageType('FileChunk', (_message.Message,), {
+  'DESCRIPTOR' : _FILECHUNK,
+  '__module__' : 'shared_pb2'
+  # @@protoc_insertion_point(class_scope:fontbakery.dashboard.FileChunk)
+  })
+_sym_db.RegisterMessage(FileChunk)
+
 
 # @@protoc_insertion_point(module_scope)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+"""
+Run in containers/base/python:
+$ python -m unittest discover tests
+"""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import sys
+import unittest
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# like PYTHONPATH in the Dockerfile
+sys.path.insert(0, os.path.join(PYTHON_DIR, 'protocolbuffers'))
+sys.path.insert(0, PYTHON_DIR)
+
+from worker.fontbakery import (
+                                CheckResultCache
+                              , get_fontbakery
+                              , _REMOTE_CHECKS
+                              , _REMOTE_CONDITIONS
+                              )
+
+FAMILY_DIR = os.path.join(PYTHON_DIR, 'debug_vollkorn', 'before')
+
+# These reach the network, their results can change without a change
+# of the files.
+NETWORK_CHECKS = (
+    'com.google.fonts/check/description/broken_links'
+  , 'com.google.fonts/check/metadata/broken_links'
+  , 'com.google.fonts/check/metadata/profiles_csv'
+  , 'com.google.fonts/check/fontdata_namecheck'
+  , 'com.google.fonts/check/fontbakery_version'
+  , 'com.google.fonts/check/metadata/listed_on_gfonts'
+  , 'com.google.fonts/check/version_bump'
+  , 'com.google.fonts/check/production_glyphs_similarity'
+  , 'com.google.fonts/check/vertical_metrics_regressions'
+)
+
+
+class TestRemoteChecksAreNotCached(unittest.TestCase):
+  @classmethod
+  def setUpClass(cls):
+    cls.fonts = sorted(os.path.join(FAMILY_DIR, name)
+                                for name in os.listdir(FAMILY_DIR)
+                                if name.endswith('.ttf'))
+    runner, profile = get_fontbakery(cls.fonts)
+    cls.profile = profile
+    cls.order = list(profile.serialize_order(runner.order))
+    cls.checks = {key: check for key, (_, check, _)
+                        in zip(cls.order, profile.deserialize_order(cls.order))}
+    # get_ids doesn't use the database
+    cls.ids = CheckResultCache(None, 1).get_ids(FAMILY_DIR, cls.fonts
+                                                          , cls.order)
+
+  def _keys_of(self, check_id):
+    return [key for key, check in self.checks.items() if check.id == check_id]
+
+  def test_network_checks_are_not_cached(self):
+    tested = 0
+    for check_id in NETWORK_CHECKS:
+      keys = self._keys_of(check_id)
+      tested += len(keys)
+      for key in keys:
+        self.assertFalse(key in self.ids, check_id)
+    # the profile must contain some of these, otherwise this tests nothing
+    self.assertTrue(tested)
+
+  def test_network_checks_are_known(self):
+    for check_id in NETWORK_CHECKS:
+      if not self._keys_of(check_id):
+        # not in this version of the profile
+        continue
+      check = self.checks[self._keys_of(check_id)[0]]
+      dependencies = self.profile.get_deep_check_dependencies(check)
+      self.assertTrue(check_id in _REMOTE_CHECKS
+                      or dependencies & _REMOTE_CONDITIONS, check_id)
+
+  def test_local_checks_are_cached(self):
+    self.assertTrue(self.ids)
+    self.assertTrue(self._keys_of('com.google.fonts/check/family/panose_proportion'))
+    for key in self._keys_of('com.google.fonts/check/family/panose_proportion'):
+      self.assertIn(key, self.ids)
+
+
+if __name__ == '__main__':
+  unittest.main()
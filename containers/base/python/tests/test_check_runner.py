@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+"""
+Run in containers/base/python:
+$ python -m unittest discover tests
+"""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import sys
+import queue
+import unittest
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# like PYTHONPATH in the Dockerfile
+sys.path.insert(0, os.path.join(PYTHON_DIR, 'protocolbuffers'))
+sys.path.insert(0, PYTHON_DIR)
+
+from worker.fontbakery import (
+                                get_fontbakery
+                              , _run_checks
+                              , _REMOTE_CHECKS
+                              , _REMOTE_CONDITIONS
+                              )
+
+FONT = os.path.join(PYTHON_DIR, 'debug_vollkorn', 'before'
+                                            , 'Vollkorn-Regular.ttf')
+
+
+class TestDashboardCheckRunner(unittest.TestCase):
+  def test_runs_a_check_with_conditions(self):
+    runner, profile = get_fontbakery([FONT])
+    order = profile.serialize_order(runner.order)
+    for key, (_, check, iterargs) in zip(order, runner.order):
+      dependencies = profile.get_deep_check_dependencies(check)
+      if check.id in _REMOTE_CHECKS or dependencies & _REMOTE_CONDITIONS:
+        continue
+      if check.conditions and iterargs:
+        break
+    else:
+      self.fail('No local check with conditions in the profile.')
+
+    result_queue = queue.Queue()
+    _run_checks([FONT], [key], 'test', result_queue)
+    results = dict(iter(result_queue.get, None))
+    self.assertEqual(list(results), [key])
+    statuses = results[key]['statuses']
+    # an error of the runner is reported as an ERROR of the check
+    self.assertNotEqual(results[key]['result'], 'ERROR', statuses)
+
+  def test_runners_share_the_order(self):
+    runner, _ = get_fontbakery([FONT])
+    other, _ = get_fontbakery([FONT])
+    self.assertIs(runner.order, other.order)
+
+
+if __name__ == '__main__':
+  unittest.main()
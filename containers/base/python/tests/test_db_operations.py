@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Run in containers/base/python:
+$ python -m unittest discover tests
+
+These need a RethinkDB server, they are skipped otherwise:
+$ FONTBAKERY_TEST_RETHINKDB=localhost:28015 python -m unittest discover tests
+"""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import sys
+import uuid
+import unittest
+from datetime import datetime
+
+import pytz
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# like PYTHONPATH in the Dockerfile
+sys.path.insert(0, os.path.join(PYTHON_DIR, 'protocolbuffers'))
+sys.path.insert(0, PYTHON_DIR)
+
+from rethinkdb import RethinkDB
+from worker.fontbakery import DBOperations, RDB_FAMILYTESTS
+from protocolbuffers.messages_pb2 import FamilyJob
+
+RETHINKDB = os.environ.get('FONTBAKERY_TEST_RETHINKDB', None)
+
+
+@unittest.skipUnless(RETHINKDB, 'FONTBAKERY_TEST_RETHINKDB is not set.')
+class TestDBOperations(unittest.TestCase):
+  def setUp(self):
+    host, _, port = RETHINKDB.partition(':')
+    self.r = r = RethinkDB()
+    self.conn = r.connect(host=host, port=int(port or 28015))
+    self.db_name = 'fontbakery_test_{}'.format(uuid.uuid4().hex)
+    r.db_create(self.db_name).run(self.conn)
+    r.db(self.db_name).table_create(RDB_FAMILYTESTS).run(self.conn)
+    self.docid = 'family'
+
+  def tearDown(self):
+    self.r.db_drop(self.db_name).run(self.conn)
+    self.conn.close()
+
+  def _insert(self, doc):
+    doc['id'] = self.docid
+    self.r.db(self.db_name).table(RDB_FAMILYTESTS).insert(doc).run(self.conn)
+
+  def _get(self):
+    return self.r.db(self.db_name).table(RDB_FAMILYTESTS).get(self.docid
+                                                          ).run(self.conn)
+
+  def _dbOps(self, jobid=None):
+    return DBOperations((self.r, self.conn, self.db_name, RDB_FAMILYTESTS)
+                                , FamilyJob(docid=self.docid, jobid=jobid))
+
+  def _finish_job(self, jobid):
+    return self._dbOps(jobid).finish_job({
+                                  'finished': datetime.now(pytz.utc)})
+
+  def test_result_counters(self):
+    self._insert({'tests': {}, 'results': {}})
+    dbOps = self._dbOps('0')
+    dbOps.insert_checks({'a': {'result': 'PASS'}, 'b': {'result': 'FAIL'}})
+    self.assertEqual(self._get()['results'], {'PASS': 1, 'FAIL': 1})
+    # a new result replaces the previous one of the same key
+    dbOps.insert_checks({'b': {'result': 'PASS'}})
+    self.assertEqual(self._get()['results'], {'PASS': 2})
+    # a replayed batch doesn't count twice
+    dbOps.insert_checks({'b': {'result': 'PASS'}})
+    self.assertEqual(self._get()['results'], {'PASS': 2})
+    # without a result there's nothing to count
+    dbOps.insert_checks({'c': {'statuses': []}})
+    self.assertEqual(self._get()['results'], {'PASS': 2})
+
+  def test_finish_job_counts_down(self):
+    self._insert({'jobs': {'0': {}, '1': {}}, 'pending_jobs': 2})
+    self.assertFalse(self._finish_job('0'))
+    # a redelivered job is not counted again
+    self.assertFalse(self._finish_job('0'))
+    doc = self._get()
+    self.assertEqual(doc['pending_jobs'], 1)
+    self.assertNotIn('finished', doc)
+    self.assertTrue(self._finish_job('1'))
+    doc = self._get()
+    self.assertEqual(doc['pending_jobs'], 0)
+    self.assertEqual(doc['finished'], doc['jobs']['1']['finished'])
+    # the family is finished only once
+    self.assertFalse(self._finish_job('1'))
+
+  def test_finish_job_without_pending_jobs(self):
+    # documents from before 'pending_jobs'
+    self._insert({'jobs': {'0': {'finished': datetime.now(pytz.utc)}
+                         , '1': {}}})
+    self.assertTrue(self._finish_job('1'))
+    self.assertEqual(self._get()['pending_jobs'], 0)
+
+  def test_finish_family_after_distributor_failure(self):
+    self._insert({'jobs': {'0': {}}, 'pending_jobs': 1})
+    self.assertTrue(self._dbOps().finish_family({
+                                      'finished': datetime.now(pytz.utc)
+                                    , 'exception': 'failed'}))
+    # the family is finished already
+    self.assertFalse(self._finish_job('0'))
+
+
+if __name__ == '__main__':
+  unittest.main()
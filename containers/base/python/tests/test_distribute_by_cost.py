@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""
+Run in containers/base/python:
+$ python -m unittest discover tests
+"""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import sys
+import unittest
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# like PYTHONPATH in the Dockerfile
+sys.path.insert(0, os.path.join(PYTHON_DIR, 'protocolbuffers'))
+sys.path.insert(0, PYTHON_DIR)
+
+from worker.fontbakery import distribute_by_cost
+
+
+class TestDistributeByCost(unittest.TestCase):
+  def test_all_items_once_in_order(self):
+    items = list('abcdefghij')
+    costs = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3]
+    bins = distribute_by_cost(items, costs, 3)
+    self.assertEqual(len(bins), 3)
+    self.assertEqual(sorted(item for bin_ in bins for item in bin_), items)
+    for bin_ in bins:
+      self.assertEqual(bin_, sorted(bin_))
+
+  def test_balanced(self):
+    items = list(range(8))
+    costs = [10, 1, 1, 1, 1, 1, 1, 4]
+    bins = distribute_by_cost(items, costs, 2)
+    # the expensive check gets a job of its own, the others share one
+    self.assertEqual(bins, [[0], [1, 2, 3, 4, 5, 6, 7]])
+
+  def test_equal_costs(self):
+    bins = distribute_by_cost(list(range(9)), [1] * 9, 3)
+    self.assertEqual([len(bin_) for bin_ in bins], [3, 3, 3])
+
+  def test_no_empty_bins(self):
+    self.assertEqual(distribute_by_cost(['a', 'b'], [1, 2], 4)
+                   , [['b'], ['a']])
+    self.assertEqual(distribute_by_cost([], [], 3), [])
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""
+Run in containers/base/python:
+$ python -m unittest discover tests
+"""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import sys
+import tempfile
+import unittest
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# like PYTHONPATH in the Dockerfile
+sys.path.insert(0, os.path.join(PYTHON_DIR, 'protocolbuffers'))
+sys.path.insert(0, PYTHON_DIR)
+
+from worker.filecache import FileCache
+from protocolbuffers.messages_pb2 import File, StorageKey
+
+
+class Storage(object):
+  """Has the `get_files` of StorageClient, digest => [(name, data)]."""
+  def __init__(self, files):
+    self._files = files
+    self.downloads = []
+
+  def get_files(self, storage_key):
+    digest = storage_key.hash or storage_key.key.split(':')[0]
+    self.downloads.append(digest)
+    for name, data in self._files[digest]:
+      yield File(name=name, data=data)
+
+
+A = 'a' * 64
+B = 'b' * 64
+C = 'c' * 64
+
+
+class TestFileCache(unittest.TestCase):
+  def setUp(self):
+    self._tmp = tempfile.TemporaryDirectory()
+    self.directory = os.path.join(self._tmp.name, 'cache')
+    self.storage = Storage({
+        A: [('Font-Regular.ttf', b'aaaaaa')]
+      , B: [('Font-Bold.ttf', b'bbbbbb')]
+      , C: [('Font-Italic.ttf', b'ccc'), ('Font-BoldItalic.ttf', b'ccc')]
+    })
+
+  def tearDown(self):
+    self._tmp.cleanup()
+
+  def _use(self, cache, digest):
+    entry = cache.acquire(StorageKey(key=digest + ':1'), self.storage)
+    cache.release(entry)
+    return entry
+
+  def _cached(self):
+    return sorted(name for name in os.listdir(self.directory))
+
+  def test_downloads_once(self):
+    cache = FileCache(self.directory, 100)
+    entry = self._use(cache, A)
+    self._use(cache, A)
+    self.assertEqual(self.storage.downloads, [A])
+    target = os.path.join(self._tmp.name, 'Font-Regular.ttf')
+    entry.link('Font-Regular.ttf', target)
+    with open(target, 'rb') as f:
+      self.assertEqual(f.read(), b'aaaaaa')
+
+  def test_evicts_least_recently_used(self):
+    cache = FileCache(self.directory, 12)
+    self._use(cache, A)
+    self._use(cache, B)
+    self._use(cache, A)
+    self._use(cache, C)
+    self.assertEqual(self._cached(), [A, C])
+
+  def test_pinned_entries_are_not_evicted(self):
+    cache = FileCache(self.directory, 6)
+    entry = cache.acquire(StorageKey(hash=A), self.storage)
+    self._use(cache, B)
+    self.assertEqual(self._cached(), [A])
+    # still linkable while pinned
+    entry.link('Font-Regular.ttf', os.path.join(self._tmp.name, 'Font.ttf'))
+    cache.release(entry)
+    self._use(cache, B)
+    self.assertEqual(self._cached(), [B])
+
+  def test_failed_validation_caches_nothing(self):
+    cache = FileCache(self.directory, 100)
+    def validate(jobFile):
+      raise ValueError(jobFile.name)
+    with self.assertRaises(ValueError):
+      cache.acquire(StorageKey(hash=A), self.storage, validate)
+    self.assertEqual(self._cached(), [])
+    self._use(cache, A)
+    self.assertEqual(self.storage.downloads, [A, A])
+
+  def test_entries_survive_a_restart(self):
+    self._use(FileCache(self.directory, 100), A)
+    self._use(FileCache(self.directory, 100), A)
+    self.assertEqual(self.storage.downloads, [A])
+
+  def test_keys_without_hash(self):
+    cache = FileCache(self.directory, 100)
+    self.assertIsNone(cache.acquire(StorageKey(key='not-a-hash')
+                                                        , self.storage))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+"""
+Run in containers/base/python:
+$ python -m unittest discover tests
+"""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import sys
+import time
+import threading
+import unittest
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# like PYTHONPATH in the Dockerfile
+sys.path.insert(0, os.path.join(PYTHON_DIR, 'protocolbuffers'))
+sys.path.insert(0, PYTHON_DIR)
+
+from worker.worker_base import WorkerError
+from worker.fontbakery import ResultsWriter, DashbordWorkerReporter
+
+
+class DBOperations(object):
+  """Records the writes, the first one waits until `release` is set."""
+  def __init__(self, error=None):
+    self.writes = []
+    self.started = threading.Event()
+    self.release = threading.Event()
+    self._error = error
+
+  def insert_checks(self, check_results):
+    self.started.set()
+    self.release.wait(5)
+    if self._error is not None:
+      raise self._error
+    self.writes.append(check_results)
+
+
+class TestResultsWriter(unittest.TestCase):
+  def test_pending_batches_are_merged(self):
+    dbOps = DBOperations()
+    writer = ResultsWriter(dbOps)
+    writer.insert_checks({'a': 1})
+    dbOps.started.wait(5)
+    # the first write is running, these are pending
+    writer.insert_checks({'b': 1, 'c': 1})
+    writer.insert_checks({'b': 2})
+    dbOps.release.set()
+    writer.close()
+    self.assertEqual(dbOps.writes, [{'a': 1}, {'b': 2, 'c': 1}])
+
+  def test_maxsize_blocks(self):
+    dbOps = DBOperations()
+    writer = ResultsWriter(dbOps, maxsize=1)
+    writer.insert_checks({'a': 1})
+    dbOps.started.wait(5)
+    writer.insert_checks({'b': 1})
+    blocked = threading.Thread(target=writer.insert_checks, args=({'c': 1}, ))
+    blocked.start()
+    blocked.join(0.1)
+    self.assertTrue(blocked.is_alive())
+    dbOps.release.set()
+    blocked.join(5)
+    writer.close()
+    self.assertEqual(sorted(key for write in dbOps.writes for key in write)
+                   , ['a', 'b', 'c'])
+
+  def test_error_is_reraised(self):
+    dbOps = DBOperations(error=ValueError('write failed'))
+    dbOps.release.set()
+    writer = ResultsWriter(dbOps)
+    writer.insert_checks({'a': 1})
+    with self.assertRaises(WorkerError) as context:
+      writer.close()
+    self.assertIsInstance(context.exception.__cause__, ValueError)
+    with self.assertRaises(WorkerError):
+      writer.insert_checks({'b': 1})
+
+
+class TestStaleResults(unittest.TestCase):
+  def test_stale_results_are_written(self):
+    dbOps = DBOperations()
+    dbOps.release.set()
+    writer = ResultsWriter(dbOps)
+    reporter = DashbordWorkerReporter(writer, '0', None, None
+                                , ticks_to_flush=10, flush_interval_ms=50)
+    writer.watch(reporter.take_stale, 0.01)
+    reporter._save_result('a', {'result': 'PASS'})
+    # not flushed by the reporter, the next check didn't end yet
+    self.assertEqual(dbOps.writes, [])
+    deadline = time.monotonic() + 5
+    while not dbOps.writes and time.monotonic() < deadline:
+      time.sleep(0.01)
+    self.assertEqual(dbOps.writes, [{'a': {'result': 'PASS'}}])
+    # taken, the reporter doesn't flush it again
+    reporter.flush()
+    writer.close()
+    self.assertEqual(len(dbOps.writes), 1)
+
+  def test_fresh_results_are_not_taken(self):
+    reporter = DashbordWorkerReporter(None, '0', None, None
+                                , ticks_to_flush=10, flush_interval_ms=60000)
+    reporter._save_result('a', {'result': 'PASS'})
+    self.assertIsNone(reporter.take_stale())
+
+
+if __name__ == '__main__':
+  unittest.main()
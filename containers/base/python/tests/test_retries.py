@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+"""
+Run in containers/base/python:
+$ python -m unittest discover tests
+"""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import sys
+import unittest
+import importlib.util
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# like PYTHONPATH in the Dockerfile
+sys.path.insert(0, os.path.join(PYTHON_DIR, 'protocolbuffers'))
+sys.path.insert(0, PYTHON_DIR)
+
+from protocolbuffers.messages_pb2 import WorkerJobDescription
+
+# not importable by name, because of the dash
+_spec = importlib.util.spec_from_file_location('worker_launcher'
+                              , os.path.join(PYTHON_DIR, 'worker-launcher.py'))
+worker_launcher = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(worker_launcher)
+Retries = worker_launcher.Retries
+
+
+class Channel(object):
+  def __init__(self):
+    self.queues = {}
+    self.published = []
+
+  def queue_declare(self, queue, durable=False, arguments=None):
+    self.queues[queue] = arguments
+
+  def basic_publish(self, exchange, routing_key, body, properties=None):
+    self.published.append((routing_key, body))
+
+
+class Connection(object):
+  def __init__(self):
+    self.callbacks = []
+
+  def add_callback_threadsafe(self, callback):
+    self.callbacks.append(callback)
+
+
+def job_body(retries=0):
+  return WorkerJobDescription(worker_name='diffenator'
+                            , retries=retries).SerializeToString()
+
+
+class TestRetries(unittest.TestCase):
+  def setUp(self):
+    self.channel = Channel()
+    self.retries = Retries(self.channel, 'fontbakery-worker-diffenator'
+                                                              , 3, 1000)
+    self.retries.declare()
+
+  def test_declare(self):
+    self.assertEqual(sorted(self.channel.queues), [
+        'fontbakery-worker-diffenator-dead-letter'
+      , 'fontbakery-worker-diffenator-delay-1000'
+      , 'fontbakery-worker-diffenator-delay-2000'
+      , 'fontbakery-worker-diffenator-delay-4000'
+    ])
+    # expired messages go back into the worker queue
+    arguments = self.channel.queues['fontbakery-worker-diffenator-delay-2000']
+    self.assertEqual(arguments, {
+        'x-message-ttl': 2000
+      , 'x-dead-letter-exchange': ''
+      , 'x-dead-letter-routing-key': 'fontbakery-worker-diffenator'
+    })
+
+  def test_delay_doubles(self):
+    for retries in range(3):
+      self.retries.failed(job_body(retries))
+    self.assertEqual([queue for queue, _ in self.channel.published], [
+        'fontbakery-worker-diffenator-delay-1000'
+      , 'fontbakery-worker-diffenator-delay-2000'
+      , 'fontbakery-worker-diffenator-delay-4000'
+    ])
+    _, body = self.channel.published[-1]
+    self.assertEqual(WorkerJobDescription.FromString(body).retries, 3)
+
+  def test_dead_letter(self):
+    body = job_body(3)
+    self.assertFalse(self.retries.will_retry(3))
+    self.retries.failed(body)
+    # unchanged, to be inspected manually
+    self.assertEqual(self.channel.published
+                   , [('fontbakery-worker-diffenator-dead-letter', body)])
+
+  def test_unparsable(self):
+    self.retries.failed(b'\xff')
+    self.assertEqual(self.channel.published
+                   , [('fontbakery-worker-diffenator-dead-letter', b'\xff')])
+
+  def test_publishes_in_the_connection_thread(self):
+    connection = Connection()
+    retries = Retries(self.channel, 'fontbakery-worker-diffenator', 3, 1000
+                                                                , connection)
+    self.assertTrue(retries.will_retry(0))
+    retries.failed(job_body())
+    self.assertEqual(self.channel.published, [])
+    for callback in connection.callbacks:
+      callback()
+    self.assertEqual(len(self.channel.published), 1)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+"""
+Run in containers/base/python:
+$ python -m unittest discover tests
+"""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import sys
+import time
+import queue
+import threading
+import unittest
+from concurrent.futures import Future
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# like PYTHONPATH in the Dockerfile
+sys.path.insert(0, os.path.join(PYTHON_DIR, 'protocolbuffers'))
+sys.path.insert(0, PYTHON_DIR)
+
+import grpc
+from worker.storageclient import (
+                                   StorageClient
+                                 , CircuitBreaker
+                                 , MissingAnswers
+                                 , IdleTimeoutExceeded
+                                 , RetriesExceeded
+                                 )
+from protocolbuffers.messages_pb2 import (
+                                           Files
+                                         , FilesMeta
+                                         , FileChunk
+                                         , StorageKey
+                                         )
+
+
+class UnaryMethod(object):
+  """Like a unary grpc method, answers after the next of `delays`."""
+  def __init__(self, delays, answer):
+    self._delays = list(delays)
+    self._answer = answer
+    self.calls = 0
+
+  def future(self, request, timeout=None):
+    self.calls += 1
+    future = Future()
+    delay = self._delays.pop(0)
+    def answer():
+      time.sleep(delay)
+      if future.set_running_or_notify_cancel():
+        future.set_result(self._answer)
+    threading.Thread(target=answer, daemon=True).start()
+    return future
+
+
+class Cancelled(grpc.RpcError):
+  def code(self):
+    return grpc.StatusCode.CANCELLED
+
+
+class Unavailable(grpc.RpcError):
+  def code(self):
+    return grpc.StatusCode.UNAVAILABLE
+
+
+class FilesStream(object):
+  """Like the answer of GetFilesStream, breaks after `break_after` chunks."""
+  def __init__(self, chunks, break_after=None):
+    self._chunks = chunks
+    self._break_after = break_after
+
+  def cancel(self):
+    pass
+
+  def __iter__(self):
+    for index, chunk in enumerate(self._chunks):
+      if index == self._break_after:
+        raise Unavailable()
+      yield chunk
+
+
+class PutStream(object):
+  """
+  Like the answers of the Put stream, the server reads the requests in
+  a thread of its own. It answers all requests in reverse order once
+  `batch` are read, except those in `drop`.
+  """
+  END = object()
+
+  def __init__(self, requests, batch=1, drop=()):
+    self.read = 0
+    self._answers = queue.Queue()
+    self._batch = batch
+    self._drop = set(drop)
+    threading.Thread(target=self._serve, args=(requests, ), daemon=True
+                                                                ).start()
+
+  def _serve(self, requests):
+    pending = []
+    def answer():
+      for request in reversed(pending):
+        self._answers.put(StorageKey(key='key-' + request.clientid
+                                   , clientid=request.clientid))
+      del pending[:]
+    for request in requests:
+      self.read += 1
+      if request.clientid not in self._drop:
+        pending.append(request)
+      if len(pending) == self._batch:
+        answer()
+    answer()
+    self._answers.put(self.END)
+
+  def cancel(self):
+    self._answers.put(Cancelled())
+
+  def __iter__(self):
+    while True:
+      answer = self._answers.get()
+      if answer is self.END:
+        return
+      if isinstance(answer, Exception):
+        raise answer
+      yield answer
+
+
+class Stub(object):
+  pass
+
+
+def make_client(**kwds):
+  client = StorageClient('localhost', 0, Files, **kwds)
+  client._client = Stub()
+  # not the one shared by all clients of the endpoint
+  client._breaker = CircuitBreaker('test')
+  return client
+
+
+class TestHedging(unittest.TestCase):
+  def test_get_files_meta_is_hedged(self):
+    client = make_client(hedge_percentile=50)
+    latencies = client._latencies['get_files_meta']
+    for _ in range(20):
+      latencies.add(0.01)
+    answer = FilesMeta()
+    # the first request is slow, the hedge answers
+    client._client.GetFilesMeta = UnaryMethod([0.5, 0.01], answer)
+    started = time.monotonic()
+    self.assertEqual(client.get_files_meta(StorageKey(key='a')), answer)
+    self.assertLess(time.monotonic() - started, 0.3)
+    self.assertEqual(client._client.GetFilesMeta.calls, 2)
+
+  def test_all_completed_requests_are_recorded(self):
+    client = make_client(hedge_percentile=50)
+    latencies = client._latencies['get_files_meta']
+    for _ in range(20):
+      latencies.add(0.01)
+    client._client.GetFilesMeta = UnaryMethod([0.2, 0.01], FilesMeta())
+    client.get_files_meta(StorageKey(key='a'))
+    # the first request is not cancelled, its latency counts as well
+    time.sleep(0.4)
+    self.assertGreaterEqual(max(latencies._latencies), 0.2)
+    self.assertEqual(len(latencies._latencies), 22)
+
+  def test_no_hedge_without_samples(self):
+    client = make_client(hedge_percentile=50)
+    client._client.GetFilesMeta = UnaryMethod([0.05], FilesMeta())
+    client.get_files_meta(StorageKey(key='a'))
+    self.assertEqual(client._client.GetFilesMeta.calls, 1)
+
+
+class TestPut(unittest.TestCase):
+  def put(self, client, count, **kwds):
+    messages = (StorageKey(key=str(index)) for index in range(count))
+    return [storageKey.key for storageKey in client.put(messages, **kwds)]
+
+  def test_answers_in_order(self):
+    client = make_client()
+    client._client.Put = lambda requests, timeout: PutStream(requests
+                                                                , batch=3)
+    self.assertEqual(self.put(client, 7, window=4)
+                   , ['key-{}'.format(index) for index in range(7)])
+
+  def test_window(self):
+    client = make_client(idle_timeout=0.2)
+    streams = []
+    def put(requests, timeout):
+      # answers only after all messages are read
+      streams.append(PutStream(requests, batch=10))
+      return streams[0]
+    client._client.Put = put
+    with self.assertRaises(IdleTimeoutExceeded):
+      self.put(client, 10, window=3)
+    self.assertEqual(streams[0].read, 3)
+
+  def test_dropped_answer(self):
+    client = make_client(idle_timeout=5)
+    client._client.Put = lambda requests, timeout: PutStream(requests
+                                                            , drop={'2'})
+    for ensure_answers_in_order in (True, False):
+      started = time.monotonic()
+      with self.assertRaisesRegex(MissingAnswers, '5 answers for 6'):
+        # a dropped answer doesn't block the window of 2
+        self.put(client, 6, window=2
+                          , ensure_answers_in_order=ensure_answers_in_order)
+      self.assertLess(time.monotonic() - started, 1)
+
+
+class TestGetFiles(unittest.TestCase):
+  CHUNKS = [
+      FileChunk(name='a.ttf', data=b'a1'), FileChunk(data=b'a2')
+    , FileChunk(name='b.ttf', data=b'b1'), FileChunk(data=b'b2')
+    , FileChunk(name='c.ttf', data=b'c1')
+  ]
+
+  def get_files(self, client):
+    return [(jobFile.name, jobFile.data)
+              for jobFile in client.get_files(StorageKey(key='a'))]
+
+  def test_resumes_after_the_yielded_files(self):
+    client = make_client()
+    streams = [FilesStream(self.CHUNKS, break_after=3)
+             , FilesStream(self.CHUNKS, break_after=4)
+             , FilesStream(self.CHUNKS)]
+    client._client.GetFilesStream = lambda storageKey, timeout: \
+                                                          streams.pop(0)
+    # each file once and complete, though all streams start at the
+    # beginning and the second one breaks within the last file
+    self.assertEqual(self.get_files(client), [('a.ttf', b'a1a2')
+                                            , ('b.ttf', b'b1b2')
+                                            , ('c.ttf', b'c1')])
+    self.assertEqual(streams, [])
+
+  def test_retries_exceeded(self):
+    client = make_client()
+    client._client.GetFilesStream = lambda storageKey, timeout: \
+                                        FilesStream(self.CHUNKS, break_after=0)
+    with self.assertRaises(RetriesExceeded):
+      self.get_files(client)
+
+
+if __name__ == '__main__':
+  unittest.main()
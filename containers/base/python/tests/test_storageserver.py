@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+Run in containers/base/python:
+$ python -m unittest discover tests
+"""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import sys
+import socket
+import tempfile
+import unittest
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# like PYTHONPATH in the Dockerfile
+sys.path.insert(0, os.path.join(PYTHON_DIR, 'protocolbuffers'))
+sys.path.insert(0, PYTHON_DIR)
+
+import grpc
+from worker.storageserver import serve, CHUNK_SIZE
+from worker.storageclient import StorageClient
+from protocolbuffers.messages_pb2 import (
+                                           File
+                                         , Files
+                                         , StorageItem
+                                         , StorageKey
+                                         )
+
+
+def free_port():
+  with socket.socket() as s:
+    s.bind(('localhost', 0))
+    return s.getsockname()[1]
+
+
+def make_files(*names):
+  return Files(files=[File(name=name, data=name.encode('utf-8') * 3)
+                                                        for name in names])
+
+
+class TestMemoryStorage(unittest.TestCase):
+  data_dir = None
+
+  def setUp(self):
+    self.port = free_port()
+    self.server, self.servicer = serve(self.port, self.data_dir)
+    self.client = StorageClient('localhost', self.port, Files)
+
+  def tearDown(self):
+    self.server.stop(None)
+
+  def test_put_and_get(self):
+    messages = [make_files('a.ttf'), make_files('b.ttf', 'c.ttf')]
+    storageKeys = list(self.client.put(messages))
+    self.assertEqual([self.client.get(storageKey)
+                                    for storageKey in storageKeys], messages)
+
+  def test_same_data_new_instance(self):
+    first, second = self.client.put([make_files('a.ttf')] * 2)
+    self.assertEqual(first.hash, second.hash)
+    self.assertNotEqual(first.key, second.key)
+
+  def test_files_stream(self):
+    # the server sends it in more than one chunk
+    big = File(name='big.ttf', data=os.urandom(CHUNK_SIZE * 2 + 10))
+    storageKey = self.client.put_files([big, File(name='empty.ttf')]
+                                                  , chunk_size=CHUNK_SIZE // 3)
+    meta = self.client.get_files_meta(storageKey)
+    self.assertEqual([(f.name, f.size) for f in meta.files]
+                   , [('big.ttf', len(big.data)), ('empty.ttf', 0)])
+    self.assertEqual(list(self.client.get_files(storageKey))
+                   , [big, File(name='empty.ttf')])
+
+  def test_put_existing(self):
+    storageKey, = self.client.put([make_files('a.ttf')])
+    storage_item = StorageItem()
+    storage_item.payload.Pack(make_files('a.ttf'))
+    existing = self.client.put_existing(storage_item)
+    self.assertEqual(existing.hash, storageKey.hash)
+    self.assertNotEqual(existing.key, storageKey.key)
+    storage_item.payload.Pack(make_files('b.ttf'))
+    self.assertIsNone(self.client.put_existing(storage_item))
+
+  def test_purge(self):
+    first, second = self.client.put([make_files('a.ttf')] * 2)
+    status = self.client._client.Purge(first)
+    self.assertEqual(status.instances, 1)
+    # the other instance is still there
+    self.assertEqual(self.client.get(second), make_files('a.ttf'))
+    with self.assertRaises(grpc.RpcError) as context:
+      self.client.get(first)
+    self.assertEqual(context.exception.code(), grpc.StatusCode.NOT_FOUND)
+    self.assertEqual(self.client._client.Purge(second).instances, 0)
+    with self.assertRaises(grpc.RpcError):
+      self.client.get(second)
+
+  def test_force_purge(self):
+    first, second = self.client.put([make_files('a.ttf')] * 2)
+    self.client._client.Purge(StorageKey(key=first.key, force=True))
+    with self.assertRaises(grpc.RpcError):
+      self.client.get(second)
+
+  def test_counters(self):
+    storageKey, = self.client.put([make_files('a.ttf')])
+    self.client.get(storageKey)
+    # a unary call is counted before it answers
+    counters = self.servicer.counters.snapshot()['Get']
+    self.assertEqual(counters['calls'], 1)
+    self.assertEqual(counters['errors'], 0)
+    self.assertEqual(counters['bytes_received'], storageKey.ByteSize())
+    self.assertGreater(counters['bytes_sent'], 0)
+
+
+class TestFileSystemStorage(TestMemoryStorage):
+  def setUp(self):
+    self._tmp = tempfile.TemporaryDirectory()
+    self.data_dir = self._tmp.name
+    super(TestFileSystemStorage, self).setUp()
+
+  def tearDown(self):
+    super(TestFileSystemStorage, self).tearDown()
+    self._tmp.cleanup()
+
+  def test_survives_a_restart(self):
+    storageKey, = self.client.put([make_files('a.ttf')])
+    self.server.stop(None)
+    self.server, _ = serve(self.port, self.data_dir)
+    self.assertEqual(self.client.get(storageKey), make_files('a.ttf'))
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Run in containers/base/python:
+$ python -m unittest discover tests
+"""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import sys
+import logging
+import tempfile
+import unittest
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# like PYTHONPATH in the Dockerfile
+sys.path.insert(0, os.path.join(PYTHON_DIR, 'protocolbuffers'))
+sys.path.insert(0, PYTHON_DIR)
+
+import grpc
+from rethinkdb.errors import (
+                               ReqlDriverError
+                             , ReqlDriverCompileError
+                             , ReqlOpFailedError
+                             , ReqlQueryLogicError
+                             )
+from worker.worker_base import is_transient_error, WorkerError
+from worker.storageclient import RetriesExceeded
+from worker.diff_tools_shared import DiffWorkerBase
+from protocolbuffers.messages_pb2 import FamilyJob, CompletedWorker
+
+
+class RpcError(grpc.RpcError):
+  def __init__(self, code):
+    self._code = code
+
+  def code(self):
+    return self._code
+
+
+class TestIsTransientError(unittest.TestCase):
+  def test_transient(self):
+    for error in (ReqlDriverError('connection lost')
+                , ReqlOpFailedError('no primary', None, None)
+                , RetriesExceeded()
+                , RpcError(grpc.StatusCode.UNAVAILABLE)
+                , RpcError(grpc.StatusCode.DEADLINE_EXCEEDED)):
+      self.assertTrue(is_transient_error(error), error)
+
+  def test_not_transient(self):
+    for error in (ValueError()
+                , ReqlDriverCompileError('bug in the query')
+                , ReqlQueryLogicError('no such field', None, None)
+                , RpcError(grpc.StatusCode.INVALID_ARGUMENT)):
+      self.assertFalse(is_transient_error(error), error)
+
+  def test_cause(self):
+    try:
+      try:
+        raise ReqlDriverError('connection lost')
+      except ReqlDriverError as e:
+        raise WorkerError('Writing test results failed.') from e
+    except WorkerError as e:
+      self.assertTrue(is_transient_error(e))
+
+
+class Queue(object):
+  def __init__(self):
+    self.messages = []
+
+  def end(self, message):
+    self.messages.append(message)
+
+
+class Persistence(object):
+  def put(self, messages, dedup=False):
+    raise RetriesExceeded(RpcError(grpc.StatusCode.UNAVAILABLE))
+
+
+class DiffWorker(DiffWorkerBase):
+  _workername = 'test'
+
+
+class TestDiffWorkerFinalize(unittest.TestCase):
+  def _finalize(self, retry_transient):
+    queue = Queue()
+    with tempfile.TemporaryDirectory() as tmp_directory:
+      worker = DiffWorker(logging.getLogger('test'), FamilyJob(docid='1')
+                              , None, Persistence(), queue, tmp_directory)
+      # one result to upload
+      os.mkdir(os.path.join(tmp_directory, 'test', 'result'))
+      worker.retry_transient = retry_transient
+      return worker.finalize(None), queue.messages
+
+  def test_reraises_if_retried(self):
+    with self.assertRaises(RetriesExceeded):
+      self._finalize(True)
+
+  def test_last_try_completes(self):
+    handled, messages = self._finalize(False)
+    self.assertTrue(handled)
+    self.assertEqual(len(messages), 1)
+    self.assertIsInstance(messages[0], CompletedWorker)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+"""
+Run in containers/base/python:
+$ python -m unittest discover tests
+"""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import sys
+import unittest
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# like PYTHONPATH in the Dockerfile
+sys.path.insert(0, os.path.join(PYTHON_DIR, 'protocolbuffers'))
+sys.path.insert(0, PYTHON_DIR)
+
+from worker.worker_base import PreparationError
+from worker import diff_tools_shared, fontbakery
+
+
+class TestDiffToolsValidateFilename(unittest.TestCase):
+  def validate(self, filename, seen=None, prefixes=('before', 'after')):
+    logs = []
+    return diff_tools_shared.validate_filename(logs, set() if seen is None
+                                  else seen, prefixes, filename), logs
+
+  def test_valid(self):
+    self.assertEqual(self.validate('before/Font-Regular.ttf'), (True, []))
+
+  def test_invalid_part(self):
+    # normpath leaves only leading '..', these don't match a directory
+    valid, _ = self.validate('before/../../evil.ttf')
+    self.assertFalse(valid)
+    with self.assertRaisesRegex(PreparationError, '"\\.\\."'):
+      # the empty prefix allows all directories
+      self.validate('before/../../evil.ttf', prefixes=[''])
+
+  def test_unexpected_directory(self):
+    valid, logs = self.validate('other/Font-Regular.ttf')
+    self.assertFalse(valid)
+    self.assertEqual(len(logs), 1)
+
+  def test_duplicate(self):
+    seen = set()
+    self.assertTrue(self.validate('after/Font-Regular.ttf', seen)[0])
+    self.assertFalse(self.validate('after/./Font-Regular.ttf', seen)[0])
+
+
+class TestFontbakeryValidateFilename(unittest.TestCase):
+  def test_invalid_part(self):
+    with self.assertRaisesRegex(PreparationError, '"\\.\\."'):
+      fontbakery.validate_filename([], set(), '../evil.ttf')
+
+  def test_duplicate(self):
+    logs, seen = [], set()
+    self.assertTrue(fontbakery.validate_filename(logs, seen, 'Font.ttf'))
+    self.assertFalse(fontbakery.validate_filename(logs, seen, './Font.ttf'))
+    self.assertEqual(len(logs), 1)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -2,14 +2,20 @@
 from __future__ import print_function, division, unicode_literals
 
 import os
-from tempfile import TemporaryDirectory
+from tempfile import TemporaryDirectory, gettempdir
 import pika
 from rethinkdb import RethinkDB
 
 import traceback
+from time import time
 from collections import namedtuple
+from collections.abc import Mapping
+import importlib
 import inspect
-from contextlib import ExitStack
+import threading
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
 from protocolbuffers.messages_pb2 import Files, WorkerJobDescription
 
 import logging
@@ -17,22 +23,31 @@ FORMAT = '%(asctime)s:%(name)s:%(levelname)s:%(message)s'
 logging.basicConfig(format=FORMAT)
 
 
-from worker.storageclient import StorageClient
-from worker.fontbakery import (
-                      Checker as FontBakeryCheckerWorker
-                    , Distributor as FontBakeryDistributorWorker
-                    )
-from worker.diffenator import DiffenatorWorker
-from worker.diffbrowsers import DiffbrowsersWorker
+from worker.storageclient import StorageClient, DEFAULT_DEADLINES
+from worker.filecache import FileCache
+from worker.grpcchannels import ChannelFactory
+from worker.worker_base import is_transient_error
 
 logger = logging.getLogger('FB_WORKER')
 r = RethinkDB()
 
+def worker_queue_name(worker_name):
+  """
+  Each worker type has its own queue, so that e.g. long running
+  diffbrowsers jobs don't hold back the fontbakery_checker jobs.
+  Same as in InitWorkers.js.
+  """
+  return 'fontbakery-worker-{}'.format(worker_name)
+
+
 class Queue(object):
-  def __init__(self, channel, worker_name, end_name):
+  def __init__(self, channel, end_name, connection=None):
     self.channel = channel
-    self._worker_name = worker_name
     self._end_name = end_name
+    # If connection is set, publishing is scheduled to run in the thread
+    # of the connection. The pika BlockingConnection is not thread safe
+    # and in concurrent mode the jobs run in threads of their own.
+    self._connection = connection
 
   def _queue(self, message, queue_name):
     options = pika.BasicProperties(
@@ -46,16 +61,97 @@ class Queue(object):
     # key of the message. Every queue is automatically bound to the default exchange
     # with a routing key which is the same as the queue name.
     routing_key = queue_name
-    self.channel.basic_publish(exchange=''
+    publish = partial(self.channel.basic_publish, exchange=''
                         , routing_key=routing_key
                         , body=message.SerializeToString()
                         , properties=options)
+    if self._connection is None:
+      publish()
+    else:
+      self._connection.add_callback_threadsafe(publish)
 
   def end(self, message):
     return self._queue(message, self._end_name)
 
   def worker(self, message):
-    return self._queue(message, self._worker_name)
+    """message: a WorkerJobDescription, routed by its `worker_name`."""
+    return self._queue(message, worker_queue_name(message.worker_name))
+
+
+class Retries(object):
+  """
+  Failed jobs are queued again after a delay, with an increased
+  `WorkerJobDescription.retries`. The delay doubles with each retry.
+  After `max_retries` the job goes to the dead letter queue, to be
+  inspected manually.
+
+  The delays are made with one queue per delay: its messages expire
+  after the delay and are then routed back into the worker queue by
+  RabbitMQ (dead lettering via the default exchange). Nobody consumes
+  from the delay queues.
+  """
+  def __init__(self, channel, queue_name, max_retries, delay_ms
+                                                    , connection=None):
+    self.channel = channel
+    self._queue_name = queue_name
+    self._max_retries = max_retries
+    self._delay_ms = delay_ms
+    self.dead_letter_name = '{}-dead-letter'.format(queue_name)
+    # see Queue
+    self._connection = connection
+
+  def _delay_queue_name(self, retry):
+    return '{}-delay-{}'.format(self._queue_name, self._get_delay(retry))
+
+  def _get_delay(self, retry):
+    return self._delay_ms * 2 ** (retry - 1)
+
+  def declare(self):
+    self.channel.queue_declare(queue=self.dead_letter_name, durable=True)
+    for retry in range(1, self._max_retries + 1):
+      self.channel.queue_declare(queue=self._delay_queue_name(retry)
+          , durable=True
+          , arguments={
+                'x-message-ttl': self._get_delay(retry)
+              , 'x-dead-letter-exchange': ''
+              , 'x-dead-letter-routing-key': self._queue_name
+          })
+
+  def _publish(self, queue_name, body):
+    publish = partial(self.channel.basic_publish, exchange=''
+                        , routing_key=queue_name
+                        , body=body
+                        , properties=pika.BasicProperties(delivery_mode=2))
+    if self._connection is None:
+      publish()
+    else:
+      self._connection.add_callback_threadsafe(publish)
+
+  def will_retry(self, retries):
+    """True if a job that failed `retries` times before can fail again
+    and still be queued again by `failed`."""
+    return retries < self._max_retries
+
+  def failed(self, body):
+    """Queue the job of message body again or to the dead letter queue."""
+    job_description = WorkerJobDescription()
+    try:
+      job_description.ParseFromString(body)
+    except Exception:
+      # can't be fixed by retrying
+      logger.error('Moving unparsable job to %s.', self.dead_letter_name)
+      self._publish(self.dead_letter_name, body)
+      return
+    job_description.retries += 1
+    if job_description.retries > self._max_retries:
+      logger.error('Job failed %s times, moving it to %s.'
+                    , job_description.retries, self.dead_letter_name)
+      self._publish(self.dead_letter_name, body)
+      return
+    queue_name = self._delay_queue_name(job_description.retries)
+    logger.warning('Queuing the job again, retry %s via %s.'
+                          , job_description.retries, queue_name)
+    self._publish(queue_name, job_description.SerializeToString())
 
 
 def setLoglevel(logger, loglevel):
@@ -71,7 +167,15 @@ Setup = namedtuple('Setup', ['log_level', 'db_host', 'db_port'
                            , 'db_user', 'db_password'
                            , 'msgqueue_host', 'cache_host', 'cache_port'
                            , 'persistence_host', 'persistence_port'
-                           , 'ticks_to_flush'])
+                           , 'ticks_to_flush', 'flush_interval_ms'
+                           , 'flush_bytes', 'worker_types', 'concurrency'
+                           , 'concurrency_by_type'
+                           , 'checker_processes', 'file_cache_dir'
+                           , 'file_cache_bytes', 'grpc_compression'
+                           , 'grpc_keepalive_ms', 'cache_hedge_percentile'
+                           , 'max_retries', 'retry_delay_ms'
+                           , 'warm_up', 'ready_file', 'result_cache_days'
+                           , 'storage_deadlines', 'storage_idle_timeout'])
 
 def getSetup():
   log_level = os.environ.get("FONTBAKERY_WORKER_LOG_LEVEL", 'INFO')
@@ -100,13 +204,216 @@ def getSetup():
   # live report granularity, but it also slows the database down.
   # For a massive scale of checkers, this can be a major tool to tune
   # performance.
-
-  ticks_to_flush = int(os.environ.get("FONTBAKERY_CHECKER_TICKS_TO_FLUSH", 1))
+  # The checker flushes when the first of the three limits is reached:
+  # number of results, milliseconds since the oldest unflushed result
+  # or approximate size of the unflushed results in bytes. An empty
+  # value disables the respective limit, without any limit every result
+  # is flushed immediately.
+  def int_or_none(name, default=None):
+    value = os.environ.get(name, default)
+    return int(value) if value not in (None, '') else None
+
+  ticks_to_flush = int_or_none("FONTBAKERY_CHECKER_TICKS_TO_FLUSH")
+  flush_interval_ms = int_or_none("FONTBAKERY_CHECKER_FLUSH_INTERVAL_MS", 1000)
+  flush_bytes = int_or_none("FONTBAKERY_CHECKER_FLUSH_BYTES", 512 * 1024)
+
+  # Results of the checks are reused for unchanged files, with the same
+  # Font Bakery version, for up to that many days. An empty value
+  # disables the check result cache.
+  result_cache_days = int_or_none("FONTBAKERY_CHECKER_RESULT_CACHE_DAYS", 7)
+
+  # The worker types executed by this process, comma separated e.g.
+  # "fontbakery,fontbakery_checker". Each worker type has its own queue,
+  # that way the CPU heavy and the I/O heavy types can be scaled in
+  # separate deployments. Empty means all types.
+  worker_types = [name.strip() for name in
+                    os.environ.get("FONTBAKERY_WORKER_TYPES", '').split(',')
+                                                          if name.strip()]
+
+  # Number of jobs of one worker type executed at the same time by one
+  # worker process. A lot of the time of a job is spent waiting for the
+  # cache or for RethinkDB, this allows to use the idle time for other
+  # jobs. The worker types don't share their job slots, a slow job of
+  # one type doesn't block the jobs of the other types.
+  # With only one worker type and 1 job slot it's the classic mode: one
+  # job after the other in the main thread.
+  concurrency = max(1, int(os.environ.get("FONTBAKERY_WORKER_CONCURRENCY", 1)))
+  # Overrides per worker type, e.g. "diffbrowsers:1,fontbakery_checker:8"
+  concurrency_by_type = {}
+  for item in os.environ.get("FONTBAKERY_WORKER_CONCURRENCY_BY_TYPE"
+                                                          , '').split(','):
+    if not item.strip():
+      continue
+    name, value = item.split(':')
+    concurrency_by_type[name.strip()] = max(1, int(value))
+
+  # If > 0 the checks of FontBakeryCheckerWorker are executed in a
+  # pool of that many processes. The CPU heavy checks then don't block
+  # this process and the database writes can happen at the same time.
+  # 0 executes the checks in the thread of the job.
+  checker_processes = int(os.environ.get("FONTBAKERY_CHECKER_PROCESSES", 0))
+
+  # The files of a job are cached on disk for the following jobs on the
+  # same files, i.e. the other sub-jobs of a family. Least recently used
+  # files are deleted when the cache grows over file_cache_bytes. An
+  # empty FONTBAKERY_WORKER_FILE_CACHE_BYTES disables the cache.
+  file_cache_dir = os.environ.get("FONTBAKERY_WORKER_FILE_CACHE_DIR"
+                  , os.path.join(gettempdir(), 'fontbakery-file-cache'))
+  file_cache_bytes = int_or_none("FONTBAKERY_WORKER_FILE_CACHE_BYTES"
+                                                    , 512 * 1024 * 1024)
+
+  # Message compression of the calls to the storage services:
+  # "none", "gzip" or "deflate"
+  grpc_compression = os.environ.get("FONTBAKERY_WORKER_GRPC_COMPRESSION"
+                                                          , 'none') or None
+  # Interval of the keepalive pings on the storage connections, an empty
+  # value disables keepalive pings.
+  grpc_keepalive_ms = int_or_none("FONTBAKERY_WORKER_GRPC_KEEPALIVE_MS"
+                                                                , 60000)
+  # A get or get_files_meta (the file list each fontbakery checker job
+  # requests first) from the cache that takes longer than this
+  # percentile of the recent calls is sent a second time, the first
+  # answer wins. An empty value disables it.
+  cache_hedge_percentile = int_or_none(
+                            "FONTBAKERY_WORKER_CACHE_HEDGE_PERCENTILE", 95)
+  # Deadlines in seconds of the calls to the storage services, overrides
+  # of DEFAULT_DEADLINES in worker/storageclient.py, e.g.
+  # "get:30,put_files:1200". An empty value means no deadline.
+  storage_deadlines = {}
+  for item in os.environ.get("FONTBAKERY_WORKER_STORAGE_DEADLINES"
+                                                          , '').split(','):
+    if not item.strip():
+      continue
+    name, value = item.split(':')
+    if name.strip() not in DEFAULT_DEADLINES:
+      raise ValueError('Unknown operation "{}" in FONTBAKERY_WORKER_STORAGE_'
+                       'DEADLINES.'.format(name.strip()))
+    storage_deadlines[name.strip()] = int(value) if value.strip() else None
+  # The streaming calls (get_files, put, put_files) have no deadline by
+  # default, they fail after this many seconds without a message
+  # instead. An empty value disables it.
+  storage_idle_timeout = int_or_none("FONTBAKERY_WORKER_STORAGE_IDLE_TIMEOUT"
+                                                                    , 60)
+
+  # A job that failed in a way that the worker couldn't handle, e.g.
+  # because the database or the cache were not reachable, is queued
+  # again after retry_delay_ms, doubled for each retry. After
+  # max_retries it goes to the dead letter queue.
+  max_retries = int(os.environ.get("FONTBAKERY_WORKER_MAX_RETRIES", 3))
+  retry_delay_ms = int(os.environ.get("FONTBAKERY_WORKER_RETRY_DELAY_MS", 5000))
+
+  # If set, each configured worker type processes a bundled font before
+  # any job is consumed, so the first jobs don't pay for the imports and
+  # the set up of the caches. A failing warm-up stops the worker.
+  warm_up = os.environ.get("FONTBAKERY_WORKER_WARM_UP", '') not in ('', '0')
+  # Created when the worker consumes, e.g. for a readinessProbe:
+  # exec: command: ["test", "-f", "/tmp/fontbakery-worker-ready"]
+  ready_file = os.environ.get("FONTBAKERY_WORKER_READY_FILE", None) or None
 
   return Setup(log_level, db_host, db_port, db_user, db_password
                               , msgqueue_host, cache_host, cache_port
                               , persistence_host, persistence_port
-                              , ticks_to_flush)
+                              , ticks_to_flush, flush_interval_ms
+                              , flush_bytes, worker_types, concurrency
+                              , concurrency_by_type
+                              , checker_processes, file_cache_dir
+                              , file_cache_bytes, grpc_compression
+                              , grpc_keepalive_ms, cache_hedge_percentile
+                              , max_retries, retry_delay_ms
+                              , warm_up, ready_file, result_cache_days
+                              , storage_deadlines, storage_idle_timeout)
+
+
+class RethinkDBConnections(object):
+  """
+  RethinkDB connections are not thread safe. In concurrent mode each
+  job thread gets its own connection, created lazily and reused for all
+  the jobs that run in that thread.
+  """
+  def __init__(self, r, db_name, **connect_kwds):
+    self._r = r
+    self._db_name = db_name
+    self._connect_kwds = connect_kwds
+    self._local = threading.local()
+
+  def _get_connection(self):
+    connection = getattr(self._local, 'connection', None)
+    if connection is None or not connection.is_open():
+      connection = self._r.connect(**self._connect_kwds)
+      self._local.connection = connection
+    return connection
+
+  @contextmanager
+  def __call__(self):
+    # Same shape as the `rethinkdb` static resource.
+    yield (self._r, self._get_connection(), self._db_name)
+
+
+# worker type => (module, class name)
+WORKER_CLASSES = dict(
+    fontbakery=('worker.fontbakery', 'Distributor')
+  , fontbakery_checker=('worker.fontbakery', 'Checker')
+  , diffenator=('worker.diffenator', 'DiffenatorWorker')
+  , diffbrowsers=('worker.diffbrowsers', 'DiffbrowsersWorker')
+)
+
+
+class WorkerRegistry(Mapping):
+  """
+  worker type => worker class
+
+  The worker modules import fontbakery, diffenator, diffbrowsers and
+  fontTools, that's slow and takes a lot of memory. A module is only
+  imported when its worker class is requested the first time, a pod
+  that is configured for the checker only won't load the diff tools.
+  """
+  def __init__(self, definitions):
+    self._definitions = definitions
+    self._classes = {}
+    self._lock = threading.Lock()
+
+  def __getitem__(self, worker_type):
+    with self._lock:
+      if worker_type not in self._classes:
+        # KeyError for unknown worker types, like a dict.
+        module_name, class_name = self._definitions[worker_type]
+        logger.debug('Loading worker %s from %s.', worker_type, module_name)
+        module = importlib.import_module(module_name)
+        self._classes[worker_type] = getattr(module, class_name)
+      return self._classes[worker_type]
+
+  def __iter__(self):
+    return iter(self._definitions)
+
+  def __len__(self):
+    return len(self._definitions)
+
+
+WARM_UP_FONT = os.path.join(os.path.dirname(os.path.abspath(__file__))
+                        , 'debug_vollkorn', 'before', 'Vollkorn-Regular.ttf')
+
+def warm_up(workers, worker_types, resources, font_path=WARM_UP_FONT):
+  for worker_type in worker_types:
+    start = time()
+    try:
+      workers[worker_type].warm_up(font_path, resources)
+    except Exception as e:
+      # Fatal, the worker is never ready. Otherwise it would consume
+      # jobs that all fail the same way.
+      logger.error('Warm-up of %s FAILED: %s', worker_type, e)
+      raise
+    logger.info('Warmed up %s in %.2f seconds.', worker_type, time() - start)
+
+
+def set_ready(ready_file, ready):
+  if ready_file is None:
+    return
+  if ready:
+    with open(ready_file, 'w'):
+      pass
+  elif os.path.exists(ready_file):
+    # left over from a previous run of the container
+    os.unlink(ready_file)
 
 
 def parse_job(workers, body):
@@ -127,7 +434,7 @@ def parse_job(workers, body):
                      + '{}:"{}" doesn\'t match "{}".'
                      .format(Worker.JobType, Worker.JobType.DESCRIPTOR.full_name
                           , job_description.job.TypeName()))
-  return Worker, job;
+  return Worker, job, job_description.retries
 
 
 def getMandatoryParams(callable):
@@ -144,8 +451,10 @@ def getMandatoryParams(callable):
 
 
 class CTX(object):
-  def __init__(self, Worker, resources):
+  def __init__(self, Worker, resources, retry_transient=False):
       self._worker = Worker(*resources)
+      self._retry_transient = retry_transient
+      self._worker.retry_transient = retry_transient
 
   def __enter__(self):
     return self._worker.run
@@ -156,9 +465,13 @@ class CTX(object):
     map(type, exc) = [<class 'type'>, <class 'ExceptionClass'>, <class 'traceback'>]
     '''
 
-    # FIXME: raise if the cause of the error is a resource that got lost
-    #        i.e. database, cache, queue because then kubernetes can restart
-    #        the pod with its back-off delay
+    if exc[0] and self._retry_transient and is_transient_error(exc[1]):
+      # The database or storage was not reachable, the job is not at
+      # fault. Don't record it as failed, re-raise, the caller queues it
+      # again via `Retries.failed`. The last retry is finalized as usual,
+      # so the job is not left unfinished.
+      logger.warning('Transient error, the job will be retried: %s', exc[1])
+      return False
 
     tb = None
     if exc[0]:
@@ -175,8 +488,9 @@ class CTX(object):
     # Without exception there's nothing to raise anyways.
     return False
 
-def consume(workers, static_resources, resource_managers, method, properties, body):
-  Worker, job = parse_job(workers, body)
+def consume(workers, static_resources, resource_managers, retries
+                                            , method, properties, body):
+  Worker, job, job_retries = parse_job(workers, body)
   logger.info('consuming a job for: %s with %s %s', Worker, method, properties)
 
   with ExitStack() as stack:
@@ -203,9 +517,57 @@ def consume(workers, static_resources, resource_managers, method, properties, bo
         # which seems appropriate.
         resources.append(static_resources[name])
     # enter context and execute
-    run = stack.enter_context(CTX(Worker, resources))
+    run = stack.enter_context(CTX(Worker, resources
+                                , retries.will_retry(job_retries)))
     run()
 
+  grpc_counters = static_resources.get('grpc_counters', None)
+  if grpc_counters is not None:
+    # cumulative, since the start of the process
+    logger.info('gRPC message bytes by method: %s', grpc_counters.snapshot())
+
+
+def _on_job_done(connection, channel, retries, body, delivery_tag, future):
+  """
+  Runs in the thread of the job. Like in the non-concurrent mode the
+  message is always acked, see the comments in `main`.
+  """
+  exception = future.exception()
+  if exception is not None:
+    logger.error('consume FAILED: %s', exception, exc_info=exception)
+    # publishes before the ack below
+    retries.failed(body)
+  # channel methods must be called in the thread of the connection
+  connection.add_callback_threadsafe(
+                  partial(channel.basic_ack, delivery_tag=delivery_tag))
+
+
+def subscribe(connection, queue_name, concurrency, workers
+                              , static_resources, resource_managers
+                              , retries):
+  """
+  Execute up to `concurrency` jobs of `queue_name` at the same time in
+  a thread pool of its own.
+
+  Each queue gets a channel of its own, its `prefetch_count` is equal to
+  `concurrency`, then the broker won't deliver more jobs than there are
+  free job slots for the queue. The main thread dispatches the jobs and
+  keeps the connection alive (heartbeats), while the jobs run.
+  """
+  channel = connection.channel()
+  channel.basic_qos(prefetch_count=concurrency)
+  executor = ThreadPoolExecutor(max_workers=concurrency
+                              , thread_name_prefix='job-{}'.format(queue_name))
+  def on_message(channel, method, properties, body):
+    logger.info('consuming incoming message from %s ...', queue_name)
+    future = executor.submit(consume, workers, static_resources
+                           , resource_managers, retries
+                           , method, properties, body)
+    future.add_done_callback(partial(_on_job_done, connection, channel
+                                    , retries, body, method.delivery_tag))
+  channel.basic_consume(queue_name, on_message)
+  return channel
+
 
 def main():
   """
@@ -214,6 +576,7 @@ def main():
     gets longer.
   """
   setup = getSetup()
+  set_ready(setup.ready_file, False)
 
   setLoglevel(logger, setup.log_level)
   # DEBUG is a lot of output!
@@ -222,13 +585,45 @@ def main():
 
   logger.info('loglevel: ' + setup.log_level)
 
+  # Start the checker processes before the jobs arrive.
+  checker_pool = None
+  if setup.checker_processes > 0:
+    logger.info('Starting %s checker processes.', setup.checker_processes)
+    from worker.fontbakery import CheckerPool as FontBakeryCheckerPool
+    checker_pool = FontBakeryCheckerPool(setup.checker_processes)
+
+  file_cache = None
+  if setup.file_cache_bytes is not None:
+    logger.info('File cache in %s with %s bytes.', setup.file_cache_dir
+                                                 , setup.file_cache_bytes)
+    file_cache = FileCache(setup.file_cache_dir, setup.file_cache_bytes)
+
   logger.info(' '.join(['RethinkDB', 'HOST', setup.db_host, 'PORT', setup.db_port]))
-  rdb_connection = r.connect(host=setup.db_host, port=setup.db_port
-                           , user=setup.db_user, password=setup.db_password
-                           , timeout=120)
+  rdb_connect_kwds = dict(host=setup.db_host, port=setup.db_port
+                        , user=setup.db_user, password=setup.db_password
+                        , timeout=120)
   rdb_name = 'fontbakery'
 
-  queue_worker_name='fontbakery-worker'
+  workers = WorkerRegistry(WORKER_CLASSES)
+  worker_types = setup.worker_types or sorted(workers)
+  unknown = set(worker_types) - set(workers)
+  if unknown:
+    raise ValueError('Unknown worker types in FONTBAKERY_WORKER_TYPES: {}.'
+                                      .format(', '.join(sorted(unknown))))
+  # Load the configured workers now, broken installations should be
+  # detected on start and not by the first job.
+  for worker_type in worker_types:
+    workers[worker_type]
+  if setup.warm_up:
+    warm_up(workers, worker_types, dict(checker_pool=checker_pool
+                                      , file_cache=file_cache))
+  concurrency = {worker_type: setup.concurrency_by_type.get(worker_type
+                                                      , setup.concurrency)
+                                          for worker_type in worker_types}
+  # Classic mode, one job after the other in the main thread, is only
+  # possible for one queue with one job slot.
+  threaded = len(worker_types) > 1 or concurrency[worker_types[0]] > 1
+
   queue_end_name='fontbakery-worker-cleanup'
 
   # http://pika.readthedocs.io/en/latest/examples/heartbeat_and_blocked_timeouts.html
@@ -241,34 +636,79 @@ def main():
                 ))
   queue_channel = connection.channel()
   queue_channel.basic_qos(prefetch_count=1)
-  queue_channel.queue_declare(queue=queue_worker_name, durable=True)
+  # All worker queues, the jobs we publish must not get lost if no
+  # worker of their type is running at the moment.
+  for worker_type in workers:
+    queue_channel.queue_declare(queue=worker_queue_name(worker_type)
+                              , durable=True)
   queue_channel.queue_declare(queue=queue_end_name, durable=True)
+  retries = {}
+  for worker_type in worker_types:
+    retries[worker_type] = Retries(queue_channel
+                                 , worker_queue_name(worker_type)
+                                 , setup.max_retries, setup.retry_delay_ms
+                                 , connection if threaded else None)
+    retries[worker_type].declare()
+
+  # The cache and the persistence clients share the channel if they
+  # have the same host and port.
+  channel_factory = ChannelFactory(compression=setup.grpc_compression
+                                 , keepalive_time_ms=setup.grpc_keepalive_ms)
 
   static_resources = dict(
       logging=logger
-    , queue=Queue(queue_channel, queue_worker_name, queue_end_name)
-    , rethinkdb=(r, rdb_connection, rdb_name)
+    , queue=Queue(queue_channel, queue_end_name
+                , connection if threaded else None)
       # if we want to read more data types this must probably change?
-    , cache=StorageClient(setup.cache_host, setup.cache_port, Files)
-    , persistence=StorageClient(setup.persistence_host, setup.persistence_port, Files)
+    , cache=StorageClient(setup.cache_host, setup.cache_port, Files
+                        , channel_factory
+                        , deadlines=setup.storage_deadlines
+                        , hedge_percentile=setup.cache_hedge_percentile
+                        , idle_timeout=setup.storage_idle_timeout)
+    , persistence=StorageClient(setup.persistence_host, setup.persistence_port
+                              , Files, channel_factory
+                              , deadlines=setup.storage_deadlines
+                              , idle_timeout=setup.storage_idle_timeout)
     # hmm, this is very specific for FontBakeryCheckerWorker
     # probably it should read its own, uniqe setup values, as done in
     # e.g. in the `diffbrowsers` moduke of `DiffbrowsersWorker`
     , ticks_to_flush=setup.ticks_to_flush
+    , flush_interval_ms=setup.flush_interval_ms
+    , flush_bytes=setup.flush_bytes
+    , result_cache_days=setup.result_cache_days
+    , checker_pool=checker_pool
+    , file_cache=file_cache
+    , grpc_counters=channel_factory.counters
   )
 
   resource_managers = dict(
       tmp_directory=TemporaryDirectory
   )
 
-  workers = dict(
-      fontbakery=FontBakeryDistributorWorker
-    , fontbakery_checker=FontBakeryCheckerWorker
-    , diffenator=DiffenatorWorker
-    , diffbrowsers=DiffbrowsersWorker
-  )
-
+  if threaded:
+    # each job thread gets a connection of its own
+    resource_managers['rethinkdb'] = RethinkDBConnections(r, rdb_name
+                                                    , **rdb_connect_kwds)
+  else:
+    rdb_connection = r.connect(**rdb_connect_kwds)
+    static_resources['rethinkdb'] = (r, rdb_connection, rdb_name)
+
+  if threaded:
+    for worker_type in worker_types:
+      queue_name = worker_queue_name(worker_type)
+      logger.info('Waiting for messages in %s with %s job slots.'
+                                  , queue_name, concurrency[worker_type])
+      subscribe(connection, queue_name, concurrency[worker_type], workers
+              , static_resources, resource_managers, retries[worker_type])
+    set_ready(setup.ready_file, True)
+    while True:
+      # dispatches the messages of all channels and runs the callbacks
+      # of add_callback_threadsafe
+      connection.process_data_events(time_limit=None)
+  worker_type = worker_types[0]
+  queue_worker_name = worker_queue_name(worker_type)
   logger.info('Waiting for messages in %s...', queue_worker_name)
+  set_ready(setup.ready_file, True)
   # BlockingChannel has a generator
   # Why `no_ack=True`: A job can run much longer than the broker will
   # wait for an ack and there's no way to give a good estimate of how
@@ -279,24 +719,19 @@ def main():
   for method, properties, body in queue_channel.consume(queue_worker_name):
     logger.info('consuming incoming message ...')
     try:
-      consume(workers, static_resources, resource_managers, method, properties, body)
+      consume(workers, static_resources, resource_managers
+                          , retries[worker_type], method, properties, body)
     except Exception as e:
       # exceptions that come here should restart the pod!
       # however that way, we don't see the exception log easily
       # which is bad for debugging
       logger.exception('consume FAILED: %s', e)
+      # The job couldn't even be marked as failed, e.g. because of a
+      # temporary db failure. Re-insert it with an incremented retry
+      # count, after max_retries it's moved to the dead letter queue.
+      # Published before the ack, so the job can't get lost in between.
+      retries[worker_type].failed(body)
     finally:
       queue_channel.basic_ack(delivery_tag=method.delivery_tag)
-      # FIXME: we should not always ack the job if can't even mark it as
-      # failed in the RethinkDB-doc (or wherever???)
-      # publishing the job again, with increased retry count would be an
-      # option. (Needs a retry count field on the job).
-      # TODO: to keep jobs from disappearing (and also from being redelivered
-      # forever), a dead-end queue could be created.
-      # Also nice as a tactic would be to re-insert the job into the original
-      # queue, but with an incremented retry count. After {n} retries we could
-      # move it to the dead-end. That way, a temporary db failure or such would
-      # not be a "job killer".
-      # BUT: for now we need to see cases where, how and why this actually fails.
 if __name__ == '__main__':
   main()
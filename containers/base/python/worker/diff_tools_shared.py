@@ -11,6 +11,7 @@ from .worker_base import(
                         WorkerBase
                       , WorkerError
                       , PreparationError
+                      , is_transient_error
                       )
 
 from protocolbuffers.messages_pb2 import (
@@ -126,9 +127,11 @@ def validate_filename(logs, seen, expected_prefixes, raw_filename):
 
   # os.path.normpath will have taken care of any of these names that are
   # not a problem.
-  if any(part in {'', '.', '..'} for part in filename.split(os.sep)):
+  bad = next((part for part in filename.split(os.sep)
+                                  if part in {'', '.', '..'}), None)
+  if bad is not None:
     raise PreparationError(f'Invalid filename: "{filename}"` contains a '
-                           f'"{part}" raw_filename was "{raw_filename}".')
+                           f'"{bad}" raw_filename was "{raw_filename}".')
 
   if filename in seen:
     logs.append('Skipping duplicate file name "{0}".'.format(filename))
@@ -154,10 +157,19 @@ class DiffWorkerBase(WorkerBase):
     self._answer = GenericStorageWorkerResult()
     self._answer.job_id = self._job.docid
 
+  @classmethod
+  def warm_up(cls, font_path, resources):
+    TTFont(font_path, lazy=False).close()
+
   def _prepare(self, files, target_dirs):
     """
       Write files from the grpc.StorageServer to tmp_directory.
 
+      `files` is expected to be an iterable that receives the files one
+      after the other, like `StorageClient.get_files`, each file is
+      written as soon as it is received and `maxfiles` is checked on the
+      way, so we don't receive all of a job that is too big.
+
       Returns a list of log messages for each file in job.files, some may
       be skipped. This is to give the user direct feedback about the request
       made.
@@ -200,9 +212,9 @@ class DiffWorkerBase(WorkerBase):
         fontfiles[prefix].append(path)
       filecount += 1
 
-    if filecount > maxfiles:
-      raise PreparationError('Found {} font files, but maximum '
-                      'is limiting to {}.'.format(filecount, maxfiles))
+      if filecount > maxfiles:
+        raise PreparationError('Found more than {0} font files, but maximum '
+                        'is limiting to {0}.'.format(maxfiles))
 
     return fontfiles
 
@@ -233,7 +245,9 @@ class DiffWorkerBase(WorkerBase):
   def _make_results(self):
     result_dirs = next(os.walk(self._out_dir))[1]
     files_msgs = (self._make_result(result_name) for result_name in result_dirs)
-    storage_keys = self._persistence.put(files_msgs)
+    # Results of re-dispatched jobs are often identical, those are
+    # not uploaded again.
+    storage_keys = self._persistence.put(files_msgs, dedup=True)
     results = []
     for result_name, storage_key in zip(result_dirs, storage_keys):
       dr = GenericStorageWorkerResult.Result()
@@ -257,6 +271,9 @@ class DiffWorkerBase(WorkerBase):
     try:
       self._make_results()
     except Exception as e:
+      if self.retry_transient and is_transient_error(e):
+        # the storage is not reachable, let the job be queued again
+        raise
       msg = 'Can\'t create (all) results:\n{}'.format(traceback.format_exc())
       if self._answer.exception:
         self._answer.exception += '\n\n AND ' + msg
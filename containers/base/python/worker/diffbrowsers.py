@@ -128,11 +128,18 @@ def getSetup():
 
   return Setup(gfr_url, bstack_credentials)
 
-# Running this rather really early than when the worker is initialized
-# the first time. That way we get feedback when configuration is missing
-# directly when the module is loaded. I.e. in this case directly on process
-# start.
-SETUP = getSetup();
+_SETUP = None
+
+def get_setup():
+  """
+  Not run when the module is loaded, pods that don't execute this worker
+  don't need the configuration. If it is missing the job fails with the
+  WorkerError, that way the feedback shows up in the job's document.
+  """
+  global _SETUP
+  if _SETUP is None:
+    _SETUP = getSetup()
+  return _SETUP
 
 class DiffbrowsersWorker(DiffWorkerBase):
   def __init__(self, logging, job, cache, persistence, queue, tmp_directory):
@@ -143,15 +150,17 @@ class DiffbrowsersWorker(DiffWorkerBase):
 
   def run(self):
     self._set_answer_timestamp('started')
-    fonts = self._prepare(self._cache.get(self._job.cache_key).files, ['before', 'after'])
+    setup = get_setup()
+    fonts = self._prepare(self._cache.get_files(self._job.cache_key)
+                        , ['before', 'after'])
     # all_fonts = reduce(lambda a,b: a+b, fonts.values(),[])
     all_files = [os.path.join(dp, f) for dp, dn, fn \
                           in os.walk(self._tmp_directory) for f in fn]
     self._log.debug('Files in Tempdir {}: {}'.format(
                                         self._tmp_directory, all_files))
 
-    gfr_url = SETUP.gfr_url
-    bstack_credentials = SETUP.bstack_credentials
+    gfr_url = setup.gfr_url
+    bstack_credentials = setup.bstack_credentials
 
     self._log.info('entering run_renderers …')
     # FIXME: should we collect stdout/stderr here???
@@ -79,9 +79,14 @@ class DiffenatorWorker(DiffWorkerBase):
     self._answer.preparation_logs.append(
                     'Diffenator version {}'.format(diffenator.__version__))
 
+  @classmethod
+  def warm_up(cls, font_path, resources):
+    DFont(font_path)
+
   def run(self):
     self._set_answer_timestamp('started')
-    fonts = self._prepare(self._cache.get(self._job.cache_key).files, ['before', 'after'])
+    fonts = self._prepare(self._cache.get_files(self._job.cache_key)
+                        , ['before', 'after'])
     # all_fonts = reduce(lambda a,b: a+b, fonts.values(),[])
     all_files = [os.path.join(dp, f) for dp, dn, fn \
                           in os.walk(self._tmp_directory) for f in fn]
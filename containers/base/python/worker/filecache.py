@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+from __future__ import print_function, division, unicode_literals
+
+import os
+import re
+import shutil
+import logging
+import threading
+from tempfile import mkdtemp
+from collections import OrderedDict
+
+from protocolbuffers.messages_pb2 import FilesMeta, FileMeta
+
+log = logging.getLogger('FB_WORKER')
+
+# sha256 hexdigest, as created by the StorageService
+_HASH_RE = re.compile(r'^[a-f0-9]{64}$')
+_META_FILENAME = 'meta'
+_TMP_PREFIX = 'tmp-'
+
+
+def _get_hash(storage_key):
+  """
+  The StorageService returns keys like "{hash}:{instanceKey}", hash
+  is the sha256 of the stored message, i.e. the cache is content
+  addressed.
+  """
+  digest = storage_key.hash or storage_key.key.split(':')[0]
+  return digest if _HASH_RE.match(digest) else None
+
+
+def _link(source, target):
+  # A hard link survives the eviction of the cache entry, a copy is
+  # the fallback e.g. if the cache is on another file system.
+  try:
+    os.link(source, target)
+  except OSError:
+    shutil.copyfile(source, target)
+
+
+class FileCacheEntry(object):
+  def __init__(self, digest, directory, files_meta):
+    self.digest = digest
+    self.directory = directory
+    # FileMeta messages, i.e. `name` and `size`
+    self.files = files_meta.files
+    self.size = sum(f.size for f in files_meta.files)
+    self._paths = {}
+    for index, file_meta in enumerate(files_meta.files):
+      # The (untrusted) file names are not used as paths in the cache.
+      self._paths.setdefault(file_meta.name
+                            , os.path.join(directory, '{}'.format(index)))
+    self.pins = 0
+
+  def link(self, name, target):
+    """Make the cached data of the file `name` available at `target`."""
+    _link(self._paths[name], target)
+
+
+class FileCache(object):
+  """
+  A content addressed on disk cache of the `Files` messages from the
+  storage, shared by all jobs of the worker. The sub-jobs of a family
+  all run on the same files, with the cache only the first job of a
+  pod downloads them, the others just link them into their tmp_directory.
+
+  Least recently used entries are deleted when the total size of the
+  cached files exceeds `max_bytes`, but not while they are in use.
+
+  usage:
+
+    entry = file_cache.acquire(job.cache_key, cache)
+    try:
+      for file_meta in entry.files:
+        entry.link(file_meta.name, path)
+    finally:
+      file_cache.release(entry)
+  """
+  def __init__(self, directory, max_bytes):
+    self._directory = directory
+    self._max_bytes = max_bytes
+    self._lock = threading.Lock()
+    # digest => FileCacheEntry, least recently used first
+    self._entries = OrderedDict()
+    self._size = 0
+    os.makedirs(self._directory, exist_ok=True)
+    self._load()
+
+  def _load(self):
+    """Pick up the entries a previous process left in directory."""
+    found = []
+    for name in os.listdir(self._directory):
+      path = os.path.join(self._directory, name)
+      if name.startswith(_TMP_PREFIX):
+        # unfinished download
+        shutil.rmtree(path, ignore_errors=True)
+        continue
+      try:
+        entry = self._read_entry(name, path)
+      except Exception as error:
+        log.warning('FileCache: removing broken entry %s: %s', path, error)
+        shutil.rmtree(path, ignore_errors=True)
+        continue
+      found.append((os.stat(path).st_mtime, entry))
+    for _, entry in sorted(found, key=lambda item: item[0]):
+      self._add(entry)
+    self._evict()
+
+  def _read_entry(self, digest, path):
+    files_meta = FilesMeta()
+    with open(os.path.join(path, _META_FILENAME), 'rb') as f:
+      files_meta.ParseFromString(f.read())
+    return FileCacheEntry(digest, path, files_meta)
+
+  def _add(self, entry):
+    self._entries[entry.digest] = entry
+    self._size += entry.size
+
+  def _evict(self):
+    """Must be called with the lock held (or in __init__)."""
+    for digest in list(self._entries):
+      if self._size <= self._max_bytes:
+        break
+      entry = self._entries[digest]
+      if entry.pins:
+        continue
+      del self._entries[digest]
+      self._size -= entry.size
+      shutil.rmtree(entry.directory, ignore_errors=True)
+
+  def _download(self, digest, storage_key, storage, validate):
+    files = storage.get_files(storage_key)
+    tmp_directory = mkdtemp(prefix=_TMP_PREFIX, dir=self._directory)
+    try:
+      files_meta = FilesMeta()
+      for index, jobFile in enumerate(files):
+        if validate is not None:
+          # raises to stop the download, before the file is written
+          validate(jobFile)
+        with open(os.path.join(tmp_directory, '{}'.format(index)), 'wb') as f:
+          f.write(jobFile.data)
+        files_meta.files.append(FileMeta(name=jobFile.name
+                                       , size=len(jobFile.data)))
+      with open(os.path.join(tmp_directory, _META_FILENAME), 'wb') as f:
+        f.write(files_meta.SerializeToString())
+      directory = os.path.join(self._directory, digest)
+      try:
+        os.rename(tmp_directory, directory)
+      except OSError:
+        # Another job was faster, use its entry.
+        shutil.rmtree(tmp_directory, ignore_errors=True)
+        return self._read_entry(digest, directory)
+    except:
+      shutil.rmtree(tmp_directory, ignore_errors=True)
+      raise
+    return FileCacheEntry(digest, directory, files_meta)
+
+  def acquire(self, storage_key, storage, validate=None):
+    """
+    Return a FileCacheEntry for the `Files` message at `storage_key`,
+    downloading it from `storage` if it's not cached. The entry won't
+    be evicted until it is passed to `release`.
+
+    `validate(jobFile)` is called for each downloaded file before it
+    is written, if it raises the download is stopped, nothing is cached
+    and the exception is re-raised.
+
+    Returns None if `storage_key` can't be used as a cache key, the
+    caller must fetch the files by itself then.
+    """
+    digest = _get_hash(storage_key)
+    if digest is None:
+      return None
+    with self._lock:
+      entry = self._entries.get(digest, None)
+      if entry is not None:
+        self._entries.move_to_end(digest)
+        entry.pins += 1
+    if entry is not None:
+      # The order of the entries after a restart, see _load.
+      try:
+        os.utime(entry.directory)
+      except OSError:
+        pass
+      return entry
+    # Download without holding the lock, other jobs can go on.
+    entry = self._download(digest, storage_key, storage, validate)
+    with self._lock:
+      existing = self._entries.get(digest, None)
+      if existing is not None:
+        entry = existing
+        self._entries.move_to_end(digest)
+      else:
+        self._add(entry)
+      entry.pins += 1
+    return entry
+
+  def release(self, entry):
+    with self._lock:
+      entry.pins -= 1
+      self._evict()
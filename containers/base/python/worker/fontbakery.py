@@ -2,15 +2,26 @@
 from __future__ import print_function, division, unicode_literals
 
 import os
+import json
+import hashlib
 import pytz
+import time
+import queue
+import heapq
+import threading
+import multiprocessing
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from copy import deepcopy
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 
 from .worker_base import(
                         WorkerBase
                       , WorkerError
                       , PreparationError
+                      , is_transient_error
                       )
 
 from protocolbuffers.messages_pb2 import (
@@ -22,36 +33,97 @@ from protocolbuffers.messages_pb2 import (
 import fontbakery
 from fontbakery.reporters import FontbakeryReporter
 from fontbakery.message import Message
-from fontbakery.checkrunner import STARTCHECK, ENDCHECK, DEBUG
+from fontbakery.checkrunner import (
+                                    CheckRunner
+                                  , STARTCHECK
+                                  , ENDCHECK
+                                  , DEBUG
+                                  )
 
 RDB_FAMILYTESTS = 'familytests'
+RDB_CHECKSTATS = 'checkstats'
+RDB_CHECKRESULTS = 'checkresults'
+
+
+def _dashboard_check_skip_filter(check_skip_filter):
+  def skip_filter(checkid, font=None, **iterargs):
+      # Familyname must be unique according to namecheck.fontdata.com
+    if checkid == 'com.google.fonts/check/fontdata_namecheck':
+      return False, ('Disabled for Fontbakery-Dashboard, see: '
+                      'https://github.com/googlefonts/fontbakery/issues/1680')
+    if check_skip_filter:
+      return check_skip_filter(checkid, font, **iterargs)
+    return True, None
+  return skip_filter
+
+
+class DashboardCheckRunner(CheckRunner):
+  """ A CheckRunner that shares the font independent setup between jobs.
+
+  `CheckRunner.order` is computed from scratch for each instance. The
+  profile doesn't change within a process, so the execution order,
+  which only depends on the iterargs *counts* (i.e. how many fonts), is
+  shared between all runners with the same counts.
+  The dependencies of the profile are tested only once, see
+  `_load_profile`.
+  """
+  _orders = {}
+  _orders_lock = threading.Lock()
+
+  @property
+  def order(self):
+    order = self._cache['order']
+    if order is None:
+      key = tuple(self._iterargs.items())
+      with self._orders_lock:
+        order = self._orders.get(key, None)
+        if order is None:
+          order = self._orders[key] = CheckRunner.order.fget(self)
+      self._cache['order'] = order
+    return order
+
+
+_profile = None
+_profile_lock = threading.Lock()
+def _load_profile():
+  """ Load the googlefonts profile once per process.
+
+  Returns (profile, values) where values are the font independent
+  values for the runner.
+  """
+  global _profile
+  with _profile_lock:
+    if _profile is None:
+      from fontbakery.commands.check_googlefonts import (
+                                                      profile
+                                                    , GOOGLEFONTS_SPECIFICS
+                                                    )
+      profile.test_dependencies()
+      # CheckRunner.__init__ tests them for each runner, i.e. for each
+      # job, but the profile doesn't change anymore.
+      profile.test_dependencies = lambda: None
+      # This changes the (module global) profile object, which is not
+      # elegant, but it's done only once per process.
+      profile.check_skip_filter = _dashboard_check_skip_filter(
+                                                    profile.check_skip_filter)
+      _profile = (profile, dict(GOOGLEFONTS_SPECIFICS))
+    return _profile
 
 
-__private_marker = object()
 def get_fontbakery(fonts):
-  from fontbakery.commands.check_googlefonts import runner_factory
-  runner = runner_factory(fonts)
-  profile = runner.profile
-  # This changes the profile object, which is not elegant.
-  # It's a bug when we do it repeatedly, creating a deep call stack, like
-  # a manually build recursion without end after a while.
-  # The __private_marker is a hack to change the profile object
-  # only once with this function.
-  old_check_skip_filter = profile.check_skip_filter
-  if not old_check_skip_filter or \
-      getattr(old_check_skip_filter,'__mark', None) is not __private_marker:
-    def check_skip_filter(checkid, font=None, **iterargs):
-        # Familyname must be unique according to namecheck.fontdata.com
-      if checkid == 'com.google.fonts/check/fontdata_namecheck':
-        return False, ('Disabled for Fontbakery-Dashboard, see: '
-                        'https://github.com/googlefonts/fontbakery/issues/1680')
-      if old_check_skip_filter:
-        return old_check_skip_filter(checkid, font, **iterargs)
-      return True, None
-    setattr(check_skip_filter,'__mark', __private_marker)
-    profile.check_skip_filter = check_skip_filter
+  profile, specifics = _load_profile()
+  values = dict(specifics)
+  values['fonts'] = fonts
+  runner = DashboardCheckRunner(profile, values)
   return runner, profile
 
+
+def _warm_up(font_path, resources):
+  """Load the profile and compute an order, see WorkerBase.warm_up."""
+  runner, profile = get_fontbakery([font_path])
+  profile.serialize_order(runner.order)
+
+
 class DBOperations(object):
   def __init__(self, rethinkdb, job):
     # r, rdb_connection, db_name, table = rethinkdb
@@ -90,48 +162,347 @@ class DBOperations(object):
 
     return self.q.get(self._docid).update(_doc).run(self.conn)
 
+  def finish_job(self, doc):
+    """
+    Update the job with `doc`, which must contain 'finished', and count
+    it down in the 'pending_jobs' of the family document. The last job
+    also sets 'finished' of the family document, in the same atomic
+    update, there's no race between the jobs of a family.
+
+    A job that was finished already, e.g. a redelivered job, is not
+    counted again.
+
+    Returns True if this finished the family document.
+    """
+    r = self.r
+    jobid = self._jobid
+    def update(row):
+      jobs = row['jobs'].merge({jobid: doc})
+      # Documents from before 'pending_jobs': count the unfinished jobs.
+      pending = row['pending_jobs'].default(
+                row['jobs'].values().filter(lambda job:
+                      job['finished'].default(None).eq(None)).count())
+      return r.branch(
+          row['jobs'][jobid]['finished'].default(None).ne(None)
+        , {'jobs': jobs}
+        , pending.le(1)
+        , {'jobs': jobs, 'pending_jobs': 0
+          , 'finished': row['finished'].default(doc['finished'])}
+        , {'jobs': jobs, 'pending_jobs': pending.sub(1)}
+      )
+    result = self.q.get(self._docid).update(update, return_changes=True
+                                                        ).run(self.conn)
+    if result['errors']:
+      raise WorkerError('RethinkDB: {}'.format(result['first_error']))
+    # A family finished by the Distributor, because it failed, is not
+    # finished again.
+    return any(change['new_val'].get('pending_jobs') == 0
+                  and (change['old_val'] or {}).get('pending_jobs') != 0
+                  and (change['old_val'] or {}).get('finished') is None
+                  for change in result['changes'])
+
+  def finish_family(self, doc):
+    """
+    Update the family document with `doc`, which must contain 'finished',
+    if it is not finished yet.
+
+    Returns True if this finished the family document.
+    """
+    r = self.r
+    result = self.q.get(self._docid).update(lambda row: r.branch(
+                          row['finished'].default(None).eq(None), doc, {})
+                        ).run(self.conn)
+    if result['errors']:
+      raise WorkerError('RethinkDB: {}'.format(result['first_error']))
+    return result['replaced'] > 0
+
+  def get_recorded_checks(self, keys, fontbakery_version):
+    """
+    The items of `keys` that have a result from this job already, i.e.
+    from a previous delivery of the job that crashed or was evicted.
+    Results from another Font Bakery version don't count, that's the
+    version the job recorded when it started.
+    """
+    r = self.r
+    jobid = self._jobid
+    return self.q.get(self._docid).do(lambda doc: r.branch(
+        doc['jobs'][jobid]['fontBakeryVersion'].default(None)
+                                                .eq(fontbakery_version)
+      , r.expr(keys).filter(lambda key:
+                  doc['tests'][key]['job_id'].default(None).eq(jobid)
+                    .and_(doc['tests'][key]['result'].default(None).ne(None)))
+      , []
+    )).run(self.conn)
+
   def insert_checks(self, check_results):
     r = self.r
-    doc = {
-        'tests': r.row['tests'].merge(check_results)
-      # increase the counter
-      # FIXME: This is a denormalization, and we can most probably create
-      # a rethinkdb query to fetch a results object like this on the fly.
-      # This is mainly useful for the collection-wide test results view.
-      # Maybe an on-the-fly created results object is fast enough. After all,
-      # this is a classical case for an SQL database query.
-
-      # This was the first version with the following problem:
-      # if the worker is in a crashback loop and the same tests are
-      # executed multiple times, the result fields can grow bigger than
-      # their actual number i.e. total > len(tests), yet we may not be
-      # finished with all tests.
-      #, 'results': r.row['results'].merge(lambda results: {
-      #    test_result['result']: results[test_result['result']].default(0).add(1)
-      #})
-      # this recreates the results dict on each insert
-      # to avoid the race condition, the r.row['tests'] is recreated
-      # here on the fly
-        , 'results': r.row['tests'].merge(check_results)
-                    .values()
-                    .filter(lambda item: item.has_fields('result'))
-                    .map(lambda item: item['result'])
-                    .fold({}, lambda acc, result: acc.merge(
-                        r.object(result, acc[result].default(0).add(1))))
-    }
-
-    result = self.q.get(self._docid).update(doc).run(self.conn)
+    # FIXME: 'results' is a denormalization, and we can most probably create
+    # a rethinkdb query to fetch a results object like this on the fly.
+    # This is mainly useful for the collection-wide test results view.
+    # Maybe an on-the-fly created results object is fast enough. After all,
+    # this is a classical case for an SQL database query.
+    #
+    # The counters are updated only for the keys in check_results, this
+    # is cheap, other than re-counting all 'tests' on each insert.
+    # It is idempotent: if the worker is in a crashback loop and the same
+    # tests are executed multiple times, the previous result of a test
+    # is subtracted before the new result is added. So, the sum of all
+    # counters can't become bigger than len(tests).
+    items = [[key, test_result['result']]
+                for key, test_result in check_results.items()
+                                          if 'result' in test_result]
+    def count_result(doc, results, item):
+      key, result = item[0], item[1]
+      previous = doc['tests'][key]['result'].default(None)
+      results = r.branch(previous.eq(None)
+                       , results
+                       , results.merge(r.object(previous
+                                    , results[previous].default(0).sub(1))))
+      return results.merge(r.object(result, results[result].default(0).add(1)))
+
+    query = self.q.get(self._docid).update(lambda doc: {
+        'tests': doc['tests'].merge(check_results)
+      , 'results': r.expr(items).fold(doc['results'].default({})
+                                , lambda results, item: count_result(
+                                                      doc, results, item))
+                    # drop counters that went down to zero
+                    .coerce_to('array')
+                    .filter(lambda pair: pair[1].ne(0))
+                    .coerce_to('object')
+    })
+    result = query.run(self.conn)
     if result['errors']:
       raise WorkerError('RethinkDB: {}'.format(result['first_error']))
 
 
+class CheckStats(object):
+  """
+  Runtimes of the checks, recorded by the Checker and used by the
+  Distributor to predict the cost of the sub-jobs.
+
+  One document per check id:
+      {'id': check_id, 'runs': int, 'duration': float seconds}
+  `duration` is an exponential moving average of the duration of one
+  execution of the check, so that it follows changes of Font Bakery.
+  """
+  # weight of the latest measurement in the moving average
+  ALPHA = 0.3
+
+  def __init__(self, rethinkdb):
+    # r, rdb_connection, db_name = rethinkdb
+    self._rethinkdb = rethinkdb
+
+  @property
+  def q(self):
+    r, _,  db_name = self._rethinkdb
+    return r.db(db_name).table(RDB_CHECKSTATS)
+
+  @property
+  def conn(self):
+    _, rdb_connection, _ = self._rethinkdb
+    return rdb_connection
+
+  def get_durations(self, check_ids):
+    """ -> {check_id: duration} for all check_ids with a history. """
+    if not check_ids:
+      return {}
+    docs = self.q.get_all(*check_ids).pluck('id', 'duration').run(self.conn)
+    return {doc['id']: doc['duration'] for doc in docs}
+
+  def record(self, check_durations):
+    """ check_durations: {check_id: (count, total_seconds)} """
+    docs = [{'id': check_id, 'runs': count, 'duration': total / count}
+                for check_id, (count, total) in check_durations.items()
+                                                              if count]
+    if not docs:
+      return
+    alpha = self.ALPHA
+    self.q.insert(docs, conflict=lambda _id, old, new: new.merge({
+        'runs': old['runs'].default(0).add(new['runs'])
+      , 'duration': old['duration'].default(new['duration'])
+                                   .mul(1 - alpha)
+                                   .add(new['duration'].mul(alpha))
+    })).run(self.conn)
+
+
+# Increase when the results of the dashboard change for the same Font
+# Bakery version, e.g. if _dashboard_check_skip_filter changes.
+CHECK_RESULTS_FORMAT = 1
+
+# Results of checks that depend on remote resources can change without
+# a change of the files, these are not cached.
+_REMOTE_CHECKS = {
+    'com.google.fonts/check/description/broken_links'
+  , 'com.google.fonts/check/metadata/broken_links'
+  , 'com.google.fonts/check/metadata/profiles_csv'
+    # queries the namecheck service
+  , 'com.google.fonts/check/fontdata_namecheck'
+    # queries PyPI
+  , 'com.google.fonts/check/fontbakery_version'
+}
+_REMOTE_CONDITIONS = {
+    'network'
+  , 'listed_on_gfonts_api'
+  , 'remote_styles'
+  , 'api_gfonts_ttFont'
+  , 'github_gfonts_ttFont'
+}
+
+
+def _hash_file(directory, path):
+  """The name is part of the hash, some checks are about file names."""
+  sha = hashlib.sha256(os.path.relpath(path, directory).encode('utf-8'))
+  sha.update(b'\0')
+  with open(path, 'rb') as f:
+    for chunk in iter(lambda: f.read(1024 * 1024), b''):
+      sha.update(chunk)
+  return sha.hexdigest()
+
+
+def _hash_items(*items):
+  return hashlib.sha256(json.dumps(items).encode('utf-8')).hexdigest()
+
+
+class CheckResultCache(object):
+  """
+  Results of previous runs of the checks on the same files, with the
+  same Font Bakery version and profile configuration. In a run of a
+  whole collection most fonts are unchanged since the last run, their
+  results are copied from here instead of running the checks again.
+
+  One document per result:
+      {'id': cache id, 'check_id': str, 'created': datetime
+      , 'result': {'result': status name, 'statuses': [...]}}
+
+  The cache id is the hash of the version, the profile configuration,
+  the check id and the content of the files the check can depend on.
+  For a check of one font these are the font and all files that are no
+  fonts (e.g. METADATA.pb), for the checks of the family and the
+  checks that depend on the `fonts` of the family these are all files.
+  """
+  def __init__(self, rethinkdb, max_age_days):
+    # r, rdb_connection, db_name = rethinkdb
+    self._rethinkdb = rethinkdb
+    self._max_age = timedelta(days=max_age_days)
+
+  @property
+  def q(self):
+    r, _,  db_name = self._rethinkdb
+    return r.db(db_name).table(RDB_CHECKRESULTS)
+
+  @property
+  def conn(self):
+    _, rdb_connection, _ = self._rethinkdb
+    return rdb_connection
+
+  def get_ids(self, directory, fonts, order):
+    """
+    -> {serialized identity: cache id} for the cachable items of the
+    serialized `order`.
+    """
+    runner, profile = get_fontbakery(fonts)
+    _, specifics = _load_profile()
+    config = _hash_items(CHECK_RESULTS_FORMAT, fontbakery.__version__
+                                    , repr(sorted(specifics.items())))
+    font_hashes = [_hash_file(directory, font) for font in fonts]
+    font_paths = set(fonts)
+    other_hashes = sorted(_hash_file(directory, os.path.join(dirpath, name))
+                  for dirpath, _, names in os.walk(directory)
+                  for name in names
+                  if os.path.join(dirpath, name) not in font_paths)
+    family_hash = _hash_items(sorted(font_hashes), other_hashes)
+    ids = {}
+    for key, (_, check, iterargs) in zip(order
+                                      , profile.deserialize_order(order)):
+      dependencies = profile.get_deep_check_dependencies(check)
+      if check.id in _REMOTE_CHECKS or dependencies & _REMOTE_CONDITIONS:
+        continue
+      if not iterargs:
+        content = family_hash
+      elif len(iterargs) == 1 and iterargs[0][0] == 'font' \
+                              and 'fonts' not in dependencies:
+        content = _hash_items(font_hashes[iterargs[0][1]], other_hashes)
+      elif all(name == 'font' for name, _ in iterargs):
+        content = family_hash
+      else:
+        # other iterargs than fonts are not used by the dashboard
+        continue
+      ids[key] = _hash_items(config, check.id, content)
+    return ids
+
+  def get(self, ids):
+    """ -> {serialized identity: test_result} for the cached ids. """
+    if not ids:
+      return {}
+    keys = {cache_id: key for key, cache_id in ids.items()}
+    oldest = datetime.now(pytz.utc) - self._max_age
+    docs = self.q.get_all(*keys).run(self.conn)
+    return {keys[doc['id']]: doc['result']
+                    for doc in docs if doc['created'] >= oldest}
+
+  def put(self, ids, check_results):
+    """ check_results: {serialized identity: test_result} """
+    now = datetime.now(pytz.utc)
+    docs = [{
+          'id': ids[key]
+        , 'check_id': json.loads(key)['check']
+        , 'created': now
+        , 'result': {'result': test_result['result']
+                   , 'statuses': test_result['statuses']}
+      } for key, test_result in check_results.items()
+            # errors can be temporary
+            if key in ids and test_result.get('result') not in (None, 'ERROR')]
+    if docs:
+      self.q.insert(docs, conflict='replace').run(self.conn)
+
+
+class _CachingOperations(object):
+  """
+  DBOperations for the ResultsWriter, that also puts the results of
+  the checks into the CheckResultCache, in the thread of the writer.
+  """
+  def __init__(self, dbOps, result_cache, cache_ids, log):
+    self._dbOps = dbOps
+    self._result_cache = result_cache
+    self._cache_ids = cache_ids
+    self._log = log
+
+  def insert_checks(self, check_results):
+    self._dbOps.insert_checks(check_results)
+    try:
+      self._result_cache.put(self._cache_ids, check_results)
+    except Exception as e:
+      if is_transient_error(e):
+        raise
+      # only an optimization, it must not fail the job
+      self._log.warning('Can\'t write the check result cache: %s', e)
+
+
+def distribute_by_cost(items, costs, bins):
+  """
+  Split items into at most `bins` lists with about the same sum of
+  `costs`. Greedy: the most expensive items first, each into the
+  cheapest list so far. The lists keep the original order of items.
+  """
+  heap = [(0, index, []) for index in range(bins)]
+  by_cost = sorted(range(len(items)), key=lambda i: costs[i], reverse=True)
+  for i in by_cost:
+    total, index, indexes = heapq.heappop(heap)
+    indexes.append(i)
+    heapq.heappush(heap, (total + costs[i], index, indexes))
+  return [[items[i] for i in sorted(indexes)]
+                          for _, _, indexes in sorted(heap, key=lambda b: b[1])
+                          if indexes]
+
+
 def validate_filename(logs, seen, raw_filename):
   # Basic input validation
   filename = os.path.normpath(raw_filename)
   # os.path.normpath will have taken care of any of these names that are
   # not a problem.
-  if any(part in {'', '.', '..'} for part in filename.split(os.sep)):
-    raise PreparationError(f'Invalid filename: "{filename}"` contains a '
+  for part in filename.split(os.sep):
+    if part in {'', '.', '..'}:
+      raise PreparationError(f'Invalid filename: "{filename}"` contains a '
                            f'"{part}" raw_filename was "{raw_filename}".')
 
   if filename in seen:
@@ -143,9 +514,49 @@ def validate_filename(logs, seen, raw_filename):
   return True
 
 
-def _prepare(job, cache, dbOps=None, tmp_directory=None):
+# `MAXFILES` font files should be small enough to not totally DOS us
+# easily. And big enough for all of our jobs, otherwise, change ;-)
+MAXFILES = 45
+
+def _is_fontfile(path):
+  return path.lower().endswith('.ttf') or path.lower().endswith('.otf')
+
+
+def _check_maxfiles(fontfiles):
+  if fontfiles > MAXFILES:
+    raise PreparationError('Found more than {0} font files, but '
+                           'maximum is limiting to {0}.'.format(MAXFILES))
+
+
+def _download_validator():
+  """
+  For FileCache.acquire: the limits of _prepare, checked before a file
+  is written to the cache, a job that breaks them is not downloaded
+  completely.
+  """
+  seen = set()
+  fontfiles = 0
+  def validate(jobFile):
+    nonlocal fontfiles
+    # raises for invalid file names, the logs are written by _prepare
+    if not validate_filename([], seen, jobFile.name):
+      return
+    if _is_fontfile(jobFile.name):
+      fontfiles += 1
+      _check_maxfiles(fontfiles)
+  return validate
+
+
+def _prepare(job, cache, dbOps=None, tmp_directory=None, file_cache=None):
   """
     Write files from the grpc.StorageServer to tmp_directory.
+    If tmp_directory is None (a dry run) only the file names are
+    fetched from the grpc.StorageServer.
+    If file_cache is set, the files are linked from the local
+    FileCache instead, it fetches them only if they are not cached.
+    Files are received one after the other and written immediately,
+    the `MAXFILES` limit is checked on the way, so we don't receive all
+    of a job that is too big.
 
     Returns a list of log messages for each file in job.files, some may
     be skipped. This is to give the user direct feedback about the request
@@ -153,37 +564,47 @@ def _prepare(job, cache, dbOps=None, tmp_directory=None):
 
     Raises FontbakeryPreparationError if files appear to be invalid.
   """
-  # `maxfiles` files should be small enough to not totally DOS us easily.
-  # And big enough for all of our jobs, otherwise, change ;-)
-  files = cache.get(job.cache_key).files
-  maxfiles = 45
+  cache_entry = None
+  if tmp_directory is None:
+    # A dry run only needs the file names, don't transfer the data.
+    files = cache.get_files_meta(job.cache_key).files
+  else:
+    if file_cache is not None:
+      cache_entry = file_cache.acquire(job.cache_key, cache
+                                     , _download_validator())
+    files = cache_entry.files if cache_entry is not None \
+                              else cache.get_files(job.cache_key)
   logs = ['Font Bakery version: {}'.format(fontbakery.__version__)]
   if tmp_directory is None:
     logs.append('Dry run! tmp_directory is None.')
   seen = set()
 
   fontfiles = []
-  for jobFile in files:
-    raw_filename = jobFile.name
-    if not validate_filename(logs, seen, raw_filename):
-      continue
-    filename = os.path.normpath(raw_filename)
-
-    if tmp_directory is not None:
-      path = os.path.join(tmp_directory, filename)
-      os.makedirs(os.path.dirname(path), exist_ok=True)
-      with open(path, 'wb') as f:
-        f.write(jobFile.data)
-    else:
-      path = filename
+  try:
+    for jobFile in files:
+      raw_filename = jobFile.name
+      if not validate_filename(logs, seen, raw_filename):
+        continue
+      filename = os.path.normpath(raw_filename)
 
-    logs.append('Added file "{}".'.format(raw_filename))
-    if path.lower().endswith('.ttf') or path.lower().endswith('.otf'):
-      fontfiles.append(path)
+      if tmp_directory is not None:
+        path = os.path.join(tmp_directory, filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if cache_entry is not None:
+          cache_entry.link(raw_filename, path)
+        else:
+          with open(path, 'wb') as f:
+            f.write(jobFile.data)
+      else:
+        path = filename
 
-  if len(fontfiles) > maxfiles:
-    raise PreparationError('Found {} font files, but maximum '
-                    'is limiting to {}.'.format(len(fontfiles), maxfiles))
+      logs.append('Added file "{}".'.format(raw_filename))
+      if _is_fontfile(path):
+        fontfiles.append(path)
+        _check_maxfiles(len(fontfiles))
+  finally:
+    if cache_entry is not None:
+      file_cache.release(cache_entry)
 
   # If this is a problem, fontbakery itself should have a check for
   # it. It improves the reporting! Also, this was limited to ".ttf"
@@ -197,15 +618,34 @@ def _prepare(job, cache, dbOps=None, tmp_directory=None):
 
 class DashbordWorkerReporter(FontbakeryReporter):
   def __init__(self, dbOps, jobid, profile, runner
-                                          , ticks_to_flush = None, **kwd):
+                                          , ticks_to_flush = None
+                                          , flush_interval_ms = None
+                                          , flush_bytes = None, **kwd):
     super(DashbordWorkerReporter, self).__init__(runner=runner, **kwd)
     self._dbOps = dbOps
     self._jobid = jobid
     self._profile = profile;
-    self.ticks_to_flush = ticks_to_flush or 1
+    # Flush when the first of these limits is reached, None disables
+    # a limit. Without limits, every result is flushed immediately.
+    self.ticks_to_flush = ticks_to_flush
+    self.flush_interval = flush_interval_ms / 1000 \
+                            if flush_interval_ms is not None else None
+    self.flush_bytes = flush_bytes
     self.doc = []
     self._current = None
+    self._current_started = None
     self._collectedChecks = None
+    # monotonic time of the oldest unflushed result
+    self._collectedSince = None
+    # approximate JSON size of the unflushed results
+    self._collectedBytes = 0
+    # the unflushed results are also taken by `take_stale`, from the
+    # thread of a ResultsWriter
+    self._collectedLock = threading.Lock()
+    # {check_id: [count, total_seconds]}, see CheckStats
+    self.check_durations = {}
+    # seconds spent in flush, writing to the database
+    self.flush_duration = 0.0
 
   def _register(self, event):
     super(DashbordWorkerReporter, self)._register(event)
@@ -217,12 +657,24 @@ class DashbordWorkerReporter(FontbakeryReporter):
     key = self._profile.serialize_identity(identity)
 
     if status == STARTCHECK:
+        self._current_started = time.monotonic()
         self._current = {
             'job_id': self._jobid # for debugging/analysis tasks
           , 'statuses': []
         }
 
     if status == ENDCHECK:
+        ended = time.monotonic()
+        duration = ended - self._current_started
+        # monotonic clock of the worker process, seconds
+        self._current['timing'] = {
+            'start': self._current_started
+          , 'end': ended
+          , 'duration': duration
+        }
+        count_total = self.check_durations.setdefault(test.id, [0, 0.0])
+        count_total[0] += 1
+        count_total[1] += duration
         # Do more? Anything more would make access easier but also be a
         # derivative of the actual data, i.e. not SSOT. Calculating (and
         # thus interpreting) results for the tests is probably not too
@@ -262,29 +714,347 @@ class DashbordWorkerReporter(FontbakeryReporter):
 
   def _save_result(self, key, test_result):
     """ send test_result to the retthinkdb document"""
-    if self._collectedChecks is None:
-      self._collectedChecks = {}
-    self._collectedChecks[key] = test_result
-    if len(self._collectedChecks) >= self.ticks_to_flush:
+    with self._collectedLock:
+      if self._collectedChecks is None:
+        self._collectedChecks = {}
+        self._collectedSince = time.monotonic()
+        self._collectedBytes = 0
+      self._collectedChecks[key] = test_result
+      if self.flush_bytes is not None:
+        self._collectedBytes += len(key) + len(json.dumps(test_result
+                                                          , default=str))
+      needs_flush = self._needs_flush()
+    if needs_flush:
       self.flush()
 
-  def flush(self):
-    if self._collectedChecks:
-      self._dbOps.insert_checks(self._collectedChecks)
+  def _needs_flush(self):
+    limits = (self.ticks_to_flush, self.flush_interval, self.flush_bytes)
+    if all(limit is None for limit in limits):
+      return True
+    if self.ticks_to_flush is not None \
+              and len(self._collectedChecks) >= self.ticks_to_flush:
+      return True
+    if self.flush_interval is not None \
+              and time.monotonic() - self._collectedSince >= self.flush_interval:
+      return True
+    if self.flush_bytes is not None \
+              and self._collectedBytes >= self.flush_bytes:
+      return True
+    return False
+
+  def _take_collected(self):
+    collected = self._collectedChecks
     self._collectedChecks = None
+    return collected
+
+  def take_stale(self):
+    """
+    The unflushed results if they are older than the flush interval,
+    otherwise None. These are not flushed anymore by the reporter.
+
+    The interval is checked when a result is saved, a check can run
+    much longer than that. A ResultsWriter calls this in its thread
+    to write these results anyways, see `ResultsWriter.watch`.
+    """
+    with self._collectedLock:
+      if self._collectedChecks and self.flush_interval is not None \
+          and time.monotonic() - self._collectedSince >= self.flush_interval:
+        return self._take_collected()
+    return None
+
+  def flush(self):
+    with self._collectedLock:
+      collected = self._take_collected()
+    if collected:
+      # outside of the lock, this can block, see ResultsWriter
+      started = time.monotonic()
+      self._dbOps.insert_checks(collected)
+      self.flush_duration += time.monotonic() - started
+
+  @property
+  def checks_duration(self):
+    """ seconds spent executing checks """
+    return sum(total for _, total in self.check_durations.values())
+
+
+class ResultsWriter(object):
+  """
+  Writes the test results in a thread of its own, so that the checks
+  don't have to wait for the database. Has the `insert_checks` method
+  of DBOperations and can be used instead of it by the reporter.
+
+  Batches that are pending at the same time are merged into one write.
+  If there are `maxsize` batches pending, `insert_checks` blocks until
+  the writer caught up. The first error of a write is re-raised by the
+  next call to `insert_checks` or `close`, no further writes happen.
+
+  With `watch` the writer also takes results that a reporter holds back
+  for too long, while a long running check blocks the reporter.
+
+  CAUTION: while the writer is open, the database connection of dbOps
+  must not be used by other threads.
+  """
+  def __init__(self, dbOps, maxsize=8):
+    self._dbOps = dbOps
+    self._maxsize = maxsize
+    self._pending = deque()
+    self._condition = threading.Condition()
+    self._closed = False
+    self._error = None
+    # see watch
+    self._take_stale = None
+    self._stale_interval = None
+    # seconds spent writing to the database
+    self.write_duration = 0.0
+    self._thread = threading.Thread(target=self._work, daemon=True
+                                  , name='results-writer')
+    self._thread.start()
+
+  def _raise_error(self):
+    if self._error is not None:
+      raise WorkerError('Writing test results failed.') from self._error
+
+  def insert_checks(self, check_results):
+    with self._condition:
+      while len(self._pending) >= self._maxsize and self._error is None:
+        self._condition.wait()
+      self._raise_error()
+      if self._closed:
+        raise WorkerError('ResultsWriter is closed.')
+      self._pending.append(check_results)
+      self._condition.notify_all()
+
+  def watch(self, take_stale, interval):
+    """
+    Every `interval` seconds call `take_stale` in the writer thread and
+    write the results it returns, e.g. `DashbordWorkerReporter.take_stale`.
+    """
+    with self._condition:
+      self._take_stale = take_stale
+      self._stale_interval = interval
+      self._condition.notify_all()
+
+  def _next_results(self):
+    with self._condition:
+      while not self._pending and not self._closed:
+        if self._stale_interval is None:
+          self._condition.wait()
+        elif not self._condition.wait(self._stale_interval):
+          # timed out
+          break
+      check_results = {}
+      while self._pending:
+        # a later result for the same key replaces an earlier one
+        check_results.update(self._pending.popleft())
+      self._condition.notify_all()
+      closed = self._closed
+      take_stale = self._take_stale
+    if take_stale is not None and not closed:
+      # outside of the condition, the reporter may wait for it
+      check_results.update(take_stale() or {})
+    return check_results, closed
+
+  def _work(self):
+    while True:
+      check_results, closed = self._next_results()
+      if not check_results:
+        if closed:
+          # closed and all is written
+          return
+        continue
+      started = time.monotonic()
+      try:
+        self._dbOps.insert_checks(check_results)
+      except Exception as e:
+        with self._condition:
+          self._error = e
+          self._pending.clear()
+          self._condition.notify_all()
+        return
+      finally:
+        self.write_duration += time.monotonic() - started
+
+  def close(self, reraise=True):
+    """Wait until everything is written."""
+    with self._condition:
+      self._closed = True
+      self._condition.notify_all()
+    self._thread.join()
+    if reraise:
+      self._raise_error()
+
+
+class _QueueReporter(DashbordWorkerReporter):
+  """
+  Used in the processes of CheckerPool, instead of writing to the
+  database, the results are sent to the parent process.
+  """
+  def __init__(self, result_queue, jobid, profile, runner, **kwd):
+    super(_QueueReporter, self).__init__(None, jobid, profile, runner, **kwd)
+    self._result_queue = result_queue
+
+  def _save_result(self, key, test_result):
+    self._result_queue.put((key, test_result))
+
+  def flush(self):
+    pass
+
+
+def _init_checker_process():
+  # Make the process warm, this is expensive and would otherwise
+  # be done by the first job of each process.
+  _load_profile()
+
+
+def _warm_up_checks(fonts, serialized_order):
+  """Run checks like a job does, raise if one of them had an ERROR."""
+  result_queue = queue.Queue()
+  _run_checks(fonts, serialized_order, 'warm-up', result_queue)
+  for key, test_result in iter(result_queue.get, None):
+    if test_result['result'] == 'ERROR':
+      raise WorkerError('Warm-up check {} had an ERROR: {}'.format(key
+                                                , test_result['statuses']))
+
+
+def _warm_up_checker_process(barrier, fonts, serialized_order):
+  # All processes wait for each other, so each one gets one of these
+  # calls and all are started now, not when the first jobs arrive.
+  barrier.wait()
+  if fonts:
+    _warm_up_checks(fonts, serialized_order)
+
+
+def _run_checks(fonts, serialized_order, jobid, result_queue):
+  """Runs in a process of CheckerPool."""
+  try:
+    runner, profile = get_fontbakery(fonts)
+    order = profile.deserialize_order(serialized_order)
+    reporter = _QueueReporter(result_queue, jobid, profile=profile
+                                                 , runner=runner)
+    reporter.run(order)
+    return reporter.check_durations
+  finally:
+    # end of results
+    result_queue.put(None)
+
+
+class CheckerPool(object):
+  """
+  A pool of pre-started processes, each with Font Bakery and the
+  googlefonts profile already imported, to run the CPU heavy checks
+  of the Checker. The results are streamed back to the calling process
+  which does the database I/O in the meantime.
+
+  The processes are forked from a forkserver, a single threaded process
+  that has no copy of the threads, locks or gRPC channels of this
+  process. Hence, the pool can be (re-)started at any time.
+  """
+  def __init__(self, processes):
+    self._processes = processes
+    self._context = multiprocessing.get_context('forkserver')
+    # imported once by the forkserver, not by each checker process
+    self._context.set_forkserver_preload([__name__])
+    self._manager = self._context.Manager()
+    self._executor = None
+    self._lock = threading.Lock()
+    # (fonts, serialized_order) see warm_up
+    self._warm_up_job = (None, None)
+    self._start()
+
+  def _start(self):
+    self._executor = ProcessPoolExecutor(max_workers=self._processes
+                                       , mp_context=self._context
+                                       , initializer=_init_checker_process)
+    self._warm_up(self._executor)
+
+  def _warm_up(self, executor):
+    barrier = self._manager.Barrier(self._processes)
+    for future in wait([executor.submit(_warm_up_checker_process
+                                      , barrier, *self._warm_up_job)
+                                for _ in range(self._processes)]).done:
+      # raises e.g. if the profile can't be loaded
+      future.result()
+
+  def warm_up(self, fonts, serialized_order):
+    """
+    Run the checks of `serialized_order` once in each process, the
+    results are discarded. Also done for the processes of a restart.
+    """
+    with self._lock:
+      self._warm_up_job = (fonts, list(serialized_order))
+      executor = self._executor
+    self._warm_up(executor)
+
+  def _submit(self, *args):
+    with self._lock:
+      executor = self._executor
+    try:
+      return executor.submit(*args)
+    except BrokenProcessPool:
+      # A process died, e.g. killed by the OOM killer, start over.
+      # Concurrent jobs may all get here, restart only once.
+      with self._lock:
+        if self._executor is executor:
+          self._start()
+        executor = self._executor
+      return executor.submit(*args)
+
+  def run(self, fonts, serialized_order, jobid, save_result):
+    """
+    Call `save_result(key, test_result)` for each result as it arrives.
+    Exceptions of the checker process are re-raised.
+
+    Returns the check_durations of the reporter.
+    """
+    result_queue = self._manager.Queue()
+    future = self._submit(_run_checks, fonts, list(serialized_order)
+                                                , jobid, result_queue)
+    while True:
+      try:
+        item = result_queue.get(timeout=1)
+      except queue.Empty:
+        if future.done():
+          # the process ended without sending the end of results
+          break
+        continue
+      if item is None:
+        break
+      save_result(*item)
+    # raises if the job failed
+    return future.result()
 
 
 class Distributor(WorkerBase):
   JobType=FamilyJob
+  warm_up = staticmethod(_warm_up)
+
   def __init__(self, logging, job, cache, rethinkdb, queue):
     self._log = logging
     self._job = job
     self._cache = cache
     # rethinkdb = (r, rdb_connection, rdb_name)
+    self._checkStats = CheckStats(rethinkdb)
     rethinkdb = rethinkdb + (RDB_FAMILYTESTS, )
     self._dbOps = DBOperations(rethinkdb, job)
     self._queue = queue
 
+  def _predict_costs(self, check_ids):
+    """
+    Predicted duration for each item of check_ids. Checks without
+    history get the average of the known checks.
+    """
+    try:
+      durations = self._checkStats.get_durations(list(set(check_ids)))
+    except Exception as e:
+      if is_transient_error(e):
+        raise
+      # Without history all checks are equally expensive, that's
+      # still a valid distribution.
+      self._log.warning('Can\'t read check durations: %s', e)
+      durations = {}
+    fallback = (sum(durations.values()) / len(durations)) if durations else 1
+    return [durations.get(check_id, fallback) for check_id in check_ids]
+
   def _run(self, fonts):
     # this is a dry run, but it will fail early if there's a problem with
     # the files in job, also, it lists the fonts.
@@ -294,16 +1064,13 @@ class Distributor(WorkerBase):
     full_order = list(profile.serialize_order(runner.order))
     tests = {identity:{'index':index}  for index, identity in enumerate(full_order)}
 
-    # FIXME: do something fancy to split this up
-    # maybe we can distribute long running tests evenly or such
-    # this would require more info of course.
     jobs = len(fonts) + 1  # go with number of fonts plus one for not font specific checks parallel jobs
     self._log.info('worker_distribute_jobs: Splitting up into %s jobs.', jobs)
 
-    from math import ceil
-    job_size = int(ceil(len(full_order) / jobs))
-    orders = [full_order[i:i+job_size]
-                              for i in range(0, len(full_order), job_size)]
+    # Distribute the long running checks evenly, using the runtimes
+    # of previous runs.
+    costs = self._predict_costs([check.id for _, check, _ in runner.order])
+    orders = distribute_by_cost(full_order, costs, jobs)
 
     jobs_meta = {}
     jobs = []
@@ -338,6 +1105,8 @@ class Distributor(WorkerBase):
                                           for _, test, _ in runner.order}
           # and to have a place where the sub-workers can report
         , 'jobs': jobs_meta # record start and end times
+          # counted down by the checkers, see DBOperations.finish_job
+        , 'pending_jobs': len(jobs)
         , 'tests': tests
         , 'results': {}
     })
@@ -368,13 +1137,15 @@ class Distributor(WorkerBase):
     # write to the DB doc
     # if there is a jobid, this is reported in the job, otherwise it
     # is reported in the doc.
-    self._dbOps.update({'finished': datetime.now(pytz.utc)
-                      , 'exception': traceback
-                      })
+    finished_family = self._dbOps.finish_family({
+                                  'finished': datetime.now(pytz.utc)
+                                , 'exception': traceback
+                                })
 
     # If the Distributor worker fails we MUST send a CompletedWorker message.
     message = CompletedWorker()
     message.worker_name = 'fontbakery'
+    message.finished_family = finished_family
     message.completed_message.Pack(self._job)
     self._queue.end(message)
     return True # exception handled
@@ -382,19 +1153,153 @@ class Distributor(WorkerBase):
 
 class Checker(WorkerBase):
   JobType=FamilyJob
-  def __init__(self, logging, job, cache, rethinkdb, queue, tmp_directory, ticks_to_flush):
+
+  @classmethod
+  def warm_up(cls, font_path, resources):
+    """
+    Run one check of the font, like a job does, in all processes of the
+    CheckerPool if there is one. The check has conditions, hence this
+    opens the font and evaluates conditions through the runner, a broken
+    runner fails here and not in the first job.
+    """
+    runner, profile = get_fontbakery([font_path])
+    full_order = profile.serialize_order(runner.order)
+    for key, (_, check, iterargs) in zip(full_order, runner.order):
+      dependencies = profile.get_deep_check_dependencies(check)
+      if check.id in _REMOTE_CHECKS or dependencies & _REMOTE_CONDITIONS:
+        continue
+      if check.conditions and 'ttFont' in dependencies \
+                          and iterargs and iterargs[0][0] == 'font':
+        order = [key]
+        break
+    else:
+      raise WorkerError('No check of a font with conditions to warm up '
+                        'with.')
+    checker_pool = resources.get('checker_pool', None)
+    if checker_pool is not None:
+      checker_pool.warm_up([font_path], order)
+    else:
+      _warm_up_checks([font_path], order)
+
+  def __init__(self, logging, job, cache, rethinkdb, queue, tmp_directory
+                   , ticks_to_flush, flush_interval_ms, flush_bytes
+                   , checker_pool, file_cache, result_cache_days):
     self._log = logging
     self._job = job
     self._cache = cache
+    # None or a FileCache, shared by all jobs of this worker
+    self._file_cache = file_cache
 
     # rethinkdb = (r, rdb_connection, rdb_name)
+    self._checkStats = CheckStats(rethinkdb)
+    self._result_cache = CheckResultCache(rethinkdb, result_cache_days) \
+                                  if result_cache_days is not None else None
     rethinkdb = rethinkdb + (RDB_FAMILYTESTS, )
     self._dbOps = DBOperations(rethinkdb, job)
     self._queue = queue
     self._tmp_directory = tmp_directory
     self._ticks_to_flush = ticks_to_flush
+    self._flush_interval_ms = flush_interval_ms
+    self._flush_bytes = flush_bytes
+    # None or a CheckerPool
+    self._checker_pool = checker_pool
+    self._preparation_duration = None
+    # set by _finish_job
+    self._finished_family = False
+
+  def _make_reporter(self, writer, profile=None, runner=None):
+    reporter = DashbordWorkerReporter(writer, self._job.jobid,
+                                    profile=profile
+                                  , runner=runner
+                                  , ticks_to_flush=self._ticks_to_flush
+                                  , flush_interval_ms=self._flush_interval_ms
+                                  , flush_bytes=self._flush_bytes
+                                  , )
+    if reporter.flush_interval is not None:
+      # flush during long running checks as well
+      writer.watch(reporter.take_stale, reporter.flush_interval)
+    return reporter
+
+  def _run_in_pool(self, fonts, order, writer):
+    reporter = self._make_reporter(writer)
+    reporter.check_durations = self._checker_pool.run(fonts
+                  , order, self._job.jobid, reporter._save_result)
+    return reporter
+
+  def _run_checks(self, fonts, order, writer):
+    if not order:
+      # nothing left to do
+      return self._make_reporter(writer)
+    if self._checker_pool is not None:
+      return self._run_in_pool(fonts, order, writer)
+    runner, profile = get_fontbakery(fonts)
+    order = profile.deserialize_order(order)
+    reporter = self._make_reporter(writer, profile, runner)
+    reporter.run(order)
+    return reporter
+
+  def _record_check_durations(self, check_durations):
+    # The runtimes are only used to plan future jobs, not being able
+    # to record them must not fail this job.
+    try:
+      self._checkStats.record(check_durations)
+    except Exception as e:
+      if is_transient_error(e):
+        raise
+      self._log.warning('Can\'t record check durations: %s', e)
+
+  def _get_remaining_order(self):
+    """
+    If the job runs again, e.g. after the pod was evicted, the checks
+    that have a result already are skipped.
+    """
+    order = list(self._job.order)
+    try:
+      recorded = set(self._dbOps.get_recorded_checks(order
+                                              , fontbakery.__version__))
+    except Exception as e:
+      if is_transient_error(e):
+        raise
+      self._log.warning('Can\'t read the recorded checks: %s', e)
+      return order
+    if recorded:
+      self._log.info('Resuming job %s of docid %s: %s of %s checks have '
+                     'a result already.', self._job.jobid, self._job.docid
+                                        , len(recorded), len(order))
+    return [identity for identity in order if identity not in recorded]
+
+  def _get_cached_results(self, fonts, order):
+    """
+    -> (cache_ids, cached)
+    cache_ids: {key: cache id} of the checks that must run and can be
+    put into the cache.
+    cached: {key: test_result} of the checks that don't need to run.
+    """
+    if self._result_cache is None or not order:
+      return {}, {}
+    try:
+      cache_ids = self._result_cache.get_ids(self._tmp_directory, fonts
+                                                                  , order)
+      cached = self._result_cache.get(cache_ids)
+    except Exception as e:
+      if is_transient_error(e):
+        raise
+      self._log.warning('Can\'t read the check result cache: %s', e)
+      return {}, {}
+    self._log.info('Check result cache: %s of %s checks of job %s of docid '
+                   '%s are cached.', len(cached), len(order)
+                                   , self._job.jobid, self._job.docid)
+    cached = {key: dict(test_result, job_id=self._job.jobid, cached=True)
+                                  for key, test_result in cached.items()}
+    cache_ids = {key: cache_id for key, cache_id in cache_ids.items()
+                                                      if key not in cached}
+    return cache_ids, cached
 
   def _run(self, fonts):
+    # before 'fontBakeryVersion' is updated
+    order = self._get_remaining_order()
+    cache_ids, cached = self._get_cached_results(fonts, order)
+    order = [key for key in order if key not in cached]
     self._dbOps.update({
         'started': datetime.now(pytz.utc)
       # In an race condition, when updating the workers, fontbakery
@@ -402,22 +1307,51 @@ class Checker(WorkerBase):
       # different versions.
       , 'fontBakeryVersion': fontbakery.__version__
     })
-    runner, profile = get_fontbakery(fonts)
-    order = profile.deserialize_order(self._job.order)
-    reporter = DashbordWorkerReporter(self._dbOps, self._job.jobid,
-                                        profile=profile
-                                      , runner=runner
-                                      , ticks_to_flush=self._ticks_to_flush
-                                      , )
-    reporter.run(order)
-    # flush the rest
-    reporter.flush()
-    self._dbOps.update({'finished': datetime.now(pytz.utc)})
+    # The database is written in the background while the checks run.
+    dbOps = self._dbOps
+    if cache_ids:
+      dbOps = _CachingOperations(dbOps, self._result_cache, cache_ids
+                                                              , self._log)
+    writer = ResultsWriter(dbOps)
+    try:
+      if cached:
+        writer.insert_checks(cached)
+      reporter = self._run_checks(fonts, order, writer)
+      # flush the rest
+      reporter.flush()
+    except Exception:
+      # the original exception is more interesting than a write error
+      writer.close(reraise=False)
+      raise
+    # waits until all is written, raises if writing failed
+    writer.close()
+    self._record_check_durations(reporter.check_durations)
+    self._finish_job({
+        'finished': datetime.now(pytz.utc)
+        # seconds, where the time of this job went
+      , 'timing': {
+            'preparation': self._preparation_duration
+          , 'checks': reporter.checks_duration
+            # checks waiting for flushes
+          , 'flushes': reporter.flush_duration
+            # the background writes to the database
+          , 'writes': writer.write_duration
+        }
+    })
+
+  def _finish_job(self, doc):
+    self._finished_family = self._dbOps.finish_job(doc)
+    if self._finished_family:
+      self._log.info('Job %s was the last job of docid %s, the family '
+                     'is finished.', self._job.jobid, self._job.docid)
 
   def run(self):
     # save_preparation_logs = False => dbOps is None
     # self._with_tempdir = True => tmp_directory is not None
-    fonts = _prepare(self._job, self._cache, None, self._tmp_directory)
+    started = time.monotonic()
+    fonts = _prepare(self._job, self._cache, None, self._tmp_directory
+                   , self._file_cache)
+    self._preparation_duration = time.monotonic() - started
     self._log.debug('Files in Tempdir {}: {}'.format(
                       self._tmp_directory, os.listdir(self._tmp_directory)))
     # A checker-worker *MUST* write the correct 'finished' field for it's docid/jobid
@@ -434,9 +1368,9 @@ class Checker(WorkerBase):
       # write to the DB doc
       # if there is a jobid, this is reported in the job, otherwise it
       # is reported in the doc.
-      self._dbOps.update({'finished': datetime.now(pytz.utc)
-                        , 'exception': traceback
-                        })
+      self._finish_job({'finished': datetime.now(pytz.utc)
+                      , 'exception': traceback
+                      })
     # ALWAYS
     # For the time being just send a FamilyJob just like the
     # one that is self._job, but leave out the job.order, because that is
@@ -448,6 +1382,9 @@ class Checker(WorkerBase):
     job.ClearField('order')
     message = CompletedWorker()
     message.worker_name = 'fontbakery'
+    # only the message of the job that finished the family is forwarded
+    # by InitWorkers, there's exactly one.
+    message.finished_family = self._finished_family
     message.completed_message.Pack(job)
     self._queue.end(message)
     return True # exception (if any) handled
@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+from __future__ import print_function, division, unicode_literals
+
+import threading
+import logging
+from collections import defaultdict
+import grpc
+
+log = logging.getLogger('FB_WORKER')
+
+COMPRESSION = {
+    None: grpc.Compression.NoCompression
+  , 'none': grpc.Compression.NoCompression
+  , 'gzip': grpc.Compression.Gzip
+  , 'deflate': grpc.Compression.Deflate
+}
+
+
+class ByteCounters(object):
+  """
+  Bytes of the serialized messages per method. grpcio doesn't expose
+  the size of the (compressed) frames that actually go over the wire,
+  these are the sizes before compression, compare them to the network
+  metrics of the pod to see the effect of compression.
+  """
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._counters = defaultdict(lambda: dict(messages_sent=0, bytes_sent=0
+                                    , messages_received=0, bytes_received=0))
+
+  def add(self, method, direction, size):
+    with self._lock:
+      counters = self._counters[method]
+      counters['messages_{}'.format(direction)] += 1
+      counters['bytes_{}'.format(direction)] += size
+
+  def snapshot(self):
+    with self._lock:
+      return {method: dict(counters)
+                        for method, counters in self._counters.items()}
+
+
+def _counting_serializer(serializer, counters, method):
+  def serialize(message):
+    data = serializer(message) if serializer else message
+    counters.add(method, 'sent', len(data))
+    return data
+  return serialize
+
+
+def _counting_deserializer(deserializer, counters, method):
+  def deserialize(data):
+    counters.add(method, 'received', len(data))
+    return deserializer(data) if deserializer else data
+  return deserialize
+
+
+class CountingChannel(grpc.Channel):
+  """A grpc.Channel that counts the bytes of the messages of its calls."""
+  def __init__(self, channel, counters):
+    self._channel = channel
+    self.counters = counters
+
+  def _wrap(self, factory, method, request_serializer=None
+                                  , response_deserializer=None, **kwds):
+    return factory(method
+        , request_serializer=_counting_serializer(request_serializer
+                                                  , self.counters, method)
+        , response_deserializer=_counting_deserializer(response_deserializer
+                                                  , self.counters, method)
+        , **kwds)
+
+  def unary_unary(self, method, *args, **kwds):
+    return self._wrap(self._channel.unary_unary, method, *args, **kwds)
+
+  def unary_stream(self, method, *args, **kwds):
+    return self._wrap(self._channel.unary_stream, method, *args, **kwds)
+
+  def stream_unary(self, method, *args, **kwds):
+    return self._wrap(self._channel.stream_unary, method, *args, **kwds)
+
+  def stream_stream(self, method, *args, **kwds):
+    return self._wrap(self._channel.stream_stream, method, *args, **kwds)
+
+  def subscribe(self, callback, try_to_connect=False):
+    return self._channel.subscribe(callback, try_to_connect)
+
+  def unsubscribe(self, callback):
+    return self._channel.unsubscribe(callback)
+
+  def close(self):
+    return self._channel.close()
+
+
+class ChannelFactory(object):
+  """
+  Creates the grpc channels of the workers. All clients of the same
+  target share one channel (and hence one connection).
+
+  compression: None, 'none', 'gzip' or 'deflate'
+      Message compression of the calls of the channel. Font data
+      compresses well.
+  keepalive_time_ms: int or None
+      Interval of the keepalive pings, these keep idle connections
+      open and detect broken ones. The server must allow pings at that
+      interval, see StorageService in StorageServers.js.
+  """
+  def __init__(self, compression=None, keepalive_time_ms=None
+                   , keepalive_timeout_ms=20000
+                   , max_message_length=80 * 1024 * 1024):
+    if compression not in COMPRESSION:
+      raise ValueError('Unknown compression "{}", use one of: {}.'.format(
+            compression, ', '.join(filter(None, COMPRESSION))))
+    self._compression = COMPRESSION[compression]
+    self._options = [
+        ('grpc.max_send_message_length', max_message_length)
+      , ('grpc.max_receive_message_length', max_message_length)
+    ]
+    if keepalive_time_ms:
+      self._options += [
+          ('grpc.keepalive_time_ms', keepalive_time_ms)
+        , ('grpc.keepalive_timeout_ms', keepalive_timeout_ms)
+        , ('grpc.keepalive_permit_without_calls', 1)
+        , ('grpc.http2.max_pings_without_data', 0)
+      ]
+    self._lock = threading.Lock()
+    self._channels = {}
+    self.counters = ByteCounters()
+
+  def get(self, host, port):
+    target = '{}:{}'.format(host, port)
+    with self._lock:
+      channel = self._channels.get(target, None)
+      if channel is None:
+        log.debug('Creating grpc channel for %s.', target)
+        channel = CountingChannel(
+              grpc.insecure_channel(target, options=self._options
+                                  , compression=self._compression)
+            , self.counters)
+        self._channels[target] = channel
+      return channel
+
+  def close(self):
+    with self._lock:
+      for channel in self._channels.values():
+        channel.close()
+      self._channels.clear()
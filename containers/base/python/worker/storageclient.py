@@ -4,12 +4,21 @@ from __future__ import print_function, division, unicode_literals, absolute_impo
 import sys
 import logging
 import time
+import queue
+import random
+import hashlib
+import threading
+from functools import partial
+from contextlib import contextmanager
 from protocolbuffers import messages_pb2_grpc
 from protocolbuffers.messages_pb2 import (
                                           StorageItem
+                                        , StorageKey
+                                        , File
+                                        , FileChunk
                                         )
 from google.protobuf.any_pb2 import Any
-from collections import OrderedDict
+from collections import deque
 import grpc
 
 # currently unused
@@ -38,6 +47,14 @@ def unpack_any_generic(any, accepted_types):
 class RetriesExceeded(Exception):
   pass
 
+class CircuitOpen(Exception):
+  """The endpoint failed repeatedly, calls fail fast for a while."""
+  pass
+
+class MissingAnswers(Exception):
+  """The Put stream ended without answers for some of the messages."""
+  pass
+
 
 # Thanks @Bogdanp for this comment:
 # https://github.com/GoogleCloudPlatform/google-cloud-python/issues/2583#issuecomment-256026510
@@ -48,6 +65,31 @@ MAX_TRIES_BY_CODE = {
   , grpc.StatusCode.DEADLINE_EXCEEDED: 5
 }
 
+def _backoff_delay(error, tries):
+  """
+    Returns the seconds to wait until the next try after `error` in
+    try number `tries` or raises if `error` can't be retried (anymore).
+  """
+  code = error.code()
+  if code not in MAX_TRIES_BY_CODE:
+    raise error
+
+  # There's no better way than to check the details, see #56 and #59
+  if code == grpc.StatusCode.UNKNOWN and error.details() not in {'Stream removed'}:
+    raise error
+
+  if tries >= MAX_TRIES_BY_CODE[code]:
+    raise RetriesExceeded(error)
+
+  # retry in ...
+  backoff = 0.0625 * 2 ** tries # 0.125, 0.25, 0.5, 1.0
+  # jitter, so that the clients of a failing server don't all come
+  # back at the same moment
+  backoff *= random.uniform(0.5, 1.5)
+  logging.warning('Exception in try #{0} backing off for {1} seconds '
+                  'until retry. Error: {2}'.format(tries, backoff, error))
+  return backoff
+
 def backoff(f, *args, **kwds):
   tries = 0
   while True:
@@ -58,22 +100,188 @@ def backoff(f, *args, **kwds):
     # Expecting a _Rendezvous
     # https://github.com/grpc/grpc/tree/master/src/python/grpcio/grpc/_channel.py
     except grpc.RpcError as error:
-      code = error.code()
-      if code not in MAX_TRIES_BY_CODE:
-        raise error
+      time.sleep(_backoff_delay(error, tries))
+
+
+# Status codes that indicate a problem with the endpoint rather than
+# with the request.
+ENDPOINT_FAILURE_CODES = {
+    grpc.StatusCode.UNAVAILABLE
+  , grpc.StatusCode.DEADLINE_EXCEEDED
+}
+
+class CircuitBreaker(object):
+  """
+  After `max_failures` consecutive endpoint failures the circuit opens
+  and all calls fail immediately with CircuitOpen, instead of piling up
+  and waiting for their deadlines. Every `reset_timeout` seconds one
+  call is let through to probe the endpoint (half open), a success
+  closes the circuit.
+  """
+  def __init__(self, name, max_failures=5, reset_timeout=30):
+    self._name = name
+    self._max_failures = max_failures
+    self._reset_timeout = reset_timeout
+    self._lock = threading.Lock()
+    self._failures = 0
+    self._opened = None
+
+  def check(self):
+    with self._lock:
+      if self._opened is None:
+        return
+      now = time.monotonic()
+      if now - self._opened >= self._reset_timeout:
+        # probe, the next one is due after another reset_timeout
+        self._opened = now
+        return
+    raise CircuitOpen('Circuit for {} is open.'.format(self._name))
+
+  def success(self):
+    with self._lock:
+      self._failures = 0
+      self._opened = None
 
-      # There's no better way than to check the details, see #56 and #59
-      if code == grpc.StatusCode.UNKNOWN and error.details() not in {'Stream removed'}:
-        raise error
+  def failure(self, error):
+    if not isinstance(error, grpc.RpcError) \
+                        or error.code() not in ENDPOINT_FAILURE_CODES:
+      # not the fault of the endpoint
+      return
+    with self._lock:
+      self._failures += 1
+      if self._opened is not None or self._failures >= self._max_failures:
+        if self._opened is None:
+          logging.warning('Opening the circuit for %s after %s failures.'
+                                            , self._name, self._failures)
+        self._opened = time.monotonic()
 
-      if tries >= MAX_TRIES_BY_CODE[code]:
-        raise RetriesExceeded(error)
+_circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
+def get_circuit_breaker(target):
+  """One CircuitBreaker per endpoint, shared by all clients."""
+  with _circuit_breakers_lock:
+    if target not in _circuit_breakers:
+      _circuit_breakers[target] = CircuitBreaker(target)
+    return _circuit_breakers[target]
+
+
+class LatencyWindow(object):
+  """Latencies of the last `size` calls."""
+  def __init__(self, size=100, min_samples=20):
+    self._latencies = deque(maxlen=size)
+    self._min_samples = min_samples
+    self._lock = threading.Lock()
+
+  def add(self, latency):
+    with self._lock:
+      self._latencies.append(latency)
+
+  def percentile(self, percentile):
+    """None if there are not enough samples yet."""
+    with self._lock:
+      if len(self._latencies) < self._min_samples:
+        return None
+      latencies = sorted(self._latencies)
+    index = min(len(latencies) - 1, int(len(latencies) * percentile / 100))
+    return latencies[index]
+
+
+class IdleTimeoutExceeded(grpc.RpcError):
+  """A streaming call was cancelled by IdleTimeout."""
+  def __init__(self, timeout):
+    super(IdleTimeoutExceeded, self).__init__(
+                          'No message for {} seconds.'.format(timeout))
+
+  def code(self):
+    # retried and counted by the circuit breaker like a deadline
+    return grpc.StatusCode.DEADLINE_EXCEEDED
+
+  def details(self):
+    return self.args[0]
+
+
+class IdleTimeout(object):
+  """
+  Cancels a streaming call when no message was sent or received for
+  `timeout` seconds. Unlike a deadline for the whole call, this doesn't
+  depend on the size of the transfer. While `paused`, e.g. while the
+  consumer of the call is busy, the time doesn't count. A `timeout` of
+  None disables it.
+  """
+  def __init__(self, timeout):
+    self._timeout = timeout
+    self._lock = threading.Lock()
+    self._last = time.monotonic()
+    self._paused = 0
+    self._timer = None
+    self._stopped = False
+    self.expired = False
+
+  def start(self, call):
+    """`call` is a grpc call or future, anything with `cancel()`."""
+    self._call = call
+    self.touch()
+    if self._timeout is not None:
+      self._schedule(self._timeout)
+
+  def _schedule(self, delay):
+    self._timer = threading.Timer(delay, self._check)
+    self._timer.daemon = True
+    self._timer.start()
+
+  def _check(self):
+    with self._lock:
+      if self._stopped:
+        return
+      idle = time.monotonic() - self._last
+      if self._paused or idle < self._timeout:
+        self._schedule(self._timeout - idle if not self._paused
+                                            else self._timeout)
+        return
+      self.expired = True
+    logging.warning('Cancelling a call without messages for %s seconds.'
+                                                          , self._timeout)
+    self._call.cancel()
+
+  def touch(self):
+    """A message was sent or received."""
+    self._last = time.monotonic()
+
+  @contextmanager
+  def paused(self):
+    with self._lock:
+      self._paused += 1
+    try:
+      yield
+    finally:
+      with self._lock:
+        self._paused -= 1
+        self._last = time.monotonic()
 
-      # retry in ...
-      backoff = 0.0625 * 2 ** tries # 0.125, 0.25, 0.5, 1.0
-      logging.warning('Exception in try #{0} backing off for {1} seconds '
-                      'until retry. Error: {2}'.format(tries, backoff, error))
-      time.sleep(backoff)
+  def stop(self):
+    with self._lock:
+      self._stopped = True
+      if self._timer is not None:
+        self._timer.cancel()
+
+  def error(self, error):
+    """The error to raise instead of the CANCELLED `error` of the call."""
+    return IdleTimeoutExceeded(self._timeout) if self.expired else error
+
+
+# In seconds, per operation. None: no deadline. The streaming
+# operations, get_files, put and put_files, run as long as data is
+# transferred, with an IdleTimeout of `idle_timeout` instead of a
+# deadline, because they take as long as the data is big.
+DEFAULT_DEADLINES = {
+    'get': 60
+  , 'get_files_meta': 20
+  , 'get_files': None
+  , 'put': None
+  , 'put_files': None
+  , 'put_existing': 20
+}
+DEFAULT_IDLE_TIMEOUT = 60
 
 class StorageClient(object):
   """
@@ -89,33 +297,261 @@ class StorageClient(object):
   print('[GET] result:', result)
 
   """
-  def __init__(self, host, port, ExpectedGetType):
-    self._channel = grpc.insecure_channel('{}:{}'.format(host, port)
-          , options=[
-              ('grpc.max_send_message_length', 80 * 1024 * 1024)
-            , ('grpc.max_receive_message_length', 80 * 1024 * 1024)
-          ]
-    )
+  def __init__(self, host, port, ExpectedGetType, channel_factory=None
+                                        , deadlines=None, hedge_percentile=None
+                                        , idle_timeout=DEFAULT_IDLE_TIMEOUT):
+    """
+      deadlines: dict
+          Seconds per operation, updates DEFAULT_DEADLINES.
+      idle_timeout: number or None
+          Seconds without a message after which a streaming operation
+          fails, see IdleTimeout.
+      hedge_percentile: number or None
+          If set, `get` and `get_files_meta` send a second request when
+          the first didn't answer within that percentile of the recent
+          latencies of the operation, the first answer wins. Costs about
+          (100 - hedge_percentile) percent more requests, cuts the tail
+          latency.
+    """
+    if channel_factory is not None:
+      # shared with the other clients for host:port
+      self._channel = channel_factory.get(host, port)
+    else:
+      self._channel = grpc.insecure_channel('{}:{}'.format(host, port)
+            , options=[
+                ('grpc.max_send_message_length', 80 * 1024 * 1024)
+              , ('grpc.max_receive_message_length', 80 * 1024 * 1024)
+            ]
+      )
     self._client = messages_pb2_grpc.StorageStub(self._channel)
     self.ExpectedGetType = ExpectedGetType
+    self._deadlines = dict(DEFAULT_DEADLINES, **(deadlines or {}))
+    self._idle_timeout = idle_timeout
+    self._breaker = get_circuit_breaker('{}:{}'.format(host, port))
+    self._hedge_percentile = hedge_percentile
+    # see _hedged
+    self._latencies = {operation: LatencyWindow()
+                            for operation in ('get', 'get_files_meta')}
+
+  def _guarded(self, f, *args, **kwds):
+    """Call f through the circuit breaker."""
+    self._breaker.check()
+    try:
+      result = f(*args, **kwds)
+    except Exception as error:
+      self._breaker.failure(error)
+      raise
+    self._breaker.success()
+    return result
+
+  def _call(self, operation, f, request):
+    return backoff(self._guarded, f, request
+                                , timeout=self._deadlines[operation])
+
+  def _hedged(self, operation, method, request, timeout):
+    """
+    Call the unary `method`, send the request a second time if the first
+    didn't answer within the `hedge_percentile` of the recent latencies
+    of `operation`, the first answer wins.
+    """
+    latencies = self._latencies[operation]
+    threshold = latencies.percentile(self._hedge_percentile)
+    done = threading.Event()
+    pending = []
+    def call():
+      started = time.monotonic()
+      future = method.future(request, timeout=timeout)
+      def on_done(future):
+        if not future.cancelled() and future.exception() is None:
+          # Every completed request, not only the winners, these would
+          # bias the percentile towards the fast requests.
+          latencies.add(time.monotonic() - started)
+        done.set()
+      future.add_done_callback(on_done)
+      pending.append(future)
+      return future
+
+    first = call()
+    if threshold is not None and not done.wait(threshold):
+      logging.debug('Hedging %s of %s after %s seconds.', operation
+                                            , request.key, threshold)
+      call()
+    error = None
+    while pending:
+      done.wait()
+      done.clear()
+      for future in [future for future in pending if future.done()]:
+        pending.remove(future)
+        try:
+          result = future.result()
+        except grpc.RpcError as e:
+          error = e
+          continue
+        for other in pending:
+          # The first request completes, for its latency, the hedge
+          # is not needed anymore.
+          if other is not first:
+            other.cancel()
+        return result
+    raise error
+
+  def _unary(self, operation, method, request):
+    if self._hedge_percentile is not None:
+      method = partial(self._hedged, operation, method)
+    return self._call(operation, method, request)
 
   def get(self, storageKey):
-    any = backoff(self._client.Get, storageKey);
+    any = self._unary('get', self._client.Get, storageKey)
     return unpack_any(any, self.ExpectedGetType)
 
-  def put (self, messages, ensure_answers_in_order=True):
+  def get_files_meta(self, storageKey):
+    """
+      For a stored `Files` message, returns a `FilesMeta` message:
+      only the names and sizes of the files, without their data.
+    """
+    return self._unary('get_files_meta', self._client.GetFilesMeta
+                                                            , storageKey)
+
+  def get_files(self, storageKey):
+    """
+      For a stored `Files` message, yields its `File` messages one after
+      the other. The server streams the files in chunks, only the file
+      that is currently received is held in memory, and the size of
+      `Files` is not limited by the max message length of the channel.
+
+      If the stream breaks it is requested again, the files that were
+      already yielded are skipped.
+    """
+    tries = 0
+    yielded = 0
+    while True:
+      tries += 1
+      received = 0
+      name, chunks = None, []
+      self._breaker.check()
+      idle_timeout = IdleTimeout(self._idle_timeout)
+      try:
+        call = self._client.GetFilesStream(storageKey
+                                  , timeout=self._deadlines['get_files'])
+        idle_timeout.start(call)
+        for chunk in call:
+          idle_timeout.touch()
+          if chunk.name:
+            if name is not None:
+              received += 1
+              if received > yielded:
+                with idle_timeout.paused():
+                  yield File(name=name, data=b''.join(chunks))
+                yielded += 1
+            name, chunks = chunk.name, []
+          if received >= yielded:
+            chunks.append(chunk.data)
+        if name is not None and received + 1 > yielded:
+          with idle_timeout.paused():
+            yield File(name=name, data=b''.join(chunks))
+        self._breaker.success()
+        return
+      except grpc.RpcError as error:
+        error = idle_timeout.error(error)
+        self._breaker.failure(error)
+        time.sleep(_backoff_delay(error, tries))
+      finally:
+        idle_timeout.stop()
+
+  def put_files(self, files, chunk_size=1024 * 1024):
+    """
+      Counterpart of `get_files`: stores the `File` messages of the
+      iterable `files` as one `Files` message, streamed in chunks of at
+      most `chunk_size` bytes. Returns the `StorageKey`, which can be
+      used with `get` as well.
+
+      This is not retried, `files` can't be consumed twice.
+    """
+    idle_timeout = IdleTimeout(self._idle_timeout)
+    def make_chunks():
+      files_iter = iter(files)
+      while True:
+        try:
+          with idle_timeout.paused():
+            jobFile = next(files_iter)
+        except StopIteration:
+          return
+        data = memoryview(jobFile.data)
+        offset = 0
+        while True:
+          chunk = FileChunk(data=data[offset:offset+chunk_size].tobytes())
+          if offset == 0:
+            chunk.name = jobFile.name
+          # grpc takes the next chunk when it can send it
+          idle_timeout.touch()
+          yield chunk
+          offset += chunk_size
+          if offset >= len(data):
+            break
+
+    def put_files_stream(chunks):
+      future = self._client.PutFilesStream.future(chunks
+                                  , timeout=self._deadlines['put_files'])
+      idle_timeout.start(future)
+      try:
+        return future.result()
+      except grpc.RpcError as error:
+        raise idle_timeout.error(error)
+      finally:
+        idle_timeout.stop()
+    return self._guarded(put_files_stream, make_chunks())
+
+  def put_existing(self, storage_item):
+    """
+      If the payload of `storage_item` is already stored, returns a new
+      `StorageKey` for it, without sending the payload, otherwise None.
+    """
+    # Same as the hash created by the StorageService.
+    digest = hashlib.sha256(storage_item.payload.SerializeToString()).hexdigest()
+    storageKey = self._call('put_existing', self._client.PutExisting
+                          , StorageKey(hash=digest
+                                     , clientid=storage_item.clientid))
+    return storageKey if storageKey.key else None
+
+  def put (self, messages, ensure_answers_in_order=True, window=16
+                                                      , dedup=False):
     """
       ensure_answers_in_order: bool, default True
           Using this to make sure we answer in the same order as we PUT.
-          Could be done otherwise more memory efficient in some cases.
           However, user expectation are probably to get the answers in the
           same order as the messages and it would lead to subtle bugs
           otherwise. If ensure_answers_in_order is False the order of
           answers is not guaranteed to be the same order as messages,
           depending purely on the server implementation.
+          Answers are yielded as soon as all answers for the messages
+          before them are received.
+
+      window: int, default 16
+          Max number of messages that are sent but not yet answered by
+          the server. When the window is full, `messages` is not
+          consumed until answers arrive, hence with a generator for
+          `messages` only about `window` messages are in memory at any
+          time. None means no limit.
+          If the stream ends before all messages are answered,
+          MissingAnswers is raised.
+
+      dedup: bool, default False
+          Ask the server via `put_existing` before sending a message,
+          messages that are already stored are not sent again. Costs a
+          round trip per message, use it when many messages are
+          expected to be stored already.
     """
-    if ensure_answers_in_order:
-      result = OrderedDict()
+    window_slots = threading.Semaphore(window) if window else None
+    closed = threading.Event()
+    # StorageKeys from the server and from put_existing, then END or
+    # an exception.
+    answers = queue.Queue()
+    END = object()
+    producer_errors = []
+    # messages taken from `messages`, all of them need an answer
+    sent = 0
+    idle_timeout = IdleTimeout(self._idle_timeout)
+
     def make_storage_item(message, clientid):
       storage_item = StorageItem()
       any_message = Any()
@@ -123,22 +559,108 @@ class StorageClient(object):
       storage_item.payload.CopyFrom(any_message)
       if clientid is not None:
         storage_item.clientid = clientid
-      if ensure_answers_in_order:
-        result[clientid] = None
       return storage_item
 
-    storage_items = (make_storage_item(message, str(index))\
-                              for index, message in enumerate(messages))
+    def make_storage_items():
+      # Consumed by a thread of grpc.
+      nonlocal sent
+      messages_iter = iter(messages)
+      try:
+        while True:
+          # wait for a slot before even creating the next message
+          if window_slots is not None:
+            window_slots.acquire()
+          if closed.is_set():
+            return
+          try:
+            with idle_timeout.paused():
+              message = next(messages_iter)
+          except StopIteration:
+            return
+          storage_item = make_storage_item(message, str(sent))
+          sent += 1
+          if dedup:
+            storageKey = self.put_existing(storage_item)
+            if storageKey is not None:
+              # The server ends the Put stream after this generator
+              # ended, so this is always before END.
+              answers.put(storageKey)
+              if window_slots is not None:
+                window_slots.release()
+              continue
+          # grpc takes the next item when it can send it
+          idle_timeout.touch()
+          yield storage_item
+      except Exception as error:
+        # grpc only reports that the call was cancelled
+        producer_errors.append(error)
+        raise
+
+    self._breaker.check()
+    responses = self._client.Put(make_storage_items()
+                               , timeout=self._deadlines['put'])
+    idle_timeout.start(responses)
 
-    for storageKey in self._client.Put(storage_items):
-      if ensure_answers_in_order:
-        result[storageKey.clientid] = storageKey
-      else:
-        yield storageKey
+    def read_responses():
+      try:
+        for storageKey in responses:
+          idle_timeout.touch()
+          answers.put(storageKey)
+          # An answer that is held back for the order or not yet
+          # consumed doesn't block sending, only a missing answer would.
+          if window_slots is not None:
+            window_slots.release()
+        self._breaker.success()
+        answers.put(END)
+      except grpc.RpcError as error:
+        error = idle_timeout.error(error)
+        self._breaker.failure(error)
+        answers.put(error)
+      except Exception as error:
+        self._breaker.failure(error)
+        answers.put(error)
 
-    if ensure_answers_in_order:
-      for storageKey in result.values():
-        yield storageKey
+    reader = threading.Thread(target=read_responses, daemon=True)
+    reader.start()
+
+    # clientid => StorageKey, only answers that came early
+    early = {}
+    next_index = 0
+    received = 0
+    try:
+      while True:
+        storageKey = answers.get()
+        if storageKey is END:
+          # The server ended the stream after the producer ended, `sent`
+          # is final.
+          if received < sent or early:
+            raise MissingAnswers('The Put stream ended with {} answers '
+                          'for {} messages{}.'.format(received, sent
+                          , ', no answer for message {}'.format(next_index)
+                                                        if early else ''))
+          break
+        if isinstance(storageKey, Exception):
+          if producer_errors:
+            raise producer_errors[0] from storageKey
+          raise storageKey
+        received += 1
+        if not ensure_answers_in_order:
+          with idle_timeout.paused():
+            yield storageKey
+          continue
+        early[storageKey.clientid] = storageKey
+        while str(next_index) in early:
+          with idle_timeout.paused():
+            yield early.pop(str(next_index))
+          next_index += 1
+    finally:
+      idle_timeout.stop()
+      # If the consumer stopped early make sure the producer thread
+      # doesn't stay blocked.
+      closed.set()
+      if window_slots is not None:
+        window_slots.release()
+      responses.cancel()
 
 
 # Used for ad-hoc testing only!
@@ -0,0 +1,451 @@
+#!/usr/bin/env python
+"""
+A Python implementation of the Storage service (see messages.proto and
+javascript/node/util/StorageServers.js, which is the implementation
+that runs in the cluster). It is a stand-in to run and profile the
+workers on one machine, e.g.:
+
+containers/base/python$ python -c 'from worker.storageserver import main;main()' --port 3456
+containers/base/python$ python -c 'from worker.storageserver import main;main()' --port 3456 --data-dir /tmp/persistence
+
+Without --data-dir the data is kept in memory, like the CacheServer,
+with --data-dir it's written to disk, like the PersistenceServer. The
+keys are compatible with the node implementation.
+
+There's no garbage collection of unused data items.
+"""
+from __future__ import print_function, division, unicode_literals
+
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+import logging
+import argparse
+import threading
+from concurrent import futures
+from collections import defaultdict
+from functools import wraps
+
+import grpc
+from google.protobuf.any_pb2 import Any
+
+from protocolbuffers import messages_pb2_grpc
+from protocolbuffers.messages_pb2 import (
+                                          StorageKey
+                                        , StorageStatus
+                                        , Files
+                                        , File
+                                        , FileMeta
+                                        , FilesMeta
+                                        , FileChunk
+                                        )
+
+log = logging.getLogger('FB_STORAGE')
+
+KEY_LENGTH = 64 # sha256 hexdigest
+_KEY_RE = re.compile(r'^[a-f0-9]+$')
+CHUNK_SIZE = 1024 * 1024
+
+
+class NotFound(Exception):
+  pass
+
+
+class DataItem(object):
+  def __init__(self, data=None, reads=0, counter=0, instance_keys=()):
+    # not all implementations store the data here
+    self.data = data
+    self.reads = reads
+    self.counter = counter
+    self.instance_keys = set(instance_keys)
+
+  def create_instance_key(self):
+    instance_key = '{:x}'.format(self.counter)
+    self.counter += 1
+    self.instance_keys.add(instance_key)
+    return instance_key
+
+  def destroy_instance_key(self, instance_key):
+    self.instance_keys.discard(instance_key)
+    return len(self.instance_keys)
+
+  def has_instance(self, instance_key):
+    return instance_key in self.instance_keys
+
+  def serialize(self):
+    return dict(reads=self.reads, counter=self.counter
+              , instanceKeys=sorted(self.instance_keys))
+
+  @classmethod
+  def load(cls, data):
+    return cls(reads=data['reads'], counter=data['counter']
+             , instance_keys=data['instanceKeys'])
+
+
+class MemoryStore(object):
+  """The data (serialized google.protobuf.Any messages) in memory."""
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._items = {}
+
+  def _get_item(self, key):
+    return self._items.get(key, None)
+
+  def _store_data(self, key, item, data):
+    item.data = data
+
+  def _load_data(self, key, item):
+    return item.data
+
+  def _save_item(self, key, item):
+    pass
+
+  def _delete_item(self, key):
+    del self._items[key]
+
+  def has(self, key, instance_key=None):
+    with self._lock:
+      item = self._get_item(key)
+      if item is None:
+        return False
+      return item.has_instance(instance_key) if instance_key else True
+
+  def set(self, key, data):
+    """Returns a new instance key for key."""
+    with self._lock:
+      item = self._get_item(key)
+      if item is None:
+        item = DataItem()
+        self._store_data(key, item, data)
+        self._items[key] = item
+      instance_key = item.create_instance_key()
+      self._save_item(key, item)
+      return instance_key
+
+  def add_instance(self, key):
+    """Returns a new instance key if there's data for key, else None."""
+    with self._lock:
+      item = self._get_item(key)
+      if item is None:
+        return None
+      instance_key = item.create_instance_key()
+      self._save_item(key, item)
+      return instance_key
+
+  def get(self, key, instance_key=None):
+    with self._lock:
+      item = self._get_item(key)
+      if item is None or (instance_key and not item.has_instance(instance_key)):
+        raise NotFound('Can\'t find key: {}{}'.format(key
+                          , ':' + instance_key if instance_key else ''))
+      item.reads += 1
+      self._save_item(key, item)
+      return self._load_data(key, item)
+
+  def delete(self, key, instance_key, force):
+    """Returns the number of instances that are left."""
+    with self._lock:
+      item = self._get_item(key)
+      if item is None:
+        return 0
+      instances = item.destroy_instance_key(instance_key)
+      if not force and instances != 0:
+        self._save_item(key, item)
+        return instances
+      self._delete_item(key)
+      return 0
+
+
+class FileSystemStore(MemoryStore):
+  """
+  Same layout as FileSystemStore in StorageServers.js:
+  data_dir/key[0:4]/key[4:8]/key[8:12]/key[12:]/{data,meta.json}
+  """
+  METADATA_FILENAME = 'meta.json'
+  DATA_FILENAME = 'data'
+
+  def __init__(self, data_dir):
+    super().__init__()
+    self._data_dir = data_dir
+
+  def _path(self, key, *parts):
+    return os.path.join(self._data_dir, key[0:4], key[4:8], key[8:12]
+                                                      , key[12:], *parts)
+
+  def _get_item(self, key):
+    item = self._items.get(key, None)
+    if item is None:
+      try:
+        with open(self._path(key, self.METADATA_FILENAME)) as f:
+          item = DataItem.load(json.load(f))
+      except FileNotFoundError:
+        return None
+      self._items[key] = item
+    return item
+
+  def _store_data(self, key, item, data):
+    os.makedirs(self._path(key), exist_ok=True)
+    with open(self._path(key, self.DATA_FILENAME), 'wb') as f:
+      f.write(data)
+
+  def _load_data(self, key, item):
+    with open(self._path(key, self.DATA_FILENAME), 'rb') as f:
+      return f.read()
+
+  def _save_item(self, key, item):
+    with open(self._path(key, self.METADATA_FILENAME), 'w') as f:
+      json.dump(item.serialize(), f)
+
+  def _delete_item(self, key):
+    super()._delete_item(key)
+    shutil.rmtree(self._path(key), ignore_errors=True)
+
+
+class Counters(object):
+  """Calls, errors, bytes and latency per method."""
+  def __init__(self):
+    self._lock = threading.Lock()
+    self._started = time.monotonic()
+    self._counters = defaultdict(lambda: dict(calls=0, errors=0
+                          , bytes_received=0, bytes_sent=0, seconds=0))
+
+  def add(self, method, seconds, bytes_received, bytes_sent, error):
+    with self._lock:
+      counters = self._counters[method]
+      counters['calls'] += 1
+      counters['errors'] += 1 if error else 0
+      counters['bytes_received'] += bytes_received
+      counters['bytes_sent'] += bytes_sent
+      counters['seconds'] += seconds
+
+  def snapshot(self):
+    with self._lock:
+      elapsed = time.monotonic() - self._started
+      result = {}
+      for method, counters in self._counters.items():
+        counters = dict(counters)
+        calls = counters['calls']
+        counters['mean_latency'] = counters['seconds'] / calls if calls else 0
+        counters['throughput'] = (counters['bytes_received']
+                                + counters['bytes_sent']) / elapsed
+        result[method] = counters
+      return result
+
+
+def _measured(method):
+  """
+  Counts a call of a unary-unary or stream-unary method. For response
+  streams, see `_measured_stream`.
+  """
+  @wraps(method)
+  def wrapper(self, request, context):
+    started = time.monotonic()
+    size = [0]
+    def count(message):
+      size[0] += message.ByteSize()
+      return message
+    if not hasattr(request, 'ByteSize'):
+      # a request iterator
+      request = map(count, request)
+    else:
+      count(request)
+    response, error = None, None
+    try:
+      response = method(self, request, context)
+      return response
+    except Exception as e:
+      error = e
+      raise
+    finally:
+      self.counters.add(method.__name__, time.monotonic() - started
+                      , size[0], response.ByteSize() if response else 0
+                      , error)
+  return wrapper
+
+
+def _measured_stream(method):
+  @wraps(method)
+  def wrapper(self, request, context):
+    started = time.monotonic()
+    size = [0]
+    def count(message):
+      size[0] += message.ByteSize()
+      return message
+    if not hasattr(request, 'ByteSize'):
+      request = map(count, request)
+      received = size
+    else:
+      received = [request.ByteSize()]
+    sent, error = 0, None
+    try:
+      for response in method(self, request, context):
+        sent += response.ByteSize()
+        yield response
+    except Exception as e:
+      error = e
+      raise
+    finally:
+      self.counters.add(method.__name__, time.monotonic() - started
+                      , received[0], sent, error)
+  return wrapper
+
+
+def _check_key(key):
+  if len(key) != KEY_LENGTH or not _KEY_RE.match(key):
+    return False
+  return True
+
+
+def _hash(data):
+  return hashlib.sha256(data).hexdigest()
+
+
+def _make_storage_key(hash, instance_key, clientid=None):
+  storage_key = StorageKey(key='{}:{}'.format(hash, instance_key), hash=hash)
+  if clientid:
+    storage_key.clientid = clientid
+  return storage_key
+
+
+class StorageServicer(messages_pb2_grpc.StorageServicer):
+  def __init__(self, store):
+    self._store = store
+    self.counters = Counters()
+
+  def _get_any(self, storage_key, context):
+    key, _, instance_key = storage_key.key.partition(':')
+    if not _check_key(key):
+      context.abort(grpc.StatusCode.NOT_FOUND, 'Key is not valid.')
+    try:
+      data = self._store.get(key, instance_key)
+    except NotFound as error:
+      context.abort(grpc.StatusCode.NOT_FOUND, str(error))
+    return Any.FromString(data)
+
+  def _get_files(self, storage_key, context):
+    files = Files()
+    if not self._get_any(storage_key, context).Unpack(files):
+      context.abort(grpc.StatusCode.INVALID_ARGUMENT
+                  , 'Stored message is not a fontbakery.dashboard.Files.')
+    return files
+
+  def _set_any(self, any_message):
+    data = any_message.SerializeToString()
+    hash = _hash(data)
+    return hash, self._store.set(hash, data)
+
+  @_measured_stream
+  def Put(self, request_iterator, context):
+    for storage_item in request_iterator:
+      hash, instance_key = self._set_any(storage_item.payload)
+      yield _make_storage_key(hash, instance_key, storage_item.clientid)
+
+  @_measured
+  def Get(self, request, context):
+    return self._get_any(request, context)
+
+  @_measured
+  def Purge(self, request, context):
+    key, _, instance_key = request.key.partition(':')
+    instances = 0
+    if _check_key(key):
+      instances = self._store.delete(key, instance_key, request.force)
+    return StorageStatus(key=key, instances=instances)
+
+  @_measured
+  def GetFilesMeta(self, request, context):
+    files = self._get_files(request, context)
+    return FilesMeta(files=[FileMeta(name=f.name, size=len(f.data))
+                                                  for f in files.files])
+
+  @_measured_stream
+  def GetFilesStream(self, request, context):
+    files = self._get_files(request, context)
+    for f in files.files:
+      offset = 0
+      while True:
+        chunk = FileChunk(data=f.data[offset:offset+CHUNK_SIZE])
+        if offset == 0:
+          chunk.name = f.name
+        yield chunk
+        offset += CHUNK_SIZE
+        if offset >= len(f.data):
+          break
+
+  @_measured
+  def PutFilesStream(self, request_iterator, context):
+    files = Files()
+    current = None
+    chunks = []
+    for chunk in request_iterator:
+      if chunk.name:
+        if current is not None:
+          files.files.append(File(name=current, data=b''.join(chunks)))
+        current, chunks = chunk.name, []
+      elif current is None:
+        context.abort(grpc.StatusCode.INVALID_ARGUMENT
+                    , 'The first FileChunk must have a name.')
+      chunks.append(chunk.data)
+    if current is not None:
+      files.files.append(File(name=current, data=b''.join(chunks)))
+    any_message = Any()
+    any_message.Pack(files)
+    hash, instance_key = self._set_any(any_message)
+    return _make_storage_key(hash, instance_key)
+
+  @_measured
+  def PutExisting(self, request, context):
+    answer = StorageKey(clientid=request.clientid)
+    if _check_key(request.hash):
+      instance_key = self._store.add_instance(request.hash)
+      if instance_key is not None:
+        answer = _make_storage_key(request.hash, instance_key
+                                 , request.clientid)
+    return answer
+
+
+def serve(port, data_dir=None, max_workers=16):
+  """Returns (server, servicer), the server is started."""
+  store = FileSystemStore(data_dir) if data_dir else MemoryStore()
+  servicer = StorageServicer(store)
+  server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers)
+          , options=[
+              ('grpc.max_send_message_length', 80 * 1024 * 1024)
+            , ('grpc.max_receive_message_length', 80 * 1024 * 1024)
+            , ('grpc.keepalive_permit_without_calls', 1)
+            , ('grpc.http2.min_ping_interval_without_data_ms', 30000)
+            , ('grpc.http2.max_pings_without_data', 0)
+          ])
+  messages_pb2_grpc.add_StorageServicer_to_server(servicer, server)
+  server.add_insecure_port('[::]:{}'.format(port))
+  server.start()
+  return server, servicer
+
+
+def main(args=None):
+  parser = argparse.ArgumentParser(description='Storage service stand-in.')
+  parser.add_argument('-p', '--port', type=int, default=50051)
+  parser.add_argument('--data-dir', default=None
+                    , help='Store on disk, default is in memory.')
+  parser.add_argument('--stats-interval', type=float, default=60
+                    , help='Seconds between the counter logs, 0 disables.')
+  options = parser.parse_args(args)
+  logging.basicConfig(level=logging.INFO)
+
+  server, servicer = serve(options.port, options.data_dir)
+  log.info('Storage service on port %s, %s.', options.port
+                    , 'data in ' + options.data_dir if options.data_dir
+                                                    else 'data in memory')
+  try:
+    while True:
+      if options.stats_interval > 0:
+        time.sleep(options.stats_interval)
+        log.info('counters: %s', servicer.counters.snapshot())
+      else:
+        server.wait_for_termination()
+  except KeyboardInterrupt:
+    server.stop(None)
+  log.info('counters: %s', servicer.counters.snapshot())
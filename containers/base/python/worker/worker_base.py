@@ -1,6 +1,55 @@
 #!/usr/bin/env python
 from __future__ import print_function, division, unicode_literals
 
+import grpc
+from rethinkdb.errors import (
+                               ReqlDriverError
+                             , ReqlAvailabilityError
+                             , ReqlCompileError
+                             , ReqlAuthError
+                             )
+from .storageclient import (
+                             RetriesExceeded
+                           , CircuitOpen
+                           , ENDPOINT_FAILURE_CODES
+                           )
+
+# Failures of the infrastructure, not of the job. Another try later
+# can succeed.
+TRANSIENT_ERRORS = (
+    RetriesExceeded
+  , CircuitOpen
+    # connection lost, timeouts
+  , ReqlDriverError
+    # e.g. no primary replica
+  , ReqlAvailabilityError
+)
+# Retrying can't help, e.g. a bug in a query (ReqlDriverCompileError) or
+# wrong credentials. Checked before TRANSIENT_ERRORS, some drivers
+# derive these from ReqlDriverError.
+NOT_TRANSIENT_ERRORS = (
+    ReqlCompileError
+  , ReqlAuthError
+)
+
+def is_transient_error(error):
+  """
+  True if `error`, or an error it was raised from, is a failure of the
+  infrastructure, i.e. the database or the storage services were not
+  reachable. These are not recorded as the result of a job, the job is
+  queued again by worker-launcher, see `Retries` there.
+  """
+  while error is not None:
+    if isinstance(error, NOT_TRANSIENT_ERRORS):
+      return False
+    if isinstance(error, TRANSIENT_ERRORS):
+      return True
+    if isinstance(error, grpc.RpcError) and hasattr(error, 'code') \
+                              and error.code() in ENDPOINT_FAILURE_CODES:
+      return True
+    # only explicit chaining: `raise WorkerError(...) from error`
+    error = error.__cause__
+  return False
 
 
 class WorkerError(Exception):
@@ -15,6 +64,12 @@ class WorkerBase:
   this is done.
   """
 
+  # Set by worker-launcher: True if a transient error (see
+  # `is_transient_error`) raised by `run` or `finalize` makes the job
+  # queue again. Otherwise this is the last try and `finalize` must
+  # report the job as finished, even for transient errors.
+  retry_transient = False
+
   def JobType():
     """JobType is expected to be a protocol buffers message constructor"""
     raise NotImplementedError('`JobType` method must be set as class '
@@ -24,6 +79,16 @@ class WorkerBase:
     """Run the job, exceptions will be caught and passed to`finalize`."""
     raise NotImplementedError('`run` method must be implemented by sub-class.');
 
+  @classmethod
+  def warm_up(cls, font_path, resources):
+    """Optional, called by worker-launcher before it consumes jobs, to do
+    the expensive things the first job would do otherwise, e.g. imports,
+    setting up caches and the first parse of a font. `font_path` is a
+    bundled font file, no other I/O must be done here. `resources` are
+    the static resources that exist before the connections are made,
+    e.g. `checker_pool`.
+    """
+    pass
 
 
   def finalize(self, tb_str, *exc):